@@ -0,0 +1,74 @@
+"""Concurrency admission control for expensive API operations."""
+
+import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Cap the number of operations running at once.
+
+    Unlike ``asyncio.Semaphore``, the limit can be changed at runtime: waiters
+    re-check it whenever a slot is released or the limit is resized.
+
+    Usage::
+
+        async with controller:
+            await run_query()
+    """
+
+    def __init__(self, max_concurrent: int):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        # Created on first use so it binds to the serving event loop (Python < 3.10)
+        self._condition_obj: Optional[asyncio.Condition] = None
+
+    @property
+    def _condition(self) -> asyncio.Condition:
+        if self._condition_obj is None:
+            self._condition_obj = asyncio.Condition()
+        return self._condition_obj
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._max_concurrent)
+            self._active += 1
+
+    async def release(self) -> None:
+        # The slot is returned before any await, so a release cancelled while
+        # waiting for the lock (e.g. client disconnect) cannot leak it; the
+        # wake-up is shielded so the next waiter is still notified.
+        self._active -= 1
+        await asyncio.shield(self._notify_one())
+
+    async def _notify_one(self) -> None:
+        async with self._condition:
+            self._condition.notify(1)
+
+    async def resize(self, max_concurrent: int) -> None:
+        """Change the limit; raising it wakes waiters immediately."""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        async with self._condition:
+            self._max_concurrent = max_concurrent
+            self._condition.notify_all()
+        logger.info("Admission limit set to %s", max_concurrent)
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
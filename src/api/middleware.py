@@ -2,6 +2,7 @@
 
 import os
 import logging
+from typing import List, Optional
 
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -13,11 +14,33 @@ from core.config import HTTPConfig, AppConfig
 
 logger = logging.getLogger(__name__)
 
+
+def create_limiter(
+    http_config: HTTPConfig, default_limits: Optional[List[str]] = None
+) -> Limiter:
+    """Create a rate limiter backed by the configured counter storage.
+
+    With a shared storage such as Redis, every worker and replica enforces the
+    same limit; if that storage is unreachable, counting falls back to memory.
+    """
+    shared_storage = not http_config.rate_limit_storage_uri.startswith("memory://")
+    return Limiter(
+        key_func=get_remote_address,
+        default_limits=default_limits or [],
+        storage_uri=http_config.rate_limit_storage_uri,
+        strategy=http_config.rate_limit_strategy,
+        in_memory_fallback_enabled=shared_storage,
+    )
+
+
 # Create rate limiter instance with configurable default limit
 _http_config = HTTPConfig.from_env()
-limiter = Limiter(key_func=get_remote_address, default_limits=[_http_config.rate_limit_default])
+limiter = create_limiter(_http_config, default_limits=[_http_config.rate_limit_default])
 
-GZIP_MIN_SIZE = 1000
+# Responses that fit in a single packet gain nothing from compression but pay
+# its latency; level 1 keeps compression cheap for the larger schema dumps.
+GZIP_MIN_SIZE = 1500
+GZIP_COMPRESS_LEVEL = 1
 
 
 def setup_rate_limiting(app: FastAPI):
@@ -31,28 +54,36 @@ def setup_middleware(app: FastAPI, app_config: AppConfig):
 
     Sets up CORS, GZip compression, and rate limiting.
     """
-    # CORS
+    # CORS (a frozenset makes the per-request Origin check a hash lookup)
     cors_env = os.getenv("CORS_ALLOWED_ORIGINS", "")
     if cors_env:
-        allowed_origins = [origin.strip() for origin in cors_env.split(",")]
+        allowed_origins = frozenset(
+            origin.strip() for origin in cors_env.split(",") if origin.strip()
+        )
     else:
         environment = os.getenv("ENVIRONMENT", "development")
         if environment == "development":
-            allowed_origins = ["http://localhost:3000", "http://localhost:8000"]
+            allowed_origins = frozenset(("http://localhost:3000", "http://localhost:8000"))
         else:
-            allowed_origins = []
+            allowed_origins = frozenset()
             logger.warning("Production environment: CORS_ALLOWED_ORIGINS not set, CORS disabled")
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=allowed_origins,
-        allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        allow_headers=["Content-Type", "Authorization"],
-    )
+    # With no allowed origins the middleware could only reject preflights, which
+    # the router already does (405); leave it out rather than pay a hop per request
+    if allowed_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=allowed_origins,
+            allow_credentials=True,
+            allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+            allow_headers=["Content-Type", "Authorization"],
+            max_age=app_config.http_config.cors_preflight_max_age,
+        )
 
     # GZip compression
-    app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE)
+    app.add_middleware(
+        GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_COMPRESS_LEVEL
+    )
 
     # Rate limiting
     setup_rate_limiting(app)
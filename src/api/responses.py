@@ -0,0 +1,108 @@
+"""Response classes for the REST API."""
+
+import json
+from typing import Any, Dict, Iterator, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_fallback(obj: Any) -> Any:
+    """Encode types the JSON serializer lacks (Decimal, set, ...) as FastAPI would."""
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed.
+
+    Falls back to the standard ``JSONResponse`` rendering otherwise, so it is
+    safe to use as the application's ``default_response_class``. Values the
+    serializer does not support natively go through ``jsonable_encoder``, so
+    handlers may also return an instance directly to skip FastAPI's full
+    encoding pass over the content.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content the way FastJSONResponse renders it."""
+    if orjson is None:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_encode_fallback,
+        ).encode("utf-8")
+    return orjson.dumps(
+        content,
+        default=_encode_fallback,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+# Fixed parts of the {"success", "data"/"error", "timestamp"} API envelope
+_SUCCESS_PREFIX = b'{"success":true,"data":'
+_ERROR_PREFIX = b'{"success":false,"error":'
+_TIMESTAMP_FIELD = b',"timestamp":'
+
+
+def success_response(data: Any, timestamp: str) -> Response:
+    """Success envelope built from fixed byte fragments around the encoded data.
+
+    Only ``data`` and ``timestamp`` go through the serializer; the envelope
+    dict and FastAPI's encoding pass over it are skipped.
+    """
+    return Response(
+        _SUCCESS_PREFIX + dumps(data) + _TIMESTAMP_FIELD + dumps(timestamp) + b"}",
+        media_type="application/json",
+    )
+
+
+def error_response(message: str, timestamp: str) -> Response:
+    """Error envelope counterpart of ``success_response``."""
+    return Response(
+        _ERROR_PREFIX + dumps(message) + _TIMESTAMP_FIELD + dumps(timestamp) + b"}",
+        media_type="application/json",
+    )
+
+
+def _iter_success_envelope(
+    data: Dict[str, Any], list_key: str, timestamp: str, batch_size: int
+) -> Iterator[bytes]:
+    items: List[Any] = data[list_key]
+    head = dumps({key: value for key, value in data.items() if key != list_key})
+    yield (
+        _SUCCESS_PREFIX
+        + head[:-1]
+        + (b"," if len(head) > 2 else b"")
+        + dumps(list_key)
+        + b":["
+    )
+    for start in range(0, len(items), batch_size):
+        chunk = dumps(items[start:start + batch_size])[1:-1]
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}" + _TIMESTAMP_FIELD + dumps(timestamp) + b"}"
+
+
+def streaming_success_response(
+    data: Dict[str, Any], list_key: str, timestamp: str, batch_size: int = 200
+) -> StreamingResponse:
+    """Success envelope whose ``data[list_key]`` list is serialized in batches.
+
+    The body is never held in memory as a whole, and the client receives the
+    first rows before the last are encoded. The generator is synchronous, so
+    Starlette runs the serialization in its thread pool.
+    """
+    return StreamingResponse(
+        _iter_success_envelope(data, list_key, timestamp, batch_size),
+        media_type="application/json",
+    )
@@ -1,12 +1,15 @@
 """FastAPI routes for MCP Database REST API."""
 
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, field_validator
 
 from database.manager import DatabaseManager
+from core.config import get_http_config
 from core.dependencies import get_db_manager_dependency
 
 logger = logging.getLogger(__name__)
@@ -14,13 +17,27 @@ logger = logging.getLogger(__name__)
 
 class QueryRequest(BaseModel):
     query: str
-    params: Optional[List[Any]] = None
+    params: List[Any] = Field(default_factory=list)
+
+    @field_validator("params", mode="before")
+    @classmethod
+    def _null_params(cls, value: Any) -> Any:
+        # Clients may still send "params": null
+        return [] if value is None else value
 
 
 class CacheInvalidateRequest(BaseModel):
     table_name: Optional[str] = None
 
 
+# Upper bound accepted by POST /api/v1/admin/concurrency
+MAX_CONCURRENCY_LIMIT = 1024
+
+
+class ConcurrencyLimitRequest(BaseModel):
+    max_concurrent: int = Field(ge=1, le=MAX_CONCURRENCY_LIMIT)
+
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: str
@@ -43,16 +60,32 @@ class APIResponse(BaseModel):
 
 router = APIRouter(prefix="/api/v1")
 
+# With CACHE_TIMESTAMPS, response timestamps are reused within this window (seconds)
+_TIMESTAMP_RESOLUTION = 0.2
+_timestamp_cache = (-1, "")  # (time bucket, formatted timestamp)
 
-@router.get("/health", response_model=HealthResponse)
+
+def _timestamp() -> str:
+    """Response timestamp; when cached, formatted once per _TIMESTAMP_RESOLUTION."""
+    global _timestamp_cache
+    if not get_http_config().cache_timestamps:
+        return datetime.now().isoformat()
+    now = time.time()
+    bucket = int(now / _TIMESTAMP_RESOLUTION)
+    if bucket != _timestamp_cache[0]:
+        _timestamp_cache = (bucket, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check(db: DatabaseManager = Depends(get_db_manager_dependency)):
     """Health check endpoint."""
-    return HealthResponse(
-        status="ok",
-        timestamp=datetime.now().isoformat(),
-        version="2.0.0",
-        database_connected=True
-    )
+    return {
+        "status": "ok",
+        "timestamp": _timestamp(),
+        "version": "2.0.0",
+        "database_connected": True,
+    }
 
 
 @router.post("/query")
@@ -61,26 +94,26 @@ async def execute_query(
     db: DatabaseManager = Depends(get_db_manager_dependency)
 ):
     """Execute a SQL query."""
-    result = db.execute_query(request.query, request.params)
+    result = await run_in_threadpool(db.execute_query, request.query, request.params)
     return APIResponse(
         success=result.get("success", False),
         data=result if result.get("success") else None,
         error=result.get("error") if not result.get("success") else None,
-        timestamp=datetime.now().isoformat()
+        timestamp=_timestamp()
     )
 
 
-@router.get("/tools", response_model=List[ToolInfo])
+@router.get("/tools", responses={200: {"model": List[ToolInfo]}})
 async def list_tools():
     """List all available MCP tools."""
     from tools import get_all_tools
     tools = get_all_tools()
     return [
-        ToolInfo(
-            name=tool.name,
-            description=tool.description,
-            parameters=tool.inputSchema
-        )
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.inputSchema,
+        }
         for tool in tools
     ]
 
@@ -91,12 +124,12 @@ async def get_schema(
     db: DatabaseManager = Depends(get_db_manager_dependency)
 ):
     """Get database schema information."""
-    result = db.get_schema_info(table_name)
+    result = await run_in_threadpool(db.get_schema_info, table_name)
     return APIResponse(
         success=result.get("success", False),
         data=result if result.get("success") else None,
         error=result.get("error") if not result.get("success") else None,
-        timestamp=datetime.now().isoformat()
+        timestamp=_timestamp()
     )
 
 
@@ -111,7 +144,7 @@ async def invalidate_cache(
         success=result.get("success", False),
         data=result if result.get("success") else None,
         error=result.get("error") if not result.get("success") else None,
-        timestamp=datetime.now().isoformat()
+        timestamp=_timestamp()
     )
 
 
@@ -123,5 +156,5 @@ async def get_cache_stats(db: DatabaseManager = Depends(get_db_manager_dependenc
         success=result.get("success", False),
         data=result if result.get("success") else None,
         error=result.get("error") if not result.get("success") else None,
-        timestamp=datetime.now().isoformat()
+        timestamp=_timestamp()
     )
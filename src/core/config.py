@@ -1,6 +1,7 @@
 """Configuration management for MCP Multi-Database Connector."""
 
 import os
+from functools import lru_cache
 from typing import Optional, Literal
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -81,6 +82,18 @@ class DatabaseConfig(BaseModel):
     port: Optional[int] = Field(default=None, description="Database port (auto-detected if None)")
     timeout: int = Field(default=30, description="Connection timeout in seconds")
     command_timeout: int = Field(default=60, description="Async database command timeout in seconds")
+    debug_schema: bool = Field(
+        default=False,
+        description="Run extra diagnostic queries during schema introspection"
+    )
+    schema_cache_ttl: int = Field(
+        default=60,
+        description="Seconds inspector query results stay cached"
+    )
+    schema_prewarm_interval: int = Field(
+        default=0,
+        description="Seconds between background schema listing refreshes (0 disables)"
+    )
 
     # SQL Server specific fields
     driver: str = Field(default="ODBC Driver 18 for SQL Server", description="ODBC driver for SQL Server")
@@ -115,6 +128,11 @@ class DatabaseConfig(BaseModel):
                 port=int(os.getenv("DB_PORT", "5432")),
                 timeout=int(os.getenv("DB_TIMEOUT", "30")),
                 command_timeout=int(os.getenv("DB_COMMAND_TIMEOUT", "60")),
+                debug_schema=os.getenv("DB_DEBUG_SCHEMA", "false").lower() == "true",
+                schema_cache_ttl=int(os.getenv("DB_SCHEMA_CACHE_TTL", "60")),
+                schema_prewarm_interval=int(
+                    os.getenv("DB_SCHEMA_PREWARM_INTERVAL", "0")
+                ),
                 sslmode=os.getenv("DB_SSLMODE", "prefer"),
                 schema=os.getenv("DB_SCHEMA", "public")
             )
@@ -133,6 +151,11 @@ class DatabaseConfig(BaseModel):
                 port=int(os.getenv("DB_PORT", "1433")),
                 timeout=int(os.getenv("DB_TIMEOUT", "30")),
                 command_timeout=int(os.getenv("DB_COMMAND_TIMEOUT", "60")),
+                debug_schema=os.getenv("DB_DEBUG_SCHEMA", "false").lower() == "true",
+                schema_cache_ttl=int(os.getenv("DB_SCHEMA_CACHE_TTL", "60")),
+                schema_prewarm_interval=int(
+                    os.getenv("DB_SCHEMA_PREWARM_INTERVAL", "0")
+                ),
                 trusted_connection=os.getenv("MSSQL_TRUSTED_CONNECTION", "false").lower() == "true",
                 encrypt=os.getenv("MSSQL_ENCRYPT", "true").lower() == "true",
                 trust_server_certificate=os.getenv("MSSQL_TRUST_CERTIFICATE", "false").lower() == "true"
@@ -306,9 +329,49 @@ class HTTPConfig(BaseModel):
         default="100/minute",
         description="Rate limit for query endpoints"
     )
+    rate_limit_storage_uri: str = Field(
+        default="memory://",
+        description="Rate limit counter storage; redis://host:port/db shares limits"
+    )
+    rate_limit_strategy: str = Field(
+        default="fixed-window",
+        description="fixed-window, moving-window or sliding-window-counter"
+    )
+    max_concurrent_queries: int = Field(
+        default=16,
+        description="Maximum number of /api/v1/query requests executing at once"
+    )
+    threadpool_size: int = Field(
+        default=100,
+        description="Worker threads for blocking database calls from async endpoints"
+    )
+    cache_timestamps: bool = Field(
+        default=False,
+        description="Reuse a response timestamp refreshed every 200ms"
+    )
+    sse_coalesce_ms: float = Field(
+        default=1.0,
+        description="Hold SSE events this long to batch bursts; 0 sends at once"
+    )
     cors_preflight_max_age: int = Field(
-        default=600,
-        description="CORS preflight max age in seconds"
+        default=86400,
+        description="CORS preflight max age in seconds (Chrome caps it at 7200)"
+    )
+    http2: bool = Field(
+        default=False,
+        description="Serve with Hypercorn so HTTP/2 clients can multiplex SSE streams"
+    )
+    tls_certfile: Optional[str] = Field(
+        default=None,
+        description="TLS certificate for the HTTP/2 server (browsers need TLS)"
+    )
+    tls_keyfile: Optional[str] = Field(
+        default=None,
+        description="TLS private key for the HTTP/2 server"
+    )
+    admin_token: Optional[str] = Field(
+        default=None,
+        description="Bearer token for /api/v1/admin write endpoints; unset disables"
     )
 
     @classmethod
@@ -317,10 +380,23 @@ class HTTPConfig(BaseModel):
         return cls(
             rate_limit_default=os.getenv("RATE_LIMIT_DEFAULT", "100/minute"),
             rate_limit_query=os.getenv("RATE_LIMIT_QUERY", "30/minute"),
-            cors_preflight_max_age=int(os.getenv("CORS_PREFLIGHT_MAX_AGE", "600"))
+            rate_limit_storage_uri=os.getenv("RATE_LIMIT_STORAGE_URI", "memory://"),
+            rate_limit_strategy=os.getenv("RATE_LIMIT_STRATEGY", "fixed-window"),
+            max_concurrent_queries=int(os.getenv("MAX_CONCURRENT_QUERIES", "16")),
+            threadpool_size=int(os.getenv("HTTP_THREADPOOL_SIZE", "100")),
+            cache_timestamps=(
+                os.getenv("CACHE_TIMESTAMPS", "0").lower() in ("1", "true")
+            ),
+            sse_coalesce_ms=float(os.getenv("SSE_COALESCE_MS", "1")),
+            cors_preflight_max_age=int(os.getenv("CORS_PREFLIGHT_MAX_AGE", "86400")),
+            http2=os.getenv("HTTP2", "0").lower() in ("1", "true"),
+            tls_certfile=os.getenv("HTTP_TLS_CERTFILE") or None,
+            tls_keyfile=os.getenv("HTTP_TLS_KEYFILE") or None,
+            admin_token=os.getenv("ADMIN_API_TOKEN") or None
         )
 
 
+@lru_cache()
 def get_http_config() -> "HTTPConfig":
     """Get HTTPConfig singleton from environment variables."""
     return HTTPConfig.from_env()
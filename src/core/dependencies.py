@@ -68,6 +68,8 @@ def reset_singletons():
     _database_manager = None
     get_app_config.cache_clear()
     get_database_config.cache_clear()
+    from core.config import get_http_config
+    get_http_config.cache_clear()
     logger.info("Reset all singletons")
 
 
@@ -315,6 +315,7 @@ class HybridDatabaseManager:
         return await manager.execute_query(query, params)
 
     async def close_async(self):
-        """Close async resources."""
+        """Close async resources and stop the sync manager's background work."""
+        self.sync_manager.close()
         if self._async_manager:
             await self._async_manager.close()
@@ -37,12 +37,14 @@ class DatabaseManager:
         self.schema_cache = None
         self.schema_preloader = None
         self.schema_introspector = None
+        self._base_introspector = None
 
         self._initialize_schema_system()
 
     def _initialize_schema_system(self):
         """Initialize schema introspection with optional caching."""
         base_introspector = create_schema_inspector(self.get_connection, self.config)
+        self._base_introspector = base_introspector
 
         if self.app_config.schema_config.enable_cache:
             # Use global singleton cache to ensure sharing across instances
@@ -105,6 +107,11 @@ class DatabaseManager:
 
         return cls(config, app_config)
 
+    def close(self) -> None:
+        """Stop background schema work (the prewarm refresher thread)."""
+        if self._base_introspector is not None:
+            self._base_introspector.stop_prewarm()
+
     def get_connection(self):
         """Context manager for database connections with enhanced error handling."""
         return self.db_connector.get_connection()
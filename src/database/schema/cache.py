@@ -3,7 +3,7 @@
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 from threading import RLock
@@ -27,6 +27,9 @@ class SchemaCache:
         self.access_count: Dict[str, int] = {}  # Access frequency
         self.last_access: Dict[str, datetime] = {}  # Last access time
 
+        # Read variants stamped with cache_source, built once per cached value
+        self._stamped: Dict[str, Any] = {}
+
         # Preload tracking
         self.preload_status: Dict[str, Dict[str, Any]] = {
             "static_preload_completed": False,
@@ -39,19 +42,75 @@ class SchemaCache:
     def get(self, key: str) -> Optional[Any]:
         """Get cached value if not expired (thread-safe), with access tracking."""
         with self._lock:
-            hit = key in self.cache
-            valid = self._is_valid(key) if hit else False
-            logger.info(f"[CACHE-GET] key='{key}', cache_id={id(self)}, hit={hit}, valid={valid}, total_keys={len(self.cache)}")
-
-            if key in self.cache:
-                if self._is_valid(key):
-                    # Record access for LFU+LRU eviction strategy
-                    self.access_count[key] = self.access_count.get(key, 0) + 1
-                    self.last_access[key] = datetime.now()
-                    return self.cache[key]
-                else:
-                    self._invalidate(key)
-            return None
+            return self._get(key)
+
+    def mget(
+        self,
+        keys: Sequence[str],
+        sources: Optional[Sequence[str]] = None
+    ) -> Tuple[Optional[Any], Optional[str]]:
+        """Return the first valid cached value among keys under a single lock.
+
+        Args:
+            keys: Cache keys to probe, in priority order
+            sources: Optional cache_source tag per key; when given, the hit is
+                returned as a variant stamped with its tag instead of the raw value
+
+        Returns:
+            Tuple of (value, matching_key), or (None, None) if no key hits
+        """
+        with self._lock:
+            for i, key in enumerate(keys):
+                value = self._get(key)
+                if value:
+                    if sources is not None:
+                        value = self._stamp(key, value, sources[i])
+                    return value, key
+            return None, None
+
+    def get_stamped(self, key: str, source: str) -> Optional[Any]:
+        """Get cached value stamped with cache_source (thread-safe)."""
+        value, _ = self.mget((key,), (source,))
+        return value
+
+    def _stamp(self, key: str, value: Any, source: str) -> Any:
+        """Return the cache_source-stamped variant of a cached value.
+
+        The variant is a shallow copy built on first read and reused until the
+        entry changes, so reads never mutate the shared cached dict. Values that
+        already carry a cache_source (e.g. database_query) are returned as-is.
+        """
+        stamped = self._stamped.get(key)
+        if stamped is None:
+            if isinstance(value, dict) and "cache_source" not in value:
+                stamped = {**value, "cache_source": source}
+            else:
+                stamped = value
+            self._stamped[key] = stamped
+        return stamped
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Get cached value with access tracking (caller must hold the lock)."""
+        hit = key in self.cache
+        valid = self._is_valid(key) if hit else False
+        logger.info(
+            "[CACHE-GET] key='%s', cache_id=%s, hit=%s, valid=%s, total_keys=%s",
+            key,
+            id(self),
+            hit,
+            valid,
+            len(self.cache),
+        )
+
+        if hit:
+            if valid:
+                # Record access for LFU+LRU eviction strategy
+                self.access_count[key] = self.access_count.get(key, 0) + 1
+                self.last_access[key] = datetime.now()
+                return self.cache[key]
+            else:
+                self._invalidate(key)
+        return None
     
     def set(self, key: str, value: Any) -> None:
         """Cache value with timestamp (thread-safe)."""
@@ -60,11 +119,17 @@ class SchemaCache:
             if len(self.cache) >= self.max_size:
                 self._evict_lfu_lru(int(self.max_size * 0.1))
             self.cache[key] = value
+            self._stamped.pop(key, None)
             self.last_updated[key] = datetime.now()
             # Initialize access tracking for new entries
             self.access_count[key] = self.access_count.get(key, 0)
             self.last_access[key] = datetime.now()
-            logger.info(f"[CACHE-SET] key='{key}', cache_id={id(self)}, total_keys={len(self.cache)}")
+            logger.info(
+                "[CACHE-SET] key='%s', cache_id=%s, total_keys=%s",
+                key,
+                id(self),
+                len(self.cache),
+            )
     
     def invalidate(self, key: str) -> None:
         """Manually invalidate cache entry (thread-safe)."""
@@ -75,6 +140,7 @@ class SchemaCache:
         """Clear all cache entries (thread-safe)."""
         with self._lock:
             self.cache.clear()
+            self._stamped.clear()
             self.last_updated.clear()
             self.access_count.clear()
             self.last_access.clear()
@@ -88,6 +154,7 @@ class SchemaCache:
     def _invalidate(self, key: str) -> None:
         """Remove expired cache entry and its access tracking."""
         self.cache.pop(key, None)
+        self._stamped.pop(key, None)
         self.last_updated.pop(key, None)
         self.access_count.pop(key, None)
         self.last_access.pop(key, None)
@@ -127,13 +194,22 @@ class SchemaCache:
         evict_keys = sorted(scores.items(), key=lambda x: x[1])[:count]
 
         for key, score in evict_keys:
-            logger.debug(f"[CACHE-EVICT] key='{key}', score={score:.4f}, freq={self.access_count.get(key, 0)}, hours={hours_since_access:.2f}")
+            logger.debug(
+                "[CACHE-EVICT] key='%s', score=%.4f, freq=%s, hours=%.2f",
+                key,
+                score,
+                self.access_count.get(key, 0),
+                hours_since_access,
+            )
             self.cache.pop(key, None)
+            self._stamped.pop(key, None)
             self.last_updated.pop(key, None)
             self.access_count.pop(key, None)
             self.last_access.pop(key, None)
 
-        logger.info(f"[CACHE-EVICT] Evicted {len(evict_keys)} entries using LFU+LRU strategy")
+        logger.info(
+            "[CACHE-EVICT] Evicted %s entries using LFU+LRU strategy", len(evict_keys)
+        )
 
     def mark_static_preload_complete(self, table_names: List[str]) -> None:
         """Mark static preload as completed (thread-safe)."""
@@ -141,7 +217,7 @@ class SchemaCache:
             self.preload_status["static_preload_completed"] = True
             self.preload_status["static_tables"] = set(table_names)
             self.preload_status["preload_timestamp"] = datetime.now()
-            logger.info(f"Static preload completed: {len(table_names)} tables")
+            logger.info("Static preload completed: %s tables", len(table_names))
 
     def mark_dynamic_preload_complete(self, table_names: List[str]) -> None:
         """Mark dynamic preload as completed (thread-safe)."""
@@ -149,7 +225,7 @@ class SchemaCache:
             self.preload_status["dynamic_preload_completed"] = True
             self.preload_status["dynamic_tables"] = set(table_names)
             self.preload_status["preload_timestamp"] = datetime.now()
-            logger.info(f"Dynamic preload completed: {len(table_names)} tables")
+            logger.info("Dynamic preload completed: %s tables", len(table_names))
 
     def get_preload_status(self) -> Dict[str, Any]:
         """Get current preload status (thread-safe)."""
@@ -190,22 +266,26 @@ class SchemaPreloader:
         try:
             config_file = Path(config_path)
             if not config_file.exists():
-                logger.warning(f"Schema config file not found: {config_path}")
+                logger.warning("Schema config file not found: %s", config_path)
                 return False
             
             # 如果是目錄，可能不需要載入特定的預載配置，而是依賴靜態掃描
             if config_file.is_dir():
-                logger.debug(f"Config path is a directory: {config_path}, skipping specific preload config load")
+                logger.debug(
+                    "Config path is a directory: %s, "
+                    "skipping specific preload config load",
+                    config_path,
+                )
                 return True
 
             with open(config_file, 'r', encoding='utf-8') as f:
                 self.preload_config = json.load(f)
             
-            logger.info(f"Loaded schema configuration from {config_path}")
+            logger.info("Loaded schema configuration from %s", config_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to load schema config: {e}")
+            logger.error("Failed to load schema config: %s", e)
             return False
 
     def load_config_and_preload(self, config_path: str, max_concurrent: int = 5) -> bool:
@@ -218,7 +298,7 @@ class SchemaPreloader:
             # 執行並行預載（使用線程池）
             return self.preload_schemas_concurrent(max_concurrent)
         except Exception as e:
-            logger.error(f"Load config and preload failed: {e}")
+            logger.error("Load config and preload failed: %s", e)
             return False
     
     def preload_schemas(self) -> bool:
@@ -256,11 +336,13 @@ class SchemaPreloader:
             # Mark dynamic preload as completed
             self.cache.mark_dynamic_preload_complete(successfully_loaded)
 
-            logger.info(f"Preloaded dynamic schemas for {len(successfully_loaded)} tables")
+            logger.info(
+                "Preloaded dynamic schemas for %s tables", len(successfully_loaded)
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Schema preload failed: {e}")
+            logger.error("Schema preload failed: %s", e)
             return False
 
     def preload_schemas_concurrent(self, max_concurrent: int = 5) -> bool:
@@ -302,7 +384,11 @@ class SchemaPreloader:
                 logger.info("No tables configured for preload")
                 return True
 
-            logger.info(f"Starting parallel preload for {len(all_tables)} tables (max_concurrent={max_concurrent})")
+            logger.info(
+                "Starting parallel preload for %s tables (max_concurrent=%s)",
+                len(all_tables),
+                max_concurrent,
+            )
 
             # Parallel preload using ThreadPoolExecutor
             successfully_loaded = []
@@ -324,7 +410,7 @@ class SchemaPreloader:
                         else:
                             failed_tables.append(table_name)
                     except Exception as e:
-                        logger.error(f"Error preloading table {table_name}: {e}")
+                        logger.error("Error preloading table %s: %s", table_name, e)
                         failed_tables.append(table_name)
 
             # Preload dependencies for critical tables (parallel)
@@ -338,24 +424,26 @@ class SchemaPreloader:
                         try:
                             future.result()
                         except Exception as e:
-                            logger.error(f"Error preloading dependencies: {e}")
+                            logger.error("Error preloading dependencies: %s", e)
 
             # Mark dynamic preload as completed
             self.cache.mark_dynamic_preload_complete(successfully_loaded)
 
             elapsed_time = time.time() - start_time
             logger.info(
-                f"✅ Parallel preload completed in {elapsed_time:.2f}s: "
-                f"{len(successfully_loaded)} succeeded, {len(failed_tables)} failed"
+                "✅ Parallel preload completed in %.2fs: %s succeeded, %s failed",
+                elapsed_time, len(successfully_loaded), len(failed_tables)
             )
 
             if failed_tables:
-                logger.warning(f"Failed to preload tables: {', '.join(failed_tables[:10])}")
+                logger.warning(
+                    "Failed to preload tables: %s", ', '.join(failed_tables[:10])
+                )
 
             return True
 
         except Exception as e:
-            logger.error(f"Parallel schema preload failed: {e}")
+            logger.error("Parallel schema preload failed: %s", e)
             return False
 
     def _try_preload_static_schemas(self) -> bool:
@@ -375,7 +463,11 @@ class SchemaPreloader:
                 'source': 'json_config_system'
             }
             self.cache.set("database_overview_static", overview_result)
-            logger.info(f"[PRELOAD] Set database_overview_static, cache_id={id(self.cache)}, tables={len(tables)}")
+            logger.info(
+                "[PRELOAD] Set database_overview_static, cache_id=%s, tables=%s",
+                id(self.cache),
+                len(tables),
+            )
 
             # Verify the cache was set correctly
             verify_result = self.cache.get("database_overview_static")
@@ -383,7 +475,11 @@ class SchemaPreloader:
                 logger.error("[PRELOAD-ERROR] Failed to verify database_overview_static in cache!")
                 return False
             else:
-                logger.info(f"[PRELOAD-VERIFY] Successfully verified database_overview_static, tables={len(verify_result.get('results', []))}")
+                logger.info(
+                    "[PRELOAD-VERIFY] Successfully verified "
+                    "database_overview_static, tables=%s",
+                    len(verify_result.get('results', [])),
+                )
 
             # Validate whitelist against actual database
             validated_tables = []
@@ -405,9 +501,12 @@ class SchemaPreloader:
                             validated_tables.append(table_name)
                         else:
                             missing_tables.append(table_name)
-                            logger.warning(f"⚠️  Whitelist table '{table_name}' not found in database")
+                            logger.warning(
+                                "⚠️  Whitelist table '%s' not found in database",
+                                table_name,
+                            )
                     except Exception as e:
-                        logger.debug(f"Could not validate table '{table_name}': {e}")
+                        logger.debug("Could not validate table '%s': %s", table_name, e)
                         # Assume table exists if validation fails
                         validated_tables.append(table_name)
 
@@ -456,12 +555,20 @@ class SchemaPreloader:
 
             # Log validation results
             if missing_tables:
-                logger.warning(f"⚠️  {len(missing_tables)} whitelist tables not found in database: {', '.join(missing_tables)}")
-            logger.info(f"✅ Preloaded {loaded_count} table schemas via JSON system ({len(validated_tables)} validated)")
+                logger.warning(
+                    "⚠️  %s whitelist tables not found in database: %s",
+                    len(missing_tables),
+                    ', '.join(missing_tables),
+                )
+            logger.info(
+                "✅ Preloaded %s table schemas via JSON system (%s validated)",
+                loaded_count,
+                len(validated_tables),
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Failed to preload static schemas: {e}")
+            logger.error("Failed to preload static schemas: %s", e)
             return False
     
     def _preload_database_overview(self) -> None:
@@ -480,7 +587,7 @@ class SchemaPreloader:
                 logger.debug("Preloaded schema summary")
                 
         except Exception as e:
-            logger.error(f"Failed to preload database overview: {e}")
+            logger.error("Failed to preload database overview: %s", e)
     
     def _preload_table_schema(self, table_name: str) -> bool:
         """Preload specific table schema.
@@ -493,14 +600,14 @@ class SchemaPreloader:
             if schema.get("success"):
                 cache_key = f"table_schema_{table_name}"
                 self.cache.set(cache_key, schema)
-                logger.debug(f"Preloaded schema for table: {table_name}")
+                logger.debug("Preloaded schema for table: %s", table_name)
                 return True
             else:
-                logger.warning(f"Failed to preload schema for table: {table_name}")
+                logger.warning("Failed to preload schema for table: %s", table_name)
                 return False
 
         except Exception as e:
-            logger.error(f"Failed to preload table schema for {table_name}: {e}")
+            logger.error("Failed to preload table schema for %s: %s", table_name, e)
             return False
     
     def _preload_table_dependencies(self, table_name: str) -> None:
@@ -510,12 +617,14 @@ class SchemaPreloader:
             if dependencies.get("success"):
                 cache_key = f"table_dependencies_{table_name}"
                 self.cache.set(cache_key, dependencies)
-                logger.debug(f"Preloaded dependencies for table: {table_name}")
+                logger.debug("Preloaded dependencies for table: %s", table_name)
             else:
-                logger.warning(f"Failed to preload dependencies for table: {table_name}")
+                logger.warning(
+                    "Failed to preload dependencies for table: %s", table_name
+                )
                 
         except Exception as e:
-            logger.error(f"Failed to preload dependencies for {table_name}: {e}")
+            logger.error("Failed to preload dependencies for %s: %s", table_name, e)
     
     def create_sample_config(self, output_path: str) -> bool:
         """Create a sample schema configuration file."""
@@ -541,11 +650,11 @@ class SchemaPreloader:
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(sample_config, f, indent=2, ensure_ascii=False)
-            logger.info(f"Created sample schema config at {output_path}")
+            logger.info("Created sample schema config at %s", output_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to create sample config: {e}")
+            logger.error("Failed to create sample config: %s", e)
             return False
 
 
@@ -557,7 +666,9 @@ class CachedSchemaIntrospector:
         self.introspector = original_introspector
         self.cache = cache
         self.strict_mode = strict_mode
-        logger.info(f"[INTROSPECTOR] cache_id={id(cache)}, strict_mode={strict_mode}")
+        logger.info(
+            "[INTROSPECTOR] cache_id=%s, strict_mode=%s", id(cache), strict_mode
+        )
     
     def get_schema_info(self, table_name: Optional[str] = None) -> Dict[str, Any]:
         """Get schema info with caching and static fallback.
@@ -576,27 +687,21 @@ class CachedSchemaIntrospector:
             cache_key = "database_overview"
             static_cache_key = "database_overview_static"
 
-        # Try dynamic cache first
-        cached_result = self.cache.get(cache_key)
-        if cached_result:
-            logger.debug(f"Dynamic cache hit for {cache_key}")
-            # Mark source if not already marked
-            if isinstance(cached_result, dict) and "cache_source" not in cached_result:
-                cached_result["cache_source"] = "dynamic_cache"
+        # Try dynamic cache first, static cache as fallback (single lock acquisition);
+        # hits come back stamped with their cache_source
+        cached_result, hit_key = self.cache.mget(
+            (cache_key, static_cache_key), ("dynamic_cache", "static_cache")
+        )
+        if hit_key:
+            logger.debug("Cache hit for %s", hit_key)
             return cached_result
 
-        # Try static cache as fallback
-        static_result = self.cache.get(static_cache_key)
-        if static_result:
-            logger.debug(f"Static cache hit for {static_cache_key}")
-            # Mark source to distinguish from dynamic cache
-            if isinstance(static_result, dict):
-                static_result["cache_source"] = "static_cache"
-            return static_result
-
         # Strict mode check: if not in either cache, deny access
         if self.strict_mode:
-            logger.warning(f"Strict mode enabled: Schema lookup blocked for {table_name_upper if table_name else 'overview'}")
+            logger.warning(
+                "Strict mode enabled: Schema lookup blocked for %s",
+                table_name_upper if table_name else 'overview',
+            )
             return {
                 "success": False,
                 "error": f"Schema access denied (Strict Mode): Table '{table_name_upper if table_name else 'database overview'}' not found in preloaded configuration",
@@ -606,7 +711,7 @@ class CachedSchemaIntrospector:
             }
 
         # Cache miss - query database
-        logger.debug(f"Cache miss for {cache_key}, querying database")
+        logger.debug("Cache miss for %s, querying database", cache_key)
         result = self.introspector.get_schema_info(table_name_upper if table_name else None)
 
         # Mark as fresh database query and cache successful results
@@ -624,11 +729,9 @@ class CachedSchemaIntrospector:
         cache_key = f"table_dependencies_{table_name_upper}"
 
         # Try cache first
-        cached_result = self.cache.get(cache_key)
+        cached_result = self.cache.get_stamped(cache_key, "dynamic_cache")
         if cached_result:
-            logger.debug(f"Cache hit for dependencies: {table_name}")
-            if isinstance(cached_result, dict) and "cache_source" not in cached_result:
-                cached_result["cache_source"] = "dynamic_cache"
+            logger.debug("Cache hit for dependencies: %s", table_name)
             return cached_result
 
         # Attempt to get dependencies from static schema configuration first
@@ -674,7 +777,10 @@ class CachedSchemaIntrospector:
 
         # Strict mode check
         if self.strict_mode:
-             logger.warning(f"Strict mode enabled: Dependency lookup blocked for {table_name_upper}")
+             logger.warning(
+                 "Strict mode enabled: Dependency lookup blocked for %s",
+                 table_name_upper,
+             )
              return {
                  "success": False,
                  "error": f"Dependency access denied (Strict Mode): Table '{table_name_upper}' not found in preloaded configuration",
@@ -684,7 +790,9 @@ class CachedSchemaIntrospector:
              }
 
         # Cache miss - query database
-        logger.debug(f"Cache miss for dependencies: {table_name_upper}, querying database")
+        logger.debug(
+            "Cache miss for dependencies: %s, querying database", table_name_upper
+        )
         result = self.introspector.get_table_dependencies(table_name_upper)
 
         # Mark as fresh database query and cache successful results
@@ -703,22 +811,15 @@ class CachedSchemaIntrospector:
         cache_key = "schema_summary"
         static_cache_key = "schema_summary_static"
 
-        # Try dynamic cache first
-        cached_result = self.cache.get(cache_key)
-        if cached_result:
-            logger.debug("Dynamic cache hit for schema summary")
-            if isinstance(cached_result, dict) and "cache_source" not in cached_result:
-                cached_result["cache_source"] = "dynamic_cache"
+        # Try dynamic cache first, static cache as fallback (single lock acquisition);
+        # hits come back stamped with their cache_source
+        cached_result, hit_key = self.cache.mget(
+            (cache_key, static_cache_key), ("dynamic_cache", "static_cache")
+        )
+        if hit_key:
+            logger.debug("Cache hit for schema summary (%s)", hit_key)
             return cached_result
 
-        # Try static cache as fallback
-        static_result = self.cache.get(static_cache_key)
-        if static_result:
-            logger.debug("Static cache hit for schema summary")
-            if isinstance(static_result, dict):
-                static_result["cache_source"] = "static_cache"
-            return static_result
-
         # Strict mode check
         if self.strict_mode:
             return {
@@ -752,4 +853,9 @@ class CachedSchemaIntrospector:
             self.cache.invalidate(f"table_schema_{table_name_upper}_static")
         else:
             self.cache.clear()
-        logger.info(f"Invalidated cache for: {table_name or 'all entries'}")
\ No newline at end of file
+        # Inspector-level TTL cache must not serve the invalidated results either
+        if hasattr(self.introspector, 'invalidate_schema_cache'):
+            self.introspector.invalidate_schema_cache(
+                table_name_upper if table_name else None
+            )
+        logger.info("Invalidated cache for: %s", table_name or 'all entries')
\ No newline at end of file
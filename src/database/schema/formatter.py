@@ -1,12 +1,120 @@
 """Schema formatter for generating standard schema documentation."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 import os
 
 logger = logging.getLogger(__name__)
 
+# Column fields that influence format_table_schema output, in _Column order
+_SCHEMA_COLUMN_FIELDS = (
+    'COLUMN_NAME', 'DATA_TYPE', 'CHARACTER_MAXIMUM_LENGTH', 'NUMERIC_PRECISION',
+    'NUMERIC_SCALE', 'IS_PRIMARY_KEY', 'IS_FOREIGN_KEY', 'REFERENCED_TABLE_NAME',
+    'REFERENCED_COLUMN_NAME', 'IS_NULLABLE', 'COLUMN_DEFAULT', 'COLUMN_COMMENT',
+    'DESCRIPTION'
+)
+
+
+class _Column(NamedTuple):
+    """Column fields unpacked once from a column dict (attribute access, hashable)."""
+
+    column_name: Any
+    data_type: Any
+    character_maximum_length: Any
+    numeric_precision: Any
+    numeric_scale: Any
+    is_primary_key: Any
+    is_foreign_key: Any
+    referenced_table_name: Any
+    referenced_column_name: Any
+    is_nullable: Any
+    column_default: Any
+    column_comment: Any
+    description: Any
+
+    @classmethod
+    def from_dict(cls, column: Dict[str, Any]) -> "_Column":
+        get = column.get
+        return cls._make([get(field) for field in _SCHEMA_COLUMN_FIELDS])
+
+
+def _fmt_char(data_type: str, max_length: Any, precision: Any, scale: Any) -> str:
+    return f"{data_type}({max_length})" if max_length else data_type
+
+
+def _fmt_numeric(data_type: str, max_length: Any, precision: Any, scale: Any) -> str:
+    if precision is not None and scale is not None:
+        return f"{data_type}({precision}, {scale})"
+    elif precision is not None:
+        return f"{data_type}({precision})"
+    return data_type
+
+
+def _fmt_float(data_type: str, max_length: Any, precision: Any, scale: Any) -> str:
+    return f"{data_type}({precision})" if precision else data_type
+
+
+# Data type -> length/precision formatter (types not listed are shown as-is)
+_TYPE_FORMATTERS = {
+    'nvarchar': _fmt_char,
+    'varchar': _fmt_char,
+    'char': _fmt_char,
+    'nchar': _fmt_char,
+    'decimal': _fmt_numeric,
+    'numeric': _fmt_numeric,
+    'float': _fmt_float,
+    'real': _fmt_float,
+}
+
+
+@lru_cache(maxsize=512)
+def _format_type(data_type: str, max_length: Any, precision: Any, scale: Any) -> str:
+    """Format a data type; memoized since many columns share the same type tuple."""
+    data_type = data_type.lower()
+    formatter = _TYPE_FORMATTERS.get(data_type)
+    if formatter is None:
+        return data_type
+    return formatter(data_type, max_length, precision, scale)
+
+
+_TABLE_SCHEMA_HEADER = (
+    "分頁名稱: %s\n"
+    + "=" * 50 + "\n"
+    + "\n"
+    + f"{'資料欄位':>15} {'資料類型':>15} {'說明':>20} {'備註':>20}"
+)
+_TABLE_SCHEMA_ROW = "\n%15s %15s %20s %20s"
+
+
+@lru_cache(maxsize=128)
+def _table_schema_template(column_count: int) -> str:
+    """Build the full %-template for a table with column_count rows."""
+    return _TABLE_SCHEMA_HEADER + _TABLE_SCHEMA_ROW * column_count
+
+
+def _save_bytes_chunks(path: str, chunks: List[bytes]) -> None:
+    """Write pre-encoded chunks to a file with one vectored write where supported."""
+    if not hasattr(os, 'writev'):
+        # Windows: no writev, fall back to a single buffered write
+        with open(path, 'wb') as f:
+            f.write(b''.join(chunks))
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(map(len, chunks)):
+            # Short write: finish the remainder with plain writes
+            remaining = memoryview(b''.join(chunks))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
 
 class SchemaFormatter:
     """Formats database schema information into standard documentation."""
@@ -18,6 +126,10 @@ class SchemaFormatter:
             'DESCRIPTION': 20,
             'REMARKS': 20
         }
+        # Per-instance memo keyed by column snapshots; it dies with the formatter
+        self._format_table_schema_cached = lru_cache(maxsize=256)(
+            self._render_table_schema_key
+        )
 
     def format_table_schema(self,
                           table_name: str,
@@ -36,29 +148,47 @@ class SchemaFormatter:
         Returns:
             Formatted schema documentation string
         """
-        business_descriptions = business_descriptions or {}
-
+        cols = tuple(_Column.from_dict(col) for col in columns)
+        biz_key = tuple(sorted((business_descriptions or {}).items()))
+        try:
+            hash(cols)
+        except TypeError:
+            # Unhashable column values: format without memoization
+            return self._render_table_schema(
+                table_name, cols, table_comment, dict(biz_key)
+            )
+        return self._format_table_schema_cached(
+            table_name, cols, table_comment, biz_key
+        )
+
+    def _render_table_schema_key(self,
+                                 table_name: str,
+                                 cols: Tuple[_Column, ...],
+                                 table_comment: Optional[str],
+                                 biz_key: Tuple[Tuple[str, str], ...]) -> str:
+        """Render from hashable arguments (memoized per instance)."""
+        return self._render_table_schema(table_name, cols, table_comment, dict(biz_key))
+
+    def _render_table_schema(self,
+                             table_name: str,
+                             columns: Tuple[_Column, ...],
+                             table_comment: Optional[str],
+                             business_descriptions: Dict[str, str]) -> str:
+        """Render table schema documentation (uncached)."""
         # Extract Chinese table name if available in comment
-        display_name = self._extract_display_name(table_name, table_comment)
+        values = [self._extract_display_name(table_name, table_comment)]
 
-        lines = []
-        lines.append(f"分頁名稱: {display_name}")
-        lines.append("=" * 50)
-        lines.append("")
-
-        # Header
-        lines.append(f"{'資料欄位':>15} {'資料類型':>15} {'說明':>20} {'備註':>20}")
-
-        # Column information
+        # Column information, flattened into the template's row slots
         for col in columns:
-            column_name = col.get('COLUMN_NAME', '')
-            data_type = self._format_data_type(col)
-            description = self._get_column_description(column_name, col, business_descriptions)
-            remarks = self._get_column_remarks(col)
+            column_name = col.column_name or ''
+            values.append(column_name)
+            values.append(self._format_data_type(col))
+            values.append(
+                self._get_column_description(column_name, col, business_descriptions)
+            )
+            values.append(self._get_column_remarks(col))
 
-            lines.append(f"{column_name:>15} {data_type:>15} {description:>20} {remarks:>20}")
-
-        return '\n'.join(lines)
+        return _table_schema_template(len(columns)) % tuple(values)
 
     def _extract_display_name(self, table_name: str, table_comment: Optional[str]) -> str:
         """Extract display name from table name and comment."""
@@ -67,33 +197,17 @@ class SchemaFormatter:
             return f"{table_name} {table_comment}"
         return table_name
 
-    def _format_data_type(self, column: Dict[str, Any]) -> str:
+    def _format_data_type(self, column: _Column) -> str:
         """Format data type information."""
-        data_type = column.get('DATA_TYPE', '').lower()
-
-        # Handle length/precision
-        if data_type in ['nvarchar', 'varchar', 'char', 'nchar']:
-            max_length = column.get('CHARACTER_MAXIMUM_LENGTH')
-            if max_length:
-                return f"{data_type}({max_length})"
-
-        elif data_type in ['decimal', 'numeric']:
-            precision = column.get('NUMERIC_PRECISION')
-            scale = column.get('NUMERIC_SCALE')
-            if precision is not None and scale is not None:
-                return f"{data_type}({precision}, {scale})"
-            elif precision is not None:
-                return f"{data_type}({precision})"
-
-        elif data_type in ['float', 'real']:
-            precision = column.get('NUMERIC_PRECISION')
-            if precision:
-                return f"{data_type}({precision})"
-
-        return data_type
+        return _format_type(
+            column.data_type or '',
+            column.character_maximum_length,
+            column.numeric_precision,
+            column.numeric_scale
+        )
 
     def _get_column_description(self, column_name: str,
-                              column: Dict[str, Any],
+                              column: _Column,
                               business_descriptions: Dict[str, str]) -> str:
         """Get column description with business context."""
         # Priority: business_descriptions > column comment > generate from name
@@ -101,7 +215,7 @@ class SchemaFormatter:
             return business_descriptions[column_name]
 
         # Try to get from column comment/description
-        description = column.get('COLUMN_COMMENT') or column.get('DESCRIPTION', '')
+        description = column.column_comment or column.description
         if description:
             return description
 
@@ -138,27 +252,27 @@ class SchemaFormatter:
         else:
             return ""
 
-    def _get_column_remarks(self, column: Dict[str, Any]) -> str:
+    def _get_column_remarks(self, column: _Column) -> str:
         """Get column remarks including constraints and relationships."""
         remarks = []
 
         # Primary key
-        if column.get('IS_PRIMARY_KEY') == 'YES':
+        if column.is_primary_key == 'YES':
             remarks.append("主鍵")
 
         # Foreign key
-        if column.get('IS_FOREIGN_KEY') == 'YES':
-            ref_table = column.get('REFERENCED_TABLE_NAME')
-            ref_column = column.get('REFERENCED_COLUMN_NAME')
+        if column.is_foreign_key == 'YES':
+            ref_table = column.referenced_table_name
+            ref_column = column.referenced_column_name
             if ref_table:
                 remarks.append(f"對應{ref_table}.{ref_column}")
 
         # Nullable
-        if column.get('IS_NULLABLE') == 'NO':
+        if column.is_nullable == 'NO':
             remarks.append("必填")
 
         # Default value
-        default_value = column.get('COLUMN_DEFAULT')
+        default_value = column.column_default
         if default_value and default_value not in ['NULL', 'null']:
             remarks.append(f"預設:{default_value}")
 
@@ -181,14 +295,18 @@ class SchemaFormatter:
         """
         os.makedirs(output_dir, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{table_name}_{timestamp}.txt"
+        now = datetime.now()
+        filename = f"{table_name}_{now.strftime('%Y%m%d_%H%M%S')}.txt"
         filepath = os.path.join(output_dir, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(schema_content)
-            f.write(f"\n\n# 生成時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            f.write(f"\n# 表格名稱: {table_name}")
+        footer = (
+            f"\n\n# 生成時間: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+            f"\n# 表格名稱: {table_name}"
+        )
+        _save_bytes_chunks(filepath, [
+            schema_content.encode('utf-8'),
+            footer.encode('utf-8')
+        ])
 
         return filepath
 
@@ -209,41 +327,44 @@ class SchemaFormatter:
         lines.append(f"{'表格名稱':>25} {'類型':>10} {'說明':>30}")
         lines.append("-" * 70)
 
-        # Sort tables by type and name
-        sorted_tables = sorted(tables, key=lambda x: (x.get('TABLE_TYPE', ''), x.get('TABLE_NAME', '')))
-
-        current_type = None
-        for table in sorted_tables:
-            table_name = table.get('TABLE_NAME', '')
-            table_type = table.get('TABLE_TYPE', '')
-            table_comment = table.get('TABLE_COMMENT', '')
-
-            # Group by table type
-            if current_type != table_type:
-                if current_type is not None:
-                    lines.append("")  # Add blank line between types
-                current_type = table_type
-                lines.append(f"# {table_type}")
-                lines.append("")
-
-            # Format comment
-            if table_comment:
-                # Truncate long comments
-                if len(table_comment) > 25:
-                    display_comment = table_comment[:22] + "..."
-                else:
-                    display_comment = table_comment
-            else:
-                display_comment = "(無說明)"
+        # Single pass to (type, name, comment) rows, then sort by type and name
+        rows = [
+            (
+                table.get('TABLE_TYPE') or '',
+                table.get('TABLE_NAME') or '',
+                table.get('TABLE_COMMENT'),
+            )
+            for table in tables
+        ]
+        rows.sort(key=itemgetter(0, 1))
+
+        for index, (table_type, group) in enumerate(groupby(rows, key=itemgetter(0))):
+            if index:
+                lines.append("")  # Add blank line between types
+            lines.append(f"# {table_type}")
+            lines.append("")
 
             # Format table type for display
             type_display = "表格" if table_type == "BASE TABLE" else "檢視"
 
-            lines.append(f"{table_name:>25} {type_display:>10} {display_comment:>30}")
+            for _, table_name, table_comment in group:
+                # Format comment
+                if table_comment:
+                    # Truncate long comments
+                    if len(table_comment) > 25:
+                        display_comment = table_comment[:22] + "..."
+                    else:
+                        display_comment = table_comment
+                else:
+                    display_comment = "(無說明)"
+
+                lines.append(
+                    f"{table_name:>25} {type_display:>10} {display_comment:>30}"
+                )
 
-            # If comment was truncated, add full comment on next line
-            if table_comment and len(table_comment) > 25:
-                lines.append(f"{'':>37}完整說明: {table_comment}")
+                # If comment was truncated, add full comment on next line
+                if table_comment and len(table_comment) > 25:
+                    lines.append(f"{'':>37}完整說明: {table_comment}")
 
         lines.append("")
         lines.append(f"總計: {len(tables)} 個資料庫物件")
@@ -268,10 +389,14 @@ class SchemaFormatter:
         filename = "table_list.txt"
         filepath = os.path.join(output_dir, filename)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(table_list_content)
-            f.write(f"\n\n# 生成時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            f.write(f"\n# 資料庫類型: SQL Server / PostgreSQL")
+        footer = (
+            f"\n\n# 生成時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            "\n# 資料庫類型: SQL Server / PostgreSQL"
+        )
+        _save_bytes_chunks(filepath, [
+            table_list_content.encode('utf-8'),
+            footer.encode('utf-8')
+        ])
 
         return filepath
 
@@ -286,6 +411,17 @@ class BusinessLogicEnhancer:
         # Generic pattern-based mappings (fallback)
         self.pattern_mappings = self._get_generic_patterns()
 
+        # Partition patterns once so matching never re-inspects the '_' prefix:
+        # suffix patterns are tried longest-first, then contains patterns in order
+        self._exact = dict(self.pattern_mappings)
+        self._suffix_sorted = tuple(sorted(
+            ((p, d) for p, d in self.pattern_mappings.items() if p.startswith('_')),
+            key=lambda item: -len(item[0])
+        ))
+        self._contains = tuple(
+            (p, d) for p, d in self.pattern_mappings.items() if not p.startswith('_')
+        )
+
     def _load_static_mappings(self) -> Dict[str, str]:
         """Load business mappings from schema manager."""
         try:
@@ -313,7 +449,7 @@ class BusinessLogicEnhancer:
 
             return mappings
         except (ImportError, AttributeError, KeyError) as e:
-            logger.debug(f"無法載入業務映射: {e}")
+            logger.debug("無法載入業務映射: %s", e)
             return {}
 
     def _get_generic_patterns(self) -> Dict[str, str]:
@@ -384,18 +520,20 @@ class BusinessLogicEnhancer:
         column_upper = column_name.upper()
 
         # Exact match first
-        if column_upper in self.pattern_mappings:
-            return self.pattern_mappings[column_upper]
-
-        # Pattern matching (suffix/contains)
-        for pattern, description in self.pattern_mappings.items():
-            if pattern.startswith('_') and column_upper.endswith(pattern):
-                # Suffix pattern like '_ID', '_NAME'
-                base_name = column_upper[:-len(pattern)]
+        description = self._exact.get(column_upper)
+        if description is not None:
+            return description
+
+        # Suffix patterns like '_ID', '_NAME' (longest suffix wins)
+        for suffix, description in self._suffix_sorted:
+            if column_upper.endswith(suffix):
+                base_name = column_upper[:-len(suffix)]
                 if base_name:
                     return f"{base_name.replace('_', '')}{description}"
-            elif not pattern.startswith('_') and pattern in column_upper:
-                # Contains pattern
+
+        # Contains patterns
+        for pattern, description in self._contains:
+            if pattern in column_upper:
                 return description
 
-        return None
\ No newline at end of file
+        return None
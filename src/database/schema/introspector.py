@@ -1,39 +1,681 @@
 """Database schema inspectors for different database types."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import defaultdict, namedtuple
+from functools import partial, wraps
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+import asyncio
 import logging
+import sys
+import time
+
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
 
 logger = logging.getLogger(__name__)
 
 
+class TTLCache:
+    """Minimal thread-safe TTL cache (key -> (expiry_monotonic, value))."""
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._data: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.hits += 1
+                    return entry[1]
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Tuple, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value for ttl seconds (defaults to the cache TTL)."""
+        with self._lock:
+            self._data[key] = (
+                time.monotonic() + (self.ttl if ttl is None else ttl),
+                value,
+            )
+
+    def invalidate(self, predicate: Optional[Callable[[Tuple], bool]] = None) -> None:
+        """Drop all entries, or only those whose key matches predicate."""
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if predicate(k)]:
+                    del self._data[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached result (and its row list) so callers can't mutate the cache."""
+    copied = dict(result)
+    for field in ("results", "dependencies"):
+        if isinstance(copied.get(field), list):
+            copied[field] = list(copied[field])
+    return copied
+
+
+def cached(method: Callable) -> Callable:
+    """Cache successful inspector results per (db_type, method, table_name, schema).
+
+    Callers always get a copy, so annotating a result (e.g. SchemaCache's
+    cache_source) never leaks back into this cache.
+    """
+
+    @wraps(method)
+    def wrapper(self, table_name: Optional[str] = None):
+        key = self._cache_key(method.__name__, table_name)
+        result = self._cache.get(key)
+        if result is not None:
+            return _copy_result(result)
+        result = method(self, table_name) if table_name is not None else method(self)
+        if result.get("success"):
+            self._cache.set(key, result)
+            return _copy_result(result)
+        return result
+
+    return wrapper
+
+
+# Result column names, in SELECT order; rows are zipped onto these instead of
+# building a dict literal per row.
+_MSSQL_TABLE_SCHEMA_COLUMNS = (
+    "COLUMN_NAME", "DATA_TYPE", "IS_NULLABLE", "COLUMN_DEFAULT",
+    "CHARACTER_MAXIMUM_LENGTH", "NUMERIC_PRECISION", "NUMERIC_SCALE",
+    "IS_PRIMARY_KEY", "REFERENCED_TABLE_NAME", "REFERENCED_COLUMN_NAME",
+    "COLUMN_COMMENT",
+)
+_PG_TABLE_SCHEMA_COLUMNS = (
+    "COLUMN_NAME", "DATA_TYPE", "IS_NULLABLE", "COLUMN_DEFAULT",
+    "CHARACTER_MAXIMUM_LENGTH", "NUMERIC_PRECISION", "NUMERIC_SCALE",
+    "IS_PRIMARY_KEY", "REFERENCED_TABLE", "REFERENCED_COLUMN", "COLUMN_COMMENT",
+)
+_DATABASE_SCHEMA_COLUMNS = ("TABLE_SCHEMA", "TABLE_NAME", "TABLE_TYPE", "TABLE_COMMENT")
+_DEPENDENCY_COLUMNS = (
+    "constraint_name", "parent_table", "parent_column",
+    "referenced_table", "referenced_column",
+)
+
+# Compact record type for streamed column rows (both backends); a namedtuple
+# is a single allocation per row instead of an 11-entry dict.
+ColumnRow = namedtuple("ColumnRow", _MSSQL_TABLE_SCHEMA_COLUMNS)
+
+
+# pyodbc parameter descriptors: one NVARCHAR(128) (sysname) per bound name.
+# Declaring them up front skips driver-side parameter discovery, and keeps
+# names of different lengths from compiling into separate server plans.
+_SYSNAME_INPUT = (pyodbc.SQL_WVARCHAR, 128, 0) if pyodbc is not None else None
+_TABLE_SCHEMA_INPUTS = [_SYSNAME_INPUT]
+_DEPENDENCIES_INPUTS = [_SYSNAME_INPUT]
+
+
+def _set_input_sizes(cursor, input_sizes: List[Tuple]) -> None:
+    """Apply a precomputed setinputsizes() list when running on pyodbc."""
+    if _SYSNAME_INPUT is not None:
+        cursor.setinputsizes(input_sizes)
+
+
+def _ident(value: Any) -> Any:
+    return value
+
+
+def _or_none(value: Any) -> Any:
+    return value or None
+
+
+def _interned(value: Any) -> Any:
+    # Low-cardinality strings (schemas, types, table names) repeat on every row;
+    # interning makes all rows share one object per distinct value.
+    return sys.intern(value) if type(value) is str else value
+
+
+# Per-column decoders, positionally aligned with the column tuples above.
+# IS_NULLABLE and IS_PRIMARY_KEY already arrive as 'YES'/'NO' from the queries.
+_TABLE_SCHEMA_DECODERS = (
+    _ident, _interned, _interned, _ident, _ident, _ident, _ident,
+    _interned, _interned, _ident, _or_none,
+)
+_DATABASE_SCHEMA_DECODERS = (_interned, _ident, _interned, _or_none)
+
+
+_FETCH_BATCH_SIZE = 1000
+
+
+def _iter_rows(cursor, batch_size: int = _FETCH_BATCH_SIZE) -> Iterator[Any]:
+    """Yield result rows fetched in batches instead of buffering via fetchall()."""
+    while True:
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            return
+        yield from batch
+
+
+def _compile_row_builder(decoders: Tuple[Callable[[Any], Any], ...],
+                         names: Optional[Tuple[str, ...]] = None,
+                         record_type: Optional[type] = None) -> Callable[[Any], Any]:
+    """Generate a straight-line row -> dict (or row -> record_type) function.
+
+    The generated body indexes each column once and calls its decoder
+    directly (identity decoders are inlined away), so the per-row cost is a
+    single call with no inner loop or zip.
+    """
+    namespace: Dict[str, Any] = {}
+    values = []
+    for i, decode in enumerate(decoders):
+        if decode is _ident:
+            values.append(f"row[{i}]")
+        else:
+            namespace[f"_d{i}"] = decode
+            values.append(f"_d{i}(row[{i}])")
+    if record_type is not None:
+        namespace["_record"] = record_type
+        body = f"_record({', '.join(values)})"
+    else:
+        body = (
+            "{"
+            + ", ".join(f"{name!r}: {value}" for name, value in zip(names, values))
+            + "}"
+        )
+    exec(f"def build(row):\n    return {body}\n", namespace)
+    return namespace["build"]
+
+
+_build_mssql_column = _compile_row_builder(
+    _TABLE_SCHEMA_DECODERS, names=_MSSQL_TABLE_SCHEMA_COLUMNS
+)
+_build_pg_column = _compile_row_builder(
+    _TABLE_SCHEMA_DECODERS, names=_PG_TABLE_SCHEMA_COLUMNS
+)
+_build_database_object = _compile_row_builder(
+    _DATABASE_SCHEMA_DECODERS, names=_DATABASE_SCHEMA_COLUMNS
+)
+_build_column_row = _compile_row_builder(_TABLE_SCHEMA_DECODERS, record_type=ColumnRow)
+_build_dependency = _compile_row_builder(
+    (_ident,) * len(_DEPENDENCY_COLUMNS), names=_DEPENDENCY_COLUMNS
+)
+
+
+# Query texts are module constants so every call sends byte-identical SQL and
+# the server-side plan cache is reused.
+
+# Single sys.columns pass over the tables/views with that name (in any schema,
+# like INFORMATION_SCHEMA.COLUMNS.TABLE_NAME = ?); PK, FK and MS_Description
+# lookups are joined on (object_id, column_id) instead of scanning whole catalogs
+_MSSQL_TABLE_SCHEMA_SQL = """
+    SELECT
+        c.name AS COLUMN_NAME,
+        ISNULL(TYPE_NAME(c.system_type_id), ty.name) AS DATA_TYPE,
+        CASE c.is_nullable WHEN 1 THEN 'YES' ELSE 'NO' END AS IS_NULLABLE,
+        OBJECT_DEFINITION(c.default_object_id) AS COLUMN_DEFAULT,
+        COLUMNPROPERTY(c.object_id, c.name, 'charmaxlen') AS CHARACTER_MAXIMUM_LENGTH,
+        CASE WHEN c.system_type_id IN (48, 52, 56, 59, 60, 62, 106, 108, 122, 127)
+            THEN c.precision END AS NUMERIC_PRECISION,
+        CASE WHEN c.system_type_id IN (48, 52, 56, 59, 60, 62, 106, 108, 122, 127)
+            THEN c.scale END AS NUMERIC_SCALE,
+        CASE WHEN pk.column_id IS NOT NULL THEN 'YES' ELSE 'NO' END AS IS_PRIMARY_KEY,
+        OBJECT_NAME(fkc.referenced_object_id) AS REFERENCED_TABLE_NAME,
+        COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id)
+            AS REFERENCED_COLUMN_NAME,
+        ep.value AS COLUMN_COMMENT
+    FROM sys.objects o
+    JOIN sys.columns c ON c.object_id = o.object_id
+    JOIN sys.types ty ON ty.user_type_id = c.user_type_id
+    LEFT JOIN (
+        SELECT ic.object_id, ic.column_id
+        FROM sys.index_columns ic
+        JOIN sys.indexes i ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+        WHERE i.is_primary_key = 1
+    ) pk ON pk.object_id = c.object_id AND pk.column_id = c.column_id
+    LEFT JOIN sys.foreign_key_columns fkc
+        ON fkc.parent_object_id = c.object_id AND fkc.parent_column_id = c.column_id
+    LEFT JOIN sys.extended_properties ep
+        ON ep.major_id = c.object_id AND ep.minor_id = c.column_id
+        AND ep.class = 1 AND ep.name = 'MS_Description'
+    WHERE o.name = ?
+    AND o.type IN ('U', 'V')
+    ORDER BY c.column_id
+"""
+
+# Same rows as INFORMATION_SCHEMA.TABLES (sys.objects of type U/V), with the
+# MS_Description joined directly on object_id instead of via a
+# sys.tables/sys.schemas derived table matched back by name
+_MSSQL_DATABASE_SCHEMA_SQL = """
+    SELECT
+        s.name as TABLE_SCHEMA,
+        o.name as TABLE_NAME,
+        CASE o.type WHEN 'U' THEN 'BASE TABLE' ELSE 'VIEW' END as TABLE_TYPE,
+        ep.value as TABLE_COMMENT
+    FROM sys.objects o
+    JOIN sys.schemas s ON s.schema_id = o.schema_id
+    LEFT JOIN sys.extended_properties ep
+        ON ep.major_id = o.object_id AND ep.minor_id = 0
+        AND ep.class = 1 AND ep.name = 'MS_Description'
+    WHERE o.type IN ('U', 'V')
+    ORDER BY s.name, o.name
+"""
+
+_MSSQL_TABLE_DEPENDENCIES_SELECT = """
+    SELECT
+        fk.name as constraint_name,
+        tp.name as parent_table,
+        cp.name as parent_column,
+        tr.name as referenced_table,
+        cr.name as referenced_column
+    FROM sys.foreign_keys fk
+    JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
+    JOIN sys.tables tp ON fkc.parent_object_id = tp.object_id
+    JOIN sys.columns cp
+        ON fkc.parent_object_id = cp.object_id AND fkc.parent_column_id = cp.column_id
+    JOIN sys.tables tr ON fkc.referenced_object_id = tr.object_id
+    JOIN sys.columns cr
+        ON fkc.referenced_object_id = cr.object_id
+        AND fkc.referenced_column_id = cr.column_id
+"""
+_MSSQL_TABLE_DEPENDENCIES_SQL = (
+    _MSSQL_TABLE_DEPENDENCIES_SELECT + "    WHERE tp.name = ?\n"
+)
+# SQL Server caps a statement at 2100 parameters
+_MSSQL_BULK_PARAM_LIMIT = 1000
+
+_MSSQL_SCHEMA_SUMMARY_SQL = """
+    SELECT
+        SUM(CASE WHEN TABLE_TYPE = 'BASE TABLE' THEN 1 ELSE 0 END) as tables,
+        SUM(CASE WHEN TABLE_TYPE = 'VIEW' THEN 1 ELSE 0 END) as views
+    FROM INFORMATION_SCHEMA.TABLES
+"""
+
+# Reads pg_catalog directly: the table is resolved once via to_regclass and
+# every lookup joins on (attrelid, attnum) instead of going through the
+# information_schema views. data_type and the information_schema._pg_* helpers
+# (fed the domain base type via _pg_truetypid/_pg_truetypmod) follow the
+# information_schema.columns definition, so arrays still report ARRAY and
+# enums/composites USER-DEFINED.
+_PG_TABLE_SCHEMA_SQL = """
+    SELECT
+        a.attname as column_name,
+        CASE WHEN t.typtype = 'd' THEN
+            CASE WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                 WHEN nbt.nspname = 'pg_catalog' THEN format_type(t.typbasetype, NULL)
+                 ELSE 'USER-DEFINED' END
+        ELSE
+            CASE WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                 WHEN nt.nspname = 'pg_catalog' THEN format_type(a.atttypid, NULL)
+                 ELSE 'USER-DEFINED' END
+        END as data_type,
+        CASE WHEN a.attnotnull OR (t.typtype = 'd' AND t.typnotnull)
+            THEN 'NO' ELSE 'YES' END as is_nullable,
+        pg_get_expr(ad.adbin, ad.adrelid) as column_default,
+        information_schema._pg_char_max_length(
+            information_schema._pg_truetypid(a, t),
+            information_schema._pg_truetypmod(a, t)
+        ) as character_maximum_length,
+        information_schema._pg_numeric_precision(
+            information_schema._pg_truetypid(a, t),
+            information_schema._pg_truetypmod(a, t)
+        ) as numeric_precision,
+        information_schema._pg_numeric_scale(
+            information_schema._pg_truetypid(a, t),
+            information_schema._pg_truetypmod(a, t)
+        ) as numeric_scale,
+        CASE WHEN pk.conname IS NOT NULL THEN 'YES' ELSE 'NO' END as is_primary_key,
+        rc.relname as foreign_table_name,
+        ra.attname as foreign_column_name,
+        d.description as column_comment
+    FROM pg_attribute a
+    JOIN pg_type t ON t.oid = a.atttypid
+    JOIN pg_namespace nt ON nt.oid = t.typnamespace
+    LEFT JOIN (pg_type bt JOIN pg_namespace nbt ON nbt.oid = bt.typnamespace)
+        ON t.typtype = 'd' AND bt.oid = t.typbasetype
+    LEFT JOIN pg_attrdef ad ON ad.adrelid = a.attrelid AND ad.adnum = a.attnum
+    LEFT JOIN pg_constraint pk
+        ON pk.conrelid = a.attrelid AND pk.contype = 'p' AND a.attnum = ANY(pk.conkey)
+    LEFT JOIN pg_constraint fk
+        ON fk.conrelid = a.attrelid AND fk.contype = 'f' AND a.attnum = ANY(fk.conkey)
+    LEFT JOIN pg_class rc ON rc.oid = fk.confrelid
+    LEFT JOIN pg_attribute ra
+        ON ra.attrelid = fk.confrelid
+        AND ra.attnum = fk.confkey[array_position(fk.conkey, a.attnum)]
+    LEFT JOIN pg_description d
+        ON d.objoid = a.attrelid AND d.classoid = 'pg_class'::regclass
+        AND d.objsubid = a.attnum
+    WHERE a.attrelid = to_regclass(format('%%I.%%I', %s, %s))
+    AND a.attnum > 0
+    AND NOT a.attisdropped
+    ORDER BY a.attnum
+"""
+
+_PG_DATABASE_SCHEMA_SQL = """
+    SELECT
+        t.table_schema,
+        t.table_name,
+        t.table_type,
+        d.description as table_comment
+    FROM information_schema.tables t
+    LEFT JOIN (
+        SELECT
+            n.nspname as table_schema,
+            c.relname as table_name,
+            d.description
+        FROM pg_class c
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        LEFT JOIN pg_description d ON d.objoid = c.oid AND d.objsubid = 0
+        WHERE n.nspname = %s
+        AND c.relkind IN ('r', 'v')
+    ) d ON t.table_schema = d.table_schema AND t.table_name = d.table_name
+    WHERE t.table_schema = %s
+    AND t.table_type IN ('BASE TABLE', 'VIEW')
+    ORDER BY t.table_name
+"""
+
+_PG_TABLE_DEPENDENCIES_SELECT = """
+    SELECT
+        tc.constraint_name,
+        tc.table_name as parent_table,
+        kcu.column_name as parent_column,
+        ccu.table_name as referenced_table,
+        ccu.column_name as referenced_column
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+        ON tc.constraint_name = kcu.constraint_name
+    JOIN information_schema.constraint_column_usage ccu
+        ON tc.constraint_name = ccu.constraint_name
+    WHERE tc.constraint_type = 'FOREIGN KEY'
+    AND tc.table_schema = %s
+"""
+_PG_TABLE_DEPENDENCIES_SQL = (
+    _PG_TABLE_DEPENDENCIES_SELECT + "    AND tc.table_name = %s\n"
+)
+# psycopg2 adapts a Python list to an ARRAY, so one statement covers any N
+_PG_TABLE_DEPENDENCIES_BULK_SQL = (
+    _PG_TABLE_DEPENDENCIES_SELECT + "    AND tc.table_name = ANY(%s)\n"
+)
+
+_PG_SCHEMA_SUMMARY_SQL = """
+    SELECT
+        COUNT(*) FILTER (WHERE table_type = 'BASE TABLE') as tables,
+        COUNT(*) FILTER (WHERE table_type = 'VIEW') as views
+    FROM information_schema.tables
+    WHERE table_schema = %s
+"""
+
+_MSSQL_SCHEMA_DIAGNOSTIC_SQL = """
+    SELECT
+        DB_NAME() as current_db,
+        COUNT(*) as total_tables
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE='BASE TABLE'
+"""
+
+
 class BaseSchemaInspector(ABC):
     """Abstract base class for database schema inspectors."""
 
     def __init__(self, connection_context, config):
         """Initialize with database connection context manager and config."""
+        # Each call opens its own connection and runs a single statement on one
+        # cursor, so there is nothing to reuse per connection; connect cost is
+        # covered by the ODBC driver manager's pooling (pyodbc) and by the
+        # TTL cache below, which keeps repeat calls off the database entirely.
         self.get_connection = connection_context
         self.config = config
+        self._cache = TTLCache(ttl=getattr(config, 'schema_cache_ttl', 60))
+        self._prewarm_stop = Event()
+        self._prewarm_thread: Optional[Thread] = None
+
+        prewarm_interval = getattr(config, 'schema_prewarm_interval', 0)
+        if prewarm_interval and prewarm_interval > 0:
+            self.start_prewarm(prewarm_interval)
+
+    def _cache_key(self, method_name: str, table_name: Optional[str] = None) -> Tuple:
+        return (
+            self.config.db_type,
+            method_name,
+            table_name,
+            getattr(self.config, 'schema', None),
+        )
+
+    def refresh_database_schema(self) -> Dict[str, Any]:
+        """Re-query the database-level schema and replace the cached copy in place.
+
+        The old entry stays readable until the new result is stored, so
+        foreground get_schema_info() calls never fall through to the database.
+        """
+        result = self._get_database_schema()
+        if result.get("success"):
+            self._cache.set(self._cache_key("get_schema_info"), result)
+        return result
+
+    def start_prewarm(self, interval: float) -> None:
+        """Refresh the database-level schema now and then every interval seconds."""
+        if self._prewarm_thread is not None:
+            return
+        # Each refresher gets its own stop event: a stopped thread that is still
+        # finishing a refresh must not be revived by a later start_prewarm()
+        self._prewarm_stop = Event()
+        self._prewarm_thread = Thread(
+            target=self._prewarm_loop,
+            args=(interval, self._prewarm_stop),
+            name="schema-prewarm",
+            daemon=True,
+        )
+        self._prewarm_thread.start()
+
+    def stop_prewarm(self) -> None:
+        """Stop the background refresher started by start_prewarm()."""
+        self._prewarm_stop.set()
+        self._prewarm_thread = None
+
+    def _prewarm_loop(self, interval: float, stop: Event) -> None:
+        while not stop.is_set():
+            try:
+                self.refresh_database_schema()
+            except Exception as e:
+                logger.warning("Schema prewarm failed: %s", e)
+            stop.wait(interval)
+
+    def invalidate_schema_cache(self, table_name: Optional[str] = None) -> None:
+        """Flush cached inspector results (e.g. after DDL), optionally for one table."""
+        if table_name is None:
+            self._cache.invalidate()
+        else:
+            table_name_upper = table_name.upper()
+            self._cache.invalidate(
+                lambda key: key[2] is not None and key[2].upper() == table_name_upper
+            )
 
     @abstractmethod
     def get_schema_info(self, table_name: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive database schema information."""
         pass
 
+    def _get_database_schema(self) -> Dict[str, Any]:
+        """Query the overview of all database objects (uncached).
+
+        Falls back to get_schema_info(), bypassing the inspector cache when
+        it is @cached; backends override this with their own query.
+        """
+        get_schema_info = type(self).get_schema_info
+        return getattr(get_schema_info, "__wrapped__", get_schema_info)(self)
+
     @abstractmethod
     def get_table_dependencies(self, table_name: str) -> Dict[str, Any]:
         """Get table dependencies (foreign keys, referenced by)."""
         pass
 
+    def _fetch_dependencies_bulk(
+        self, table_names: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Query dependencies for several tables at once, grouped by requested name.
+
+        Falls back to one get_table_dependencies() call per table; backends
+        override this with a single query.
+        """
+        dependencies = {}
+        for table_name in table_names:
+            result = self.get_table_dependencies(table_name)
+            if not result.get("success"):
+                raise RuntimeError(result.get("error", "dependencies query failed"))
+            dependencies[table_name] = result.get("dependencies", [])
+        return dependencies
+
+    def get_table_dependencies_bulk(self, table_names: List[str]) -> Dict[str, Any]:
+        """Get dependencies for several tables in one round-trip.
+
+        Tables already in the TTL cache are served from it; the rest are fetched
+        together and cached individually, so later get_table_dependencies()
+        calls hit the cache too.
+        """
+        dependencies: Dict[str, List[Dict[str, Any]]] = {}
+        missing = []
+        for table_name in table_names:
+            hit = self._cache.get(self._cache_key("get_table_dependencies", table_name))
+            if hit is not None:
+                dependencies[table_name] = list(hit["dependencies"])
+            else:
+                missing.append(table_name)
+
+        if missing:
+            try:
+                fetched = self._fetch_dependencies_bulk(missing)
+            except Exception as e:
+                logger.error("Bulk dependencies query error: %s", e)
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "table_names": list(table_names),
+                }
+            for table_name in missing:
+                deps = fetched.get(table_name, [])
+                self._cache.set(
+                    self._cache_key("get_table_dependencies", table_name),
+                    {"success": True, "table_name": table_name, "dependencies": deps},
+                )
+                dependencies[table_name] = list(deps)
+
+        return {
+            "success": True,
+            "dependencies": {
+                table_name: dependencies[table_name] for table_name in table_names
+            },
+        }
+
+    def iter_table_columns(self, table_name: str) -> Iterator[ColumnRow]:
+        """Stream a table's columns as ColumnRow records without building dicts.
+
+        Falls back to get_schema_info(table_name), whose column dicts list
+        their fields in ColumnRow order; backends override this to stream
+        rows from the cursor instead.
+        """
+        result = self.get_schema_info(table_name)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "table schema query failed"))
+        for column in result["results"]:
+            yield ColumnRow._make(column.values())
+
+    def iter_database_schema(self) -> Iterator[Dict[str, Any]]:
+        """Stream database objects one at a time without building the full list.
+
+        Falls back to iterating get_schema_info(); backends override this to
+        stream rows from the cursor instead.
+        """
+        result = self.get_schema_info()
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "schema query failed"))
+        yield from result["results"]
+
     @abstractmethod
     def get_schema_summary(self) -> Dict[str, Any]:
         """Get a high-level summary of the database schema."""
         pass
 
+    def _summary_from_counts(self, tables: int, views: int) -> Optional[Dict[str, Any]]:
+        """Build the backend-specific get_schema_summary() result.
+
+        Returns None by default: without a backend-specific shape the summary
+        is not primed and get_schema_summary() queries as usual.
+        """
+        return None
+
+    def _prime_summary(self, objects: List[Dict[str, Any]]) -> None:
+        """Cache get_schema_summary() from a database listing.
+
+        The listing covers the same objects the summary counts, so the
+        summary's own round-trip can be skipped while the listing is fresh.
+        """
+        tables = views = 0
+        for obj in objects:
+            if obj["TABLE_TYPE"] == "VIEW":
+                views += 1
+            else:
+                tables += 1
+        summary = self._summary_from_counts(tables, views)
+        if summary is not None:
+            self._cache.set(self._cache_key("get_schema_summary"), summary)
+
+    async def _run_in_thread(self, func: Callable, *args) -> Dict[str, Any]:
+        """Run a blocking inspector call in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args))
+
+    async def get_schema_info_async(
+        self, table_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of get_schema_info (runs in a worker thread)."""
+        return await self._run_in_thread(self.get_schema_info, table_name)
+
+    async def get_table_dependencies_async(self, table_name: str) -> Dict[str, Any]:
+        """Async variant of get_table_dependencies (runs in a worker thread)."""
+        return await self._run_in_thread(self.get_table_dependencies, table_name)
+
+    async def get_schema_summary_async(self) -> Dict[str, Any]:
+        """Async variant of get_schema_summary (runs in a worker thread)."""
+        return await self._run_in_thread(self.get_schema_summary)
+
+    async def get_schema_snapshot_async(
+        self, table_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the independent schema probes concurrently.
+
+        Each probe opens its own connection, so wall time is roughly the slowest
+        probe rather than the sum. Returns {"schema_info", "summary"} plus
+        "dependencies" when table_name is given.
+        """
+        probes = {
+            "schema_info": self.get_schema_info_async(table_name),
+            "summary": self.get_schema_summary_async(),
+        }
+        if table_name:
+            probes["dependencies"] = self.get_table_dependencies_async(table_name)
+        results = await asyncio.gather(*probes.values())
+        return dict(zip(probes, results))
+
 
 class MSSQLSchemaInspector(BaseSchemaInspector):
     """SQL Server schema inspector implementation."""
 
+    @cached
     def get_schema_info(self, table_name: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive SQL Server schema information."""
         if table_name:
@@ -47,75 +689,10 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
-                # SQL Server specific query for table columns with extended properties (comments)
-                query = """
-                SELECT
-                    c.COLUMN_NAME,
-                    c.DATA_TYPE,
-                    c.IS_NULLABLE,
-                    c.COLUMN_DEFAULT,
-                    c.CHARACTER_MAXIMUM_LENGTH,
-                    c.NUMERIC_PRECISION,
-                    c.NUMERIC_SCALE,
-                    pk.IS_PRIMARY_KEY,
-                    fk.REFERENCED_TABLE_NAME,
-                    fk.REFERENCED_COLUMN_NAME,
-                    ep.value as COLUMN_COMMENT
-                FROM INFORMATION_SCHEMA.COLUMNS c
-                LEFT JOIN (
-                    SELECT ku.COLUMN_NAME, 1 as IS_PRIMARY_KEY
-                    FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                    JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE ku
-                        ON tc.CONSTRAINT_NAME = ku.CONSTRAINT_NAME
-                    WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-                    AND tc.TABLE_NAME = ?
-                ) pk ON c.COLUMN_NAME = pk.COLUMN_NAME
-                LEFT JOIN (
-                    SELECT
-                        cp.name as COLUMN_NAME,
-                        tr.name as REFERENCED_TABLE_NAME,
-                        cr.name as REFERENCED_COLUMN_NAME
-                    FROM sys.foreign_keys fk
-                    JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
-                    JOIN sys.tables tp ON fkc.parent_object_id = tp.object_id
-                    JOIN sys.columns cp ON fkc.parent_object_id = cp.object_id AND fkc.parent_column_id = cp.column_id
-                    JOIN sys.tables tr ON fkc.referenced_object_id = tr.object_id
-                    JOIN sys.columns cr ON fkc.referenced_object_id = cr.object_id AND fkc.referenced_column_id = cr.column_id
-                    WHERE tp.name = ?
-                ) fk ON c.COLUMN_NAME = fk.COLUMN_NAME
-                LEFT JOIN (
-                    SELECT
-                        t.name as TABLE_NAME,
-                        col.name as COLUMN_NAME,
-                        ep.value
-                    FROM sys.tables t
-                    JOIN sys.columns col ON t.object_id = col.object_id
-                    JOIN sys.extended_properties ep ON ep.major_id = t.object_id AND ep.minor_id = col.column_id
-                    WHERE ep.name = 'MS_Description' AND t.name = ?
-                ) ep ON c.TABLE_NAME = ep.TABLE_NAME AND c.COLUMN_NAME = ep.COLUMN_NAME
-                WHERE c.TABLE_NAME = ?
-                ORDER BY c.ORDINAL_POSITION
-                """
-
-                cursor.execute(query, (table_name, table_name, table_name, table_name))
+                self._execute_table_schema(cursor, table_name)
                 rows = cursor.fetchall()
 
-                columns = []
-                for row in rows:
-                    column = {
-                        "COLUMN_NAME": row[0],
-                        "DATA_TYPE": row[1],
-                        "IS_NULLABLE": "YES" if row[2] == "YES" else "NO",
-                        "COLUMN_DEFAULT": row[3],
-                        "CHARACTER_MAXIMUM_LENGTH": row[4],
-                        "NUMERIC_PRECISION": row[5],
-                        "NUMERIC_SCALE": row[6],
-                        "IS_PRIMARY_KEY": "YES" if bool(row[7]) else "NO",
-                        "REFERENCED_TABLE_NAME": row[8],
-                        "REFERENCED_COLUMN_NAME": row[9],
-                        "COLUMN_COMMENT": row[10] if row[10] else None
-                    }
-                    columns.append(column)
+                columns = list(map(_build_mssql_column, rows))
 
                 return {
                     "success": True,
@@ -138,52 +715,25 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
             with self.get_connection() as conn:
                 cursor = conn.cursor()
 
-                # 診斷: 檢查當前資料庫和表格總數
-                cursor.execute("""
-                    SELECT
-                        DB_NAME() as current_db,
-                        COUNT(*) as total_tables
-                    FROM INFORMATION_SCHEMA.TABLES
-                    WHERE TABLE_TYPE='BASE TABLE'
-                """)
-                diag = cursor.fetchone()
-                logger.info(f"[SQL-DEBUG] Current DB: {diag[0]}, Total BASE TABLES: {diag[1]}")
-
                 # Get all tables and views with comments
-                query = """
-                SELECT
-                    t.TABLE_SCHEMA,
-                    t.TABLE_NAME,
-                    t.TABLE_TYPE,
-                    ep.value as TABLE_COMMENT
-                FROM INFORMATION_SCHEMA.TABLES t
-                LEFT JOIN (
-                    SELECT
-                        s.name as TABLE_SCHEMA,
-                        tb.name as TABLE_NAME,
-                        ep.value
-                    FROM sys.tables tb
-                    JOIN sys.schemas s ON tb.schema_id = s.schema_id
-                    LEFT JOIN sys.extended_properties ep ON ep.major_id = tb.object_id AND ep.minor_id = 0
-                    WHERE ep.name = 'MS_Description'
-                ) ep ON t.TABLE_SCHEMA = ep.TABLE_SCHEMA AND t.TABLE_NAME = ep.TABLE_NAME
-                WHERE t.TABLE_TYPE IN ('BASE TABLE', 'VIEW')
-                ORDER BY t.TABLE_SCHEMA, t.TABLE_NAME
-                """
-
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                logger.info(f"[SQL-DEBUG] Schema query returned {len(rows)} rows")
-
-                tables = []
-                for row in rows:
-                    table = {
-                        "TABLE_SCHEMA": row[0],
-                        "TABLE_NAME": row[1],
-                        "TABLE_TYPE": row[2],
-                        "TABLE_COMMENT": row[3] if row[3] else None
-                    }
-                    tables.append(table)
+                debug_schema = getattr(self.config, 'debug_schema', False)
+                if logger.isEnabledFor(logging.INFO) and debug_schema:
+                    # 診斷: 當前資料庫和表格總數，與主查詢合併為單一批次（一次往返）
+                    cursor.execute(
+                        _MSSQL_SCHEMA_DIAGNOSTIC_SQL + ";" + _MSSQL_DATABASE_SCHEMA_SQL
+                    )
+                    diag = cursor.fetchone()
+                    logger.info(
+                        "[SQL-DEBUG] Current DB: %s, Total BASE TABLES: %s",
+                        diag[0],
+                        diag[1],
+                    )
+                    cursor.nextset()
+                else:
+                    cursor.execute(_MSSQL_DATABASE_SCHEMA_SQL)
+                tables = list(map(_build_database_object, _iter_rows(cursor)))
+                logger.debug("[SQL-DEBUG] Schema query returned %d rows", len(tables))
+                self._prime_summary(tables)
 
                 return {
                     "success": True,
@@ -200,6 +750,25 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
                 "database_type": "mssql"
             }
 
+    def _execute_table_schema(self, cursor, table_name: str) -> None:
+        _set_input_sizes(cursor, _TABLE_SCHEMA_INPUTS)
+        cursor.execute(_MSSQL_TABLE_SCHEMA_SQL, (table_name,))
+
+    def iter_table_columns(self, table_name: str) -> Iterator[ColumnRow]:
+        """Stream SQL Server table columns as ColumnRow records (uncached)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            self._execute_table_schema(cursor, table_name)
+            yield from map(_build_column_row, _iter_rows(cursor))
+
+    def iter_database_schema(self) -> Iterator[Dict[str, Any]]:
+        """Stream SQL Server database objects one dict at a time (uncached)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_MSSQL_DATABASE_SCHEMA_SQL)
+            yield from map(_build_database_object, _iter_rows(cursor))
+
+    @cached
     def get_table_dependencies(self, table_name: str) -> Dict[str, Any]:
         """Get SQL Server table dependencies."""
         try:
@@ -207,37 +776,14 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
                 cursor = conn.cursor()
 
                 # Foreign key dependencies
-                query = """
-                SELECT
-                    fk.name as constraint_name,
-                    tp.name as parent_table,
-                    cp.name as parent_column,
-                    tr.name as referenced_table,
-                    cr.name as referenced_column
-                FROM sys.foreign_keys fk
-                JOIN sys.foreign_key_columns fkc ON fk.object_id = fkc.constraint_object_id
-                JOIN sys.tables tp ON fkc.parent_object_id = tp.object_id
-                JOIN sys.columns cp ON fkc.parent_object_id = cp.object_id AND fkc.parent_column_id = cp.column_id
-                JOIN sys.tables tr ON fkc.referenced_object_id = tr.object_id
-                JOIN sys.columns cr ON fkc.referenced_object_id = cr.object_id AND fkc.referenced_column_id = cr.column_id
-                WHERE tp.name = ?
-                """
-
-                cursor.execute(query, (table_name,))
+                _set_input_sizes(cursor, _DEPENDENCIES_INPUTS)
+                cursor.execute(_MSSQL_TABLE_DEPENDENCIES_SQL, (table_name,))
                 dependencies = cursor.fetchall()
 
                 return {
                     "success": True,
                     "table_name": table_name,
-                    "dependencies": [
-                        {
-                            "constraint_name": dep[0],
-                            "parent_table": dep[1],
-                            "parent_column": dep[2],
-                            "referenced_table": dep[3],
-                            "referenced_column": dep[4]
-                        } for dep in dependencies
-                    ]
+                    "dependencies": list(map(_build_dependency, dependencies))
                 }
 
         except Exception as e:
@@ -248,6 +794,39 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
                 "table_name": table_name
             }
 
+    def _fetch_dependencies_bulk(
+        self, table_names: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        # Default SQL Server collations are case-insensitive: group by upper-cased name
+        grouped = defaultdict(list)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            for i in range(0, len(table_names), _MSSQL_BULK_PARAM_LIMIT):
+                chunk = table_names[i:i + _MSSQL_BULK_PARAM_LIMIT]
+                _set_input_sizes(cursor, [_SYSNAME_INPUT] * len(chunk))
+                cursor.execute(
+                    _MSSQL_TABLE_DEPENDENCIES_SELECT
+                    + "    WHERE tp.name IN (%s)\n" % ", ".join("?" * len(chunk)),
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    grouped[row[1].upper()].append(_build_dependency(row))
+        return {
+            table_name: grouped.get(table_name.upper(), [])
+            for table_name in table_names
+        }
+
+    def _summary_from_counts(self, tables: int, views: int) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "database_type": "mssql",
+            "tables": tables,
+            "views": views,
+            "procedures": 0,
+            "functions": 0
+        }
+
+    @cached
     def get_schema_summary(self) -> Dict[str, Any]:
         """Get SQL Server schema summary."""
         try:
@@ -255,37 +834,11 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
                 cursor = conn.cursor()
 
                 # Count objects
-                query = """
-                SELECT
-                    'Tables' as object_type,
-                    COUNT(*) as count
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                UNION ALL
-                SELECT
-                    'Views' as object_type,
-                    COUNT(*) as count
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'VIEW'
-                """
-
-                cursor.execute(query)
-                results = cursor.fetchall()
-
-                summary = {"success": True, "database_type": "mssql"}
-                for row in results:
-                    if row[0] == 'Tables':
-                        summary["tables"] = row[1]
-                    elif row[0] == 'Views':
-                        summary["views"] = row[1]
-
-                # Set defaults for missing values
-                summary.setdefault("tables", 0)
-                summary.setdefault("views", 0)
-                summary.setdefault("procedures", 0)
-                summary.setdefault("functions", 0)
-
-                return summary
+                cursor.execute(_MSSQL_SCHEMA_SUMMARY_SQL)
+                row = cursor.fetchone()
+
+                # SUM over an empty catalog yields NULL
+                return self._summary_from_counts(row[0] or 0, row[1] or 0)
 
         except Exception as e:
             logger.error(f"SQL Server schema summary error: {e}")
@@ -299,6 +852,7 @@ class MSSQLSchemaInspector(BaseSchemaInspector):
 class PostgreSQLSchemaInspector(BaseSchemaInspector):
     """PostgreSQL schema inspector implementation."""
 
+    @cached
     def get_schema_info(self, table_name: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive PostgreSQL schema information."""
         if table_name:
@@ -311,81 +865,10 @@ class PostgreSQLSchemaInspector(BaseSchemaInspector):
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # PostgreSQL specific query for table columns with comments
-                    query = """
-                    SELECT
-                        c.column_name,
-                        c.data_type,
-                        c.is_nullable,
-                        c.column_default,
-                        c.character_maximum_length,
-                        c.numeric_precision,
-                        c.numeric_scale,
-                        CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as is_primary_key,
-                        fk.foreign_table_name,
-                        fk.foreign_column_name,
-                        pgd.description as column_comment
-                    FROM information_schema.columns c
-                    LEFT JOIN (
-                        SELECT ku.column_name
-                        FROM information_schema.table_constraints tc
-                        JOIN information_schema.key_column_usage ku
-                            ON tc.constraint_name = ku.constraint_name
-                        WHERE tc.constraint_type = 'PRIMARY KEY'
-                        AND tc.table_name = %s
-                        AND tc.table_schema = %s
-                    ) pk ON c.column_name = pk.column_name
-                    LEFT JOIN (
-                        SELECT
-                            kcu.column_name,
-                            ccu.table_name as foreign_table_name,
-                            ccu.column_name as foreign_column_name
-                        FROM information_schema.referential_constraints rc
-                        JOIN information_schema.key_column_usage kcu
-                            ON rc.constraint_name = kcu.constraint_name
-                        JOIN information_schema.constraint_column_usage ccu
-                            ON rc.unique_constraint_name = ccu.constraint_name
-                        WHERE kcu.table_name = %s
-                        AND kcu.table_schema = %s
-                    ) fk ON c.column_name = fk.column_name
-                    LEFT JOIN (
-                        SELECT
-                            a.attname as column_name,
-                            d.description
-                        FROM pg_class t
-                        JOIN pg_namespace n ON t.relnamespace = n.oid
-                        JOIN pg_attribute a ON a.attrelid = t.oid
-                        LEFT JOIN pg_description d ON d.objoid = t.oid AND d.objsubid = a.attnum
-                        WHERE t.relname = %s
-                        AND n.nspname = %s
-                        AND a.attnum > 0
-                        AND NOT a.attisdropped
-                    ) pgd ON c.column_name = pgd.column_name
-                    WHERE c.table_name = %s
-                    AND c.table_schema = %s
-                    ORDER BY c.ordinal_position
-                    """
-
-                    schema = self.config.schema
-                    cursor.execute(query, (table_name, schema, table_name, schema, table_name, schema, table_name, schema))
+                    self._execute_table_schema(cursor, table_name)
                     rows = cursor.fetchall()
 
-                    columns = []
-                    for row in rows:
-                        column = {
-                            "COLUMN_NAME": row[0],
-                            "DATA_TYPE": row[1],
-                            "IS_NULLABLE": "YES" if row[2] == "YES" else "NO",
-                            "COLUMN_DEFAULT": row[3],
-                            "CHARACTER_MAXIMUM_LENGTH": row[4],
-                            "NUMERIC_PRECISION": row[5],
-                            "NUMERIC_SCALE": row[6],
-                            "IS_PRIMARY_KEY": "YES" if row[7] else "NO",
-                            "REFERENCED_TABLE": row[8],
-                            "REFERENCED_COLUMN": row[9],
-                            "COLUMN_COMMENT": row[10] if row[10] else None
-                        }
-                        columns.append(column)
+                    columns = list(map(_build_pg_column, rows))
 
                     return {
                         "success": True,
@@ -408,41 +891,12 @@ class PostgreSQLSchemaInspector(BaseSchemaInspector):
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
                     # Get all tables and views with comments
-                    query = """
-                    SELECT
-                        t.table_schema,
-                        t.table_name,
-                        t.table_type,
-                        d.description as table_comment
-                    FROM information_schema.tables t
-                    LEFT JOIN (
-                        SELECT
-                            n.nspname as table_schema,
-                            c.relname as table_name,
-                            d.description
-                        FROM pg_class c
-                        JOIN pg_namespace n ON c.relnamespace = n.oid
-                        LEFT JOIN pg_description d ON d.objoid = c.oid AND d.objsubid = 0
-                        WHERE n.nspname = %s
-                        AND c.relkind IN ('r', 'v')
-                    ) d ON t.table_schema = d.table_schema AND t.table_name = d.table_name
-                    WHERE t.table_schema = %s
-                    AND t.table_type IN ('BASE TABLE', 'VIEW')
-                    ORDER BY t.table_name
-                    """
-
-                    cursor.execute(query, (self.config.schema, self.config.schema))
-                    rows = cursor.fetchall()
-
-                    tables = []
-                    for row in rows:
-                        table = {
-                            "TABLE_SCHEMA": row[0],
-                            "TABLE_NAME": row[1],
-                            "TABLE_TYPE": row[2],
-                            "TABLE_COMMENT": row[3] if row[3] else None
-                        }
-                        tables.append(table)
+                    cursor.execute(
+                        _PG_DATABASE_SCHEMA_SQL,
+                        (self.config.schema, self.config.schema),
+                    )
+                    tables = list(map(_build_database_object, _iter_rows(cursor)))
+                    self._prime_summary(tables)
 
                     return {
                         "success": True,
@@ -459,44 +913,51 @@ class PostgreSQLSchemaInspector(BaseSchemaInspector):
                 "database_type": "postgresql"
             }
 
+    def _execute_table_schema(self, cursor, table_name: str) -> None:
+        cursor.execute(_PG_TABLE_SCHEMA_SQL, (self.config.schema, table_name))
+
+    def iter_table_columns(self, table_name: str) -> Iterator[ColumnRow]:
+        """Stream PostgreSQL table columns as ColumnRow records (uncached).
+
+        Field names follow the SQL Server result (REFERENCED_TABLE_NAME /
+        REFERENCED_COLUMN_NAME) so both backends yield the same record type.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                self._execute_table_schema(cursor, table_name)
+                yield from map(_build_column_row, _iter_rows(cursor))
+
+    def iter_database_schema(self) -> Iterator[Dict[str, Any]]:
+        """Stream PostgreSQL database objects one dict at a time (uncached).
+
+        Uses a named (server-side) cursor so the server does not materialize
+        the whole result set either.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor(name="schema_stream") as cursor:
+                # Iterating a named cursor fetches itersize rows per round-trip in C
+                cursor.itersize = _FETCH_BATCH_SIZE
+                cursor.execute(
+                    _PG_DATABASE_SCHEMA_SQL, (self.config.schema, self.config.schema)
+                )
+                yield from map(_build_database_object, cursor)
+
+    @cached
     def get_table_dependencies(self, table_name: str) -> Dict[str, Any]:
         """Get PostgreSQL table dependencies."""
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
                     # Foreign key dependencies
-                    query = """
-                    SELECT
-                        tc.constraint_name,
-                        tc.table_name as parent_table,
-                        kcu.column_name as parent_column,
-                        ccu.table_name as referenced_table,
-                        ccu.column_name as referenced_column
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage kcu
-                        ON tc.constraint_name = kcu.constraint_name
-                    JOIN information_schema.constraint_column_usage ccu
-                        ON tc.constraint_name = ccu.constraint_name
-                    WHERE tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_name = %s
-                    AND tc.table_schema = %s
-                    """
-
-                    cursor.execute(query, (table_name, self.config.schema))
+                    cursor.execute(
+                        _PG_TABLE_DEPENDENCIES_SQL, (self.config.schema, table_name)
+                    )
                     dependencies = cursor.fetchall()
 
                     return {
                         "success": True,
                         "table_name": table_name,
-                        "dependencies": [
-                            {
-                                "constraint_name": dep[0],
-                                "parent_table": dep[1],
-                                "parent_column": dep[2],
-                                "referenced_table": dep[3],
-                                "referenced_column": dep[4]
-                            } for dep in dependencies
-                        ]
+                        "dependencies": list(map(_build_dependency, dependencies))
                     }
 
         except Exception as e:
@@ -507,40 +968,38 @@ class PostgreSQLSchemaInspector(BaseSchemaInspector):
                 "table_name": table_name
             }
 
+    def _fetch_dependencies_bulk(
+        self, table_names: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        grouped = defaultdict(list)
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    _PG_TABLE_DEPENDENCIES_BULK_SQL,
+                    (self.config.schema, list(table_names)),
+                )
+                for row in cursor.fetchall():
+                    grouped[row[1]].append(_build_dependency(row))
+        return {table_name: grouped.get(table_name, []) for table_name in table_names}
+
+    def _summary_from_counts(self, tables: int, views: int) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "database_type": "postgresql",
+            "summary": {"Tables": tables, "Views": views}
+        }
+
+    @cached
     def get_schema_summary(self) -> Dict[str, Any]:
         """Get PostgreSQL schema summary."""
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
                     # Count objects
-                    query = """
-                    SELECT
-                        'Tables' as object_type,
-                        COUNT(*) as count
-                    FROM information_schema.tables
-                    WHERE table_schema = %s
-                    AND table_type = 'BASE TABLE'
-                    UNION ALL
-                    SELECT
-                        'Views' as object_type,
-                        COUNT(*) as count
-                    FROM information_schema.tables
-                    WHERE table_schema = %s
-                    AND table_type = 'VIEW'
-                    """
-
-                    cursor.execute(query, (self.config.schema, self.config.schema))
-                    results = cursor.fetchall()
-
-                    summary = {}
-                    for row in results:
-                        summary[row[0]] = row[1]
+                    cursor.execute(_PG_SCHEMA_SUMMARY_SQL, (self.config.schema,))
+                    row = cursor.fetchone()
 
-                    return {
-                        "success": True,
-                        "database_type": "postgresql",
-                        "summary": summary
-                    }
+                    return self._summary_from_counts(row[0], row[1])
 
         except Exception as e:
             logger.error(f"PostgreSQL schema summary error: {e}")
@@ -551,11 +1010,20 @@ class PostgreSQLSchemaInspector(BaseSchemaInspector):
             }
 
 
+_INSPECTORS: Dict[str, Type[BaseSchemaInspector]] = {
+    "postgresql": PostgreSQLSchemaInspector,
+    "mssql": MSSQLSchemaInspector,
+}
+
+
+def register_inspector(db_type: str, inspector_cls: Type[BaseSchemaInspector]) -> None:
+    """Register a schema inspector class for a database type."""
+    _INSPECTORS[db_type] = inspector_cls
+
+
 def create_schema_inspector(connection_context, config) -> BaseSchemaInspector:
     """Factory function to create appropriate schema inspector."""
-    if config.db_type == "postgresql":
-        return PostgreSQLSchemaInspector(connection_context, config)
-    elif config.db_type == "mssql":
-        return MSSQLSchemaInspector(connection_context, config)
-    else:
-        raise ValueError(f"Unsupported database type: {config.db_type}")
\ No newline at end of file
+    inspector_cls = _INSPECTORS.get(config.db_type)
+    if inspector_cls is None:
+        raise ValueError(f"Unsupported database type: {config.db_type}")
+    return inspector_cls(connection_context, config)
\ No newline at end of file
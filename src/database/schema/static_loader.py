@@ -3,15 +3,122 @@
 基於 JSON 配置系統的高效能 Schema 管理器
 """
 
+import hashlib
 import json
 import os
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, cast
 import logging
 
+# Python 3.11 起 sre_parse 已棄用，改名為 re._parser
+try:
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import ijson  # type: ignore[import-not-found]
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+        return text.encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# 已解析配置的磁碟快取格式版本（快取內容結構變更時遞增，舊快取即失效）
+_DISK_CACHE_VERSION = 1
+
+# 合併所有表格配置的 JSONL 清單檔名（每行一個表格配置）
+_TABLES_MANIFEST_NAME = 'tables.jsonl'
+
+# 超過此大小的頂層配置檔改以 ijson 串流解析（不先讀入整個檔案）
+_STREAM_PARSE_THRESHOLD = 2 * 1024 * 1024
+
+# 平行載入表格配置的最大執行緒數
+_MAX_LOAD_WORKERS = 32
+
+# 表格 Schema 自配置複製的純量欄位及其預設值
+_TABLE_SCHEMA_DEFAULTS = (
+    ('type', 'TABLE'),
+    ('category', 'unknown'),
+    ('business_importance', 'medium'),
+)
+
+# 表格 Schema 自配置複製的區段（預設為空字典）
+_TABLE_SCHEMA_SECTIONS = ('relationships', 'business_logic', 'ai_context')
+
+def _intern_upper(name: str) -> str:
+    """大寫並 intern 表格名稱（字典鍵比對先比較指標，重複名稱共用同一物件）"""
+    return sys.intern(name.upper())
+
+
+def _load_json(file_path: Path) -> Any:
+    """一次讀取檔案位元組並解析 JSON（有安裝 orjson 時使用 orjson）"""
+    return _json_loads(file_path.read_bytes())
+
+
+def _load_config_file(file_path: Path) -> Any:
+    """載入頂層配置檔；大型檔案在有安裝 ijson 時串流解析，峰值記憶體不含整份原始內容"""
+    if ijson is not None and file_path.stat().st_size > _STREAM_PARSE_THRESHOLD:
+        with open(file_path, 'rb') as f:
+            return next(ijson.items(f, '', use_float=True))
+    return _load_json(file_path)
+
+
+def _disk_cache_dir() -> Path:
+    """磁碟快取目錄：使用者私有的快取目錄（$XDG_CACHE_HOME 或 ~/.cache 下的 mcp-db）"""
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mcp-db'
+
+
+def _has_group_reference(pattern: str) -> bool:
+    """模式是否含反向參照（\\1、(?P=name)、(?(1)...)），合併後群組編號會位移"""
+    def walk(node: Any) -> bool:
+        if isinstance(node, _sre_parse.SubPattern):
+            return any(
+                op in (_sre_parse.GROUPREF, _sre_parse.GROUPREF_EXISTS) or walk(av)
+                for op, av in node
+            )
+        if isinstance(node, (tuple, list)):
+            return any(walk(item) for item in node)
+        return False
+
+    return walk(_sre_parse.parse(pattern))
+
+
+def _fuse_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    將所有模式合併為單一正則（一次 C 層級比對取代逐一比對）
+
+    每個模式包在自欄位開頭起算的 lookahead 中，並依序排列：re 會按順序嘗試
+    分支，因此保留「第一個符合的模式生效」的語意（單純的 p0|p1 會改為
+    「最左邊位置的匹配生效」）。命中的模式由 lastgroup (g<索引>) 取得。
+    含反向參照或自訂群組等無法合併的模式時返回 None。
+    """
+    if not patterns or any(map(_has_group_reference, patterns)):
+        return None
+    fused = '|'.join(
+        f'(?P<g{i}>(?=.*?(?:{pattern})))' for i, pattern in enumerate(patterns)
+    )
+    try:
+        return re.compile(f'(?:{fused})', re.IGNORECASE | re.DOTALL)
+    except re.error:
+        return None
+
 
 class SchemaConfigManager:
     """
@@ -19,7 +126,20 @@ class SchemaConfigManager:
     特點：快取、延遲載入、智能錯誤處理
     """
 
-    def __init__(self, base_path: Optional[str] = None):
+    __slots__ = (
+        'eager', 'base_path', 'config_path',
+        '_configs_cache', '_table_schemas_cache',
+        '_compiled_global_patterns', '_fused_global_pattern',
+        '_all_tables_cache', '_summary_cache', '_loaded',
+    )
+
+    def __init__(self, base_path: Optional[str] = None, eager: bool = True):
+        """
+        Args:
+            base_path: 專案根目錄（預設為本模組往上四層）
+            eager: 載入配置時即建構所有表格 Schema（False 則於首次查詢時建構）
+        """
+        self.eager = eager
         if base_path is None:
             current_file = Path(__file__)
             # Go up 4 levels: static_loader.py -> schema -> database -> src -> app (project root)
@@ -30,8 +150,12 @@ class SchemaConfigManager:
         self.config_path = self.base_path / "schemas_config"
 
         # 內部快取
-        self._configs_cache = {}
-        self._table_schemas_cache = {}
+        self._configs_cache: Dict[str, Any] = {}
+        self._table_schemas_cache: Dict[str, Dict[str, Any]] = {}
+        self._compiled_global_patterns: List[Tuple[re.Pattern, Dict[str, Any]]] = []
+        self._fused_global_pattern: Optional[re.Pattern] = None
+        self._all_tables_cache: Optional[List[Dict[str, Any]]] = None
+        self._summary_cache: Optional[Dict[str, Any]] = None
         self._loaded = False
 
     def _ensure_loaded(self) -> bool:
@@ -48,7 +172,45 @@ class SchemaConfigManager:
             return False
 
     def _load_all_configs(self) -> None:
-        """載入所有配置檔案"""
+        """載入所有配置檔案（配置檔案未變更時直接使用磁碟快取）"""
+        signature = self._config_signature()
+        cached = self._read_disk_cache(signature)
+        if cached is not None:
+            # 自 JSON 還原的字串不會自動 intern
+            cached['table_configs'] = {
+                sys.intern(name): config
+                for name, config in cached.get('table_configs', {}).items()
+            }
+            self._configs_cache = cached
+            logger.debug("✓ 使用磁碟快取的配置")
+        else:
+            self._parse_all_configs()
+            self._write_disk_cache(signature)
+
+        # 預先編譯全域欄位模式
+        self._compile_global_patterns()
+
+        if self.eager:
+            self._build_all_schemas()
+
+    def _build_all_schemas(self) -> None:
+        """一次建構所有已知表格的增強 Schema，之後查詢只需字典查找"""
+        table_names = set(self._configs_cache.get('table_configs', {}))
+        listed = self._configs_cache.get('tables_list', {}).get('tables', {})
+        table_names.update(_intern_upper(name) for name in listed)
+
+        for table_name in table_names:
+            # 單一表格配置錯誤只略過該表，不影響整體載入
+            try:
+                schema = self._build_enhanced_schema(table_name)
+            except Exception as e:
+                logger.warning(f"建構表格 {table_name} 的 Schema 失敗，已略過: {e}")
+                continue
+            if schema:
+                self._table_schemas_cache[table_name] = schema
+
+    def _parse_all_configs(self) -> None:
+        """解析所有 JSON 配置檔案"""
         config_files = {
             'tables_list': 'tables_list.json',
             'global_patterns': 'global_patterns.json',
@@ -59,8 +221,7 @@ class SchemaConfigManager:
             file_path = self.config_path / filename
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self._configs_cache[config_name] = json.load(f)
+                    self._configs_cache[config_name] = _load_config_file(file_path)
                     logger.debug(f"✓ 載入 {filename}")
                 except Exception as e:
                     logger.warning(f"載入 {filename} 失敗: {e}")
@@ -71,30 +232,190 @@ class SchemaConfigManager:
         # 載入個別表格配置
         self._load_table_configs()
 
+    @property
+    def _disk_cache_path(self) -> Path:
+        """快取檔路徑：依配置目錄與格式版本區分（JSON 格式，不放在配置目錄內）"""
+        resolved = str(self.config_path.resolve()).encode('utf-8')
+        key = hashlib.sha256(resolved).hexdigest()[:16]
+        return _disk_cache_dir() / f'schemas-{key}-v{_DISK_CACHE_VERSION}.json'
+
+    def _config_signature(self) -> List[Tuple[str, int, int]]:
+        """以所有 JSON/JSONL 檔案的路徑、修改時間與大小作為配置簽章（不解析內容）"""
+        signature = []
+        for json_file in self.config_path.rglob('*.json*'):
+            if json_file.suffix not in ('.json', '.jsonl'):
+                continue
+            stat = json_file.stat()
+            relative = str(json_file.relative_to(self.config_path))
+            signature.append((relative, stat.st_mtime_ns, stat.st_size))
+        signature.sort()
+        return signature
+
+    def _read_disk_cache(
+        self, signature: List[Tuple[str, int, int]]
+    ) -> Optional[Dict[str, Any]]:
+        """讀取磁碟快取；版本或簽章不符、讀取失敗時返回 None"""
+        try:
+            cached = _json_loads(self._disk_cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"磁碟快取無法讀取，重新解析配置: {e}")
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get('version') != _DISK_CACHE_VERSION
+            or cached.get('signature') != [list(entry) for entry in signature]
+        ):
+            return None
+        return cached.get('configs')
+
+    def _write_disk_cache(self, signature: List[Tuple[str, int, int]]) -> None:
+        """寫入磁碟快取（先寫暫存檔再取代，失敗時僅記錄）"""
+        if not self.config_path.is_dir():
+            return
+        cache_path = self._disk_cache_path
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            payload = {
+                'version': _DISK_CACHE_VERSION,
+                'signature': signature,
+                'configs': self._configs_cache,
+            }
+            tmp_path.write_bytes(_json_dumps(payload))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"寫入磁碟快取失敗: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _remove_disk_cache(self) -> None:
+        """刪除磁碟快取"""
+        try:
+            self._disk_cache_path.unlink()
+        except OSError:
+            pass
+
+    def _compile_global_patterns(self) -> None:
+        """預先編譯全域欄位模式（避免每個欄位重複編譯正則表達式）"""
+        global_patterns = self._configs_cache.get('global_patterns', {})
+        column_patterns = global_patterns.get('column_patterns', {})
+        compiled = []
+        for pattern, config in column_patterns.items():
+            try:
+                compiled.append((re.compile(pattern, re.IGNORECASE), config))
+            except re.error as e:
+                logger.warning(f"全域模式 {pattern!r} 無效，已略過: {e}")
+        self._compiled_global_patterns = compiled
+        self._fused_global_pattern = _fuse_patterns(
+            [regex.pattern for regex, _ in compiled]
+        )
+
+    def _match_global_pattern(self, col_name: str) -> Optional[Dict[str, Any]]:
+        """取得第一個符合欄位名稱的全域模式配置"""
+        if self._fused_global_pattern is not None:
+            match = self._fused_global_pattern.match(col_name)
+            if match is None:
+                return None
+            # 外層群組最後結束，lastgroup 必為 g<索引>（即使模式本身含有群組）
+            index = int(cast(str, match.lastgroup)[1:])
+            return self._compiled_global_patterns[index][1]
+
+        # 無法合併（如含反向參照）時逐一比對
+        for regex, config in self._compiled_global_patterns:
+            if regex.search(col_name):
+                return config
+        return None
+
     def _load_table_configs(self) -> None:
-        """載入個別表格配置檔案"""
+        """載入個別表格配置檔案（有 tables.jsonl 清單時優先使用）"""
+        manifest_path = self.config_path / _TABLES_MANIFEST_NAME
+        if manifest_path.is_file():
+            table_configs = self._load_tables_manifest(manifest_path)
+            self._configs_cache['table_configs'] = table_configs
+            logger.info(
+                f"✓ 從 {_TABLES_MANIFEST_NAME} 載入 {len(table_configs)} 個表格配置"
+            )
+            return
+
         tables_dir = self.config_path / "tables"
         table_configs = {}
 
         if tables_dir.exists():
-            for json_file in tables_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                        table_name = config.get('table_name', json_file.stem).upper()
-                        table_configs[table_name] = config
-                except Exception as e:
-                    logger.warning(f"載入表格配置 {json_file} 失敗: {e}")
+            # scandir 直接使用目錄項目快取的檔案類型，省去每個檔案的額外 stat
+            with os.scandir(tables_dir) as entries:
+                json_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.json')
+                    and entry.is_file(follow_symlinks=False)
+                ]
+            if json_files:
+                # 以執行緒池重疊檔案 I/O；map 保持檔案順序，重複表名時結果與逐一載入一致
+                workers = min(_MAX_LOAD_WORKERS, len(json_files))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(self._load_table_config, json_files)
+                    for json_file, config in results:
+                        if config is not None:
+                            table_name = _intern_upper(
+                                config.get('table_name', json_file.stem)
+                            )
+                            table_configs[table_name] = config
 
         self._configs_cache['table_configs'] = table_configs
         logger.info(f"✓ 載入 {len(table_configs)} 個表格配置")
 
+    @staticmethod
+    def _load_tables_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+        """一次讀取 JSONL 清單並逐行解析表格配置（無效的行記錄警告後略過）"""
+        table_configs = {}
+        for line_no, line in enumerate(manifest_path.read_bytes().splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                config = _json_loads(line)
+                table_configs[_intern_upper(config['table_name'])] = config
+            except Exception as e:
+                logger.warning(f"載入 {_TABLES_MANIFEST_NAME} 第 {line_no} 行失敗: {e}")
+        return table_configs
+
+    def build_tables_manifest(self) -> Path:
+        """
+        將 tables/*.json 合併為 tables.jsonl（一次性遷移工具）
+
+        Returns:
+            產生的清單檔案路徑
+        """
+        tables_dir = self.config_path / "tables"
+        lines = []
+        for json_file in sorted(tables_dir.glob("*.json")):
+            config = _load_json(json_file)
+            config.setdefault('table_name', json_file.stem)
+            lines.append(json.dumps(config, ensure_ascii=False, separators=(',', ':')))
+
+        manifest_path = self.config_path / _TABLES_MANIFEST_NAME
+        manifest_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        logger.info(f"✓ 已將 {len(lines)} 個表格配置寫入 {manifest_path}")
+        return manifest_path
+
+    @staticmethod
+    def _load_table_config(json_file: Path) -> Tuple[Path, Optional[Dict[str, Any]]]:
+        """載入單一表格配置檔案（失敗時記錄警告並返回 None）"""
+        try:
+            return json_file, _load_json(json_file)
+        except Exception as e:
+            logger.warning(f"載入表格配置 {json_file} 失敗: {e}")
+            return json_file, None
+
     def get_table_schema(self, table_name: str) -> Optional[Dict[str, Any]]:
         """取得表格 Schema（使用實例快取，無需 @lru_cache）"""
         if not self._ensure_loaded():
             return None
 
-        table_name_upper = table_name.upper()
+        table_name_upper = _intern_upper(table_name)
 
         # 檢查快取
         if table_name_upper in self._table_schemas_cache:
@@ -112,27 +433,24 @@ class SchemaConfigManager:
         # 1. 從 JSON 配置取得
         table_config = self._configs_cache.get('table_configs', {}).get(table_name, {})
 
-        # 2. 從 JSON 表格清單取得基本資訊
-        basic_info = self._get_table_from_json_list(table_name)
+        # 2. 配置未提供顯示名稱時才查詢 JSON 表格清單
+        display_name = table_config.get('display_name')
+        if not display_name:
+            basic_info = self._get_table_from_json_list(table_name)
+            if basic_info is None and not table_config:
+                return None
+            display_name = (basic_info[1] if basic_info else None) or table_name
 
-        if not any([table_config, basic_info]):
-            return None
-
-        # 建構完整 Schema
+        # 建構完整 Schema（一次組成，欄位順序與輸出相同）
+        get_config = table_config.get
         enhanced_schema = {
             'table_name': table_name,
-            'display_name': (
-                table_config.get('display_name') or
-                basic_info.get('DISPLAY_NAME') or
-                table_name
-            ),
-            'type': table_config.get('type', 'TABLE'),
-            'category': table_config.get('category', 'unknown'),
-            'business_importance': table_config.get('business_importance', 'medium'),
+            'display_name': display_name,
+            **{
+                key: get_config(key, default) for key, default in _TABLE_SCHEMA_DEFAULTS
+            },
             'columns': [],
-            'relationships': table_config.get('relationships', {}),
-            'business_logic': table_config.get('business_logic', {}),
-            'ai_context': table_config.get('ai_context', {})
+            **{key: get_config(key, {}) for key in _TABLE_SCHEMA_SECTIONS},
         }
 
         # 整合欄位資訊（僅使用 JSON 配置）
@@ -165,44 +483,64 @@ class SchemaConfigManager:
 
         return enhanced_schema
 
+    def _build_schema_meta(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """只計算表格欄位數
+
+        與 _build_enhanced_schema 的 total_count 一致，但不建構欄位字典。
+        """
+        table_config = self._configs_cache.get('table_configs', {}).get(table_name, {})
+        if not table_config and self._get_table_from_json_list(table_name) is None:
+            return None
+
+        columns = table_config.get('columns') or table_config.get('key_columns') or ()
+        return {'total_count': len(columns)}
+
     def _enhance_columns(self, columns: List[Dict], table_config: Dict) -> List[Dict]:
         """增強欄位資訊"""
         enhanced_columns = []
-        key_columns = table_config.get('key_columns', {})
-        global_patterns = self._configs_cache.get('global_patterns', {}).get('column_patterns', {})
+        key_columns = table_config.get('key_columns') or {}
+        get_key_column = key_columns.get
 
         for column in columns:
-            col_name = column['COLUMN_NAME']
-            enhanced_col = column.copy()
-
-            # 從 JSON 配置增強
-            if col_name in key_columns:
-                col_config = key_columns[col_name]
-                enhanced_col.update({
+            col_name = sys.intern(column['COLUMN_NAME'])
+
+            # 從 JSON 配置增強（單次查找取代 in + 索引）
+            # 結果字典一次組成，不先 copy 再 update
+            col_config = get_key_column(col_name)
+            if col_config is not None:
+                enhanced_col = {
+                    **column,
+                    'COLUMN_NAME': col_name,
                     'semantic_type': col_config.get('semantic_type'),
                     'business_importance': col_config.get('business_importance'),
                     'enhanced_description': col_config.get('description'),
                     'usage_notes': col_config.get('usage_notes'),
                     'ai_hints': col_config.get('ai_hints')
-                })
+                }
             else:
-                # 應用全域模式匹配
-                for pattern, config in global_patterns.items():
-                    if re.search(pattern, col_name, re.IGNORECASE):
-                        enhanced_col.update({
-                            'semantic_type': config.get('semantic_type'),
-                            'pattern_description': config.get('default_description'),
-                            'business_hints': config.get('business_hints')
-                        })
-                        break
+                # 應用全域模式匹配（依序，第一個符合者生效）
+                config = self._match_global_pattern(col_name)
+                if config is not None:
+                    enhanced_col = {
+                        **column,
+                        'COLUMN_NAME': col_name,
+                        'semantic_type': config.get('semantic_type'),
+                        'pattern_description': config.get('default_description'),
+                        'business_hints': config.get('business_hints')
+                    }
+                else:
+                    enhanced_col = {**column, 'COLUMN_NAME': col_name}
 
             enhanced_columns.append(enhanced_col)
 
         return enhanced_columns
 
 
-    def _get_table_from_json_list(self, table_name: str) -> Optional[Dict[str, Any]]:
-        """從 JSON 表格清單取得表格資訊（使用 _configs_cache，無需額外快取）"""
+    def _get_table_from_json_list(self, table_name: str) -> Optional[Tuple[str, str]]:
+        """從 JSON 表格清單取得 (表格類型, 顯示名稱)
+
+        直接使用 _configs_cache，無需額外快取。
+        """
         tables_list_config = self._configs_cache.get('tables_list', {})
         tables = tables_list_config.get('tables', {})
 
@@ -211,11 +549,10 @@ class SchemaConfigManager:
         table_name_lower = table_name.lower()
         table_info = tables.get(table_name_upper) or tables.get(table_name_lower) or tables.get(table_name)
         if table_info:
-            return {
-                'TABLE_TYPE': table_info.get('table_type', 'TABLE'),
-                'TABLE_NAME': table_name.upper(),
-                'DISPLAY_NAME': table_info.get('display_name', table_name)
-            }
+            return (
+                table_info.get('table_type', 'TABLE'),
+                table_info.get('display_name', table_name),
+            )
 
         return None
 
@@ -224,69 +561,86 @@ class SchemaConfigManager:
         if not self._ensure_loaded():
             return []
 
+        if self._all_tables_cache is not None:
+            # 回傳副本，呼叫端修改不影響快取
+            return [dict(table) for table in self._all_tables_cache]
+
         tables = []
         processed_tables = set()
 
-        # 從 JSON 配置載入
-        tables_list_config = self._configs_cache.get('tables_list', {})
-        json_tables = tables_list_config.get('tables', {})
+        # 迴圈外先取得配置字典與預設 schema
+        json_tables = self._configs_cache.get('tables_list', {}).get('tables', {})
+        table_configs = self._configs_cache.get('table_configs', {})
+
+        # Determine default schema based on database type
+        db_type = os.environ.get('DB_TYPE', 'mssql').lower()
+        default_schema = 'public' if db_type == 'postgresql' else 'dbo'
+        db_schema = os.environ.get('DB_SCHEMA', default_schema)
 
         for table_name, table_config in json_tables.items():
             # 統一使用小寫作為表格名稱（PostgreSQL 慣例）
             table_name_lower = table_name.lower()
-            table_name_upper = table_name.upper()
-
-            if table_name_lower not in processed_tables:
-                # Determine default schema based on database type
-                db_type = os.environ.get('DB_TYPE', 'mssql').lower()
-                default_schema = 'public' if db_type == 'postgresql' else 'dbo'
-                db_schema = os.environ.get('DB_SCHEMA', default_schema)
-
-                table_info = {
-                    'TABLE_NAME': table_name_lower,  # 使用小寫（PostgreSQL 慣例）
-                    'TABLE_TYPE': table_config.get('table_type', 'TABLE'),
-                    'DISPLAY_NAME': table_config.get('display_name', table_name),
-                    'TABLE_SCHEMA': db_schema,
-                    'ROW_COUNT': 0,
-                    'SIZE_MB': 0.0
-                }
 
-                # 從詳細的 JSON 配置增強（嘗試大寫和小寫）
-                detailed_config = (
-                    self._configs_cache.get('table_configs', {}).get(table_name_upper, {}) or
-                    self._configs_cache.get('table_configs', {}).get(table_name_lower, {}) or
-                    self._configs_cache.get('table_configs', {}).get(table_name, {})
-                )
-                if detailed_config:
-                    table_info.update({
-                        'ENHANCED_DISPLAY_NAME': detailed_config.get('display_name'),
-                        'CATEGORY': detailed_config.get('category'),
-                        'BUSINESS_IMPORTANCE': detailed_config.get('business_importance')
-                    })
+            # 僅大小寫不同的表名視為同一表格
+            if table_name_lower in processed_tables:
+                continue
+            processed_tables.add(table_name_lower)
+
+            table_info = {
+                'TABLE_NAME': table_name_lower,  # 使用小寫（PostgreSQL 慣例）
+                'TABLE_TYPE': table_config.get('table_type', 'TABLE'),
+                'DISPLAY_NAME': table_config.get('display_name', table_name),
+                'TABLE_SCHEMA': db_schema,
+                'ROW_COUNT': 0,
+                'SIZE_MB': 0.0
+            }
+
+            # 從詳細的 JSON 配置增強（嘗試大寫和小寫）
+            detailed_config = (
+                table_configs.get(table_name.upper()) or
+                table_configs.get(table_name_lower) or
+                table_configs.get(table_name)
+            )
+            if detailed_config:
+                table_info.update({
+                    'ENHANCED_DISPLAY_NAME': detailed_config.get('display_name'),
+                    'CATEGORY': detailed_config.get('category'),
+                    'BUSINESS_IMPORTANCE': detailed_config.get('business_importance')
+                })
 
-                tables.append(table_info)
-                processed_tables.add(table_name_lower)
+            tables.append(table_info)
 
-        return tables
+        self._all_tables_cache = tables
+        return [dict(table) for table in tables]
 
     def get_summary(self) -> Dict[str, Any]:
         """取得系統摘要"""
         if not self._ensure_loaded():
             return {'error': 'Configuration not loaded'}
 
-        tables = self.get_all_tables()
-        total_columns = 0
+        if self._summary_cache is None:
+            tables = self.get_all_tables()
+            total_columns = 0
 
-        # 計算總欄位數
-        for table in tables:
-            schema = self.get_table_schema(table['TABLE_NAME'])
-            if schema:
-                total_columns += len(schema.get('columns', []))
+            # 計算總欄位數（已建構的 Schema 直接取 total_count，否則只計數不建構欄位）
+            for table in tables:
+                table_name_upper = table['TABLE_NAME'].upper()
+                schema = (
+                    self._table_schemas_cache.get(table_name_upper)
+                    or self._build_schema_meta(table_name_upper)
+                )
+                if schema:
+                    total_columns += schema['total_count']
+
+            self._summary_cache = {
+                'total_tables': len(tables),
+                'total_columns': total_columns,
+                'table_names': [t['TABLE_NAME'] for t in tables],
+            }
 
+        # 表格統計快取至清除為止；快取大小等即時狀態每次重新取得
         return {
-            'total_tables': len(tables),
-            'total_columns': total_columns,
-            'table_names': [t['TABLE_NAME'] for t in tables],
+            **self._summary_cache,
             'source': 'json_config_system_v3',
             'config_status': {
                 'json_configs_loaded': len(self._configs_cache.get('table_configs', {})),
@@ -304,36 +658,48 @@ class SchemaConfigManager:
         """取得 AI 增強配置"""
         if not self._ensure_loaded():
             return {}
-        return self._configs_cache.get('ai_enhancement', {})
+        config: Dict[str, Any] = self._configs_cache.get('ai_enhancement', {})
+        return config
 
     def get_global_patterns(self) -> Dict[str, Any]:
         """取得全域模式配置"""
         if not self._ensure_loaded():
             return {}
-        return self._configs_cache.get('global_patterns', {})
+        patterns: Dict[str, Any] = self._configs_cache.get('global_patterns', {})
+        return patterns
 
     def clear_cache(self) -> None:
         """清除快取"""
         self._table_schemas_cache.clear()
+        self._all_tables_cache = None
+        self._summary_cache = None
         logger.info("✓ 快取已清除")
 
     def reload_configs(self) -> bool:
         """重新載入配置"""
         self.clear_cache()
         self._configs_cache.clear()
+        self._remove_disk_cache()
+        self._compiled_global_patterns = []
+        self._fused_global_pattern = None
         self._loaded = False
         return self._ensure_loaded()
 
 
 # 全域管理器實例
-_schema_manager = None
+_schema_manager: Optional[SchemaConfigManager] = None
+_schema_manager_lock = threading.Lock()
 
 def get_schema_manager() -> SchemaConfigManager:
-    """取得全域 Schema 管理器實例"""
+    """取得全域 Schema 管理器實例（雙重檢查鎖定，並行首次存取只建立一個實例）"""
     global _schema_manager
-    if _schema_manager is None:
-        _schema_manager = SchemaConfigManager()
-    return _schema_manager
+    manager = _schema_manager
+    if manager is None:
+        with _schema_manager_lock:
+            manager = _schema_manager
+            if manager is None:
+                manager = _schema_manager = SchemaConfigManager()
+    return manager
 
 # 公開 API - 簡化版本
 def get_table_schema(table_name: str) -> Optional[Dict[str, Any]]:
@@ -362,4 +728,16 @@ def reload_configs() -> bool:
 
 def clear_cache() -> None:
     """清除快取"""
-    get_schema_manager().clear_cache()
\ No newline at end of file
+    get_schema_manager().clear_cache()
+
+def build_tables_manifest() -> Path:
+    """將 tables/*.json 合併為 tables.jsonl"""
+    return get_schema_manager().build_tables_manifest()
+
+
+def warm_disk_cache(base_path: Optional[str] = None) -> bool:
+    """解析配置並寫入磁碟快取，不建立全域實例
+
+    多 worker 啟動前由主行程呼叫一次，各 worker 只需讀取快取而不必同時重新解析 JSON。
+    """
+    return SchemaConfigManager(base_path, eager=False)._ensure_loaded()
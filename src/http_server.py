@@ -5,41 +5,318 @@ Provides REST API access and MCP SSE (Server-Sent Events) support for external i
 
 import asyncio
 from contextlib import asynccontextmanager
+import hmac
+import json
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
+import anyio.to_thread
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Route, Router
 import uvicorn
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
-from mcp.types import Tool, Prompt, Resource
+from mcp.types import Prompt, Resource, Tool
 
-from core.config import DatabaseConfig, HTTPConfig
+from core.config import DatabaseConfig, HTTPConfig, get_http_config
+from core.dependencies import get_app_config
 from database.async_manager import HybridDatabaseManager
-from tools import ToolRegistry, get_all_tools
+from protocol.base_server import EMPTY_LISTING
+from tools import ToolCall, ToolRegistry, get_all_tools
 from tools.validators import SQLValidator
-from api.middleware import setup_middleware
-from api.routes import QueryRequest, CacheInvalidateRequest, HealthResponse
+from api.admission import AdmissionController
+from api.middleware import limiter, setup_middleware
+from api.responses import (
+    FastJSONResponse,
+    error_response,
+    streaming_success_response,
+    success_response,
+)
+from api.routes import (
+    QueryRequest,
+    CacheInvalidateRequest,
+    ConcurrencyLimitRequest,
+    HealthResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# REST endpoints advertised by /api/v1/tools
+_API_TOOLS_MANIFEST = (
+    {
+        "name": "connection_test",
+        "endpoint": "/api/v1/connection/test",
+        "method": "GET",
+        "description": "Test database connection",
+    },
+    {
+        "name": "query",
+        "endpoint": "/api/v1/query",
+        "method": "POST",
+        "description": "Execute SELECT query",
+    },
+    {
+        "name": "schema",
+        "endpoint": "/api/v1/schema",
+        "method": "GET",
+        "description": "Get database schema",
+    },
+    {
+        "name": "table_schema",
+        "endpoint": "/api/v1/schema/{table_name}",
+        "method": "GET",
+        "description": "Get table schema",
+    },
+    {
+        "name": "dependencies",
+        "endpoint": "/api/v1/dependencies/{table_name}",
+        "method": "GET",
+        "description": "Analyze table dependencies",
+    },
+    {
+        "name": "summary",
+        "endpoint": "/api/v1/summary",
+        "method": "GET",
+        "description": "Get database summary",
+    },
+    {
+        "name": "database_info",
+        "endpoint": "/api/v1/database/info",
+        "method": "GET",
+        "description": "Get database info",
+    },
+    {
+        "name": "cache_stats",
+        "endpoint": "/api/v1/cache/stats",
+        "method": "GET",
+        "description": "Get cache statistics",
+    },
+    {
+        "name": "cache_invalidate",
+        "endpoint": "/api/v1/cache/invalidate",
+        "method": "POST",
+        "description": "Invalidate cache",
+    },
+    {
+        "name": "schema_reload",
+        "endpoint": "/api/v1/schema/reload",
+        "method": "POST",
+        "description": "Reload schema config",
+    },
+    {
+        "name": "static_schema_info",
+        "endpoint": "/api/v1/schema/static/info",
+        "method": "GET",
+        "description": "Get static schema info",
+    },
+)
+
+# /api/v1/tools response up to the timestamp value, rendered once at import
+_API_TOOLS_BODY_PREFIX = (
+    b'{"success":true,"data":'
+    + json.dumps(
+        _API_TOOLS_MANIFEST, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+    + b',"timestamp":"'
+)
+
+# Routes moved to the front of the routing table, in this order
+_HOT_ROUTES = {"/api/v1/health": 0, "/api/v1/query": 1}
+
+# How long a health-check database probe result is reused (seconds)
+_HEALTH_CACHE_TTL = 2.0
+# Lets proxies and probe sidecars reuse a health response as long as the probe result
+_HEALTH_HEADERS = {"Cache-Control": f"max-age={int(_HEALTH_CACHE_TTL)}"}
+
+# Refresh interval of the cached response timestamp (seconds), see CACHE_TIMESTAMPS
+_TIMESTAMP_REFRESH_INTERVAL = 0.2
+
+# Full-schema responses with at least this many objects are streamed in batches
+_STREAM_MIN_OBJECTS = 1000
+
+# Headers that stop reverse proxies (nginx) and caches from holding back SSE events
+_SSE_NO_BUFFER_HEADERS = (
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),
+)
+
+
+def _unbuffered_sse_send(send):
+    """Wrap an ASGI send so the SSE response start carries no-buffering headers.
+
+    Headers the SSE response already sets are left as they are.
+    """
+    async def wrapped_send(message):
+        if message["type"] == "http.response.start":
+            headers = list(message.get("headers", []))
+            present = {bytes(name).lower() for name, _ in headers}
+            headers.extend(
+                header for header in _SSE_NO_BUFFER_HEADERS if header[0] not in present
+            )
+            message["headers"] = headers
+        await send(message)
+
+    return wrapped_send
+
+
+# Buffered SSE bytes are written out as soon as they reach this size
+_SSE_COALESCE_MAX_BYTES = 16384
+
+
+class _CoalescingSend:
+    """Wrap an ASGI send so SSE body chunks sent in a burst share one write.
+
+    Streaming body chunks are held for up to ``interval`` seconds, or until
+    ``_SSE_COALESCE_MAX_BYTES`` are buffered, and then sent as one message.
+    Any other message (response start, final body) flushes the buffer first,
+    so ordering is preserved. Writes are serialized by a lock, so a size-limit
+    flush waits for a delayed flush that is still in the real send. Call
+    ``close()`` when the response is done.
+    """
+
+    __slots__ = ("_send", "_interval", "_buffer", "_flush_task", "_error", "_lock")
+
+    def __init__(self, send, interval: float):
+        self._send = send
+        self._interval = interval
+        self._buffer = bytearray()
+        self._flush_task: Optional[asyncio.Future] = None
+        self._error: Optional[BaseException] = None
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, message):
+        if self._error is not None:
+            raise self._error
+        if message["type"] != "http.response.body" or not message.get("more_body"):
+            self.close()
+            async with self._lock:
+                await self._write()
+                await self._send(message)
+            return
+
+        self._buffer += message.get("body", b"")
+        if len(self._buffer) >= _SSE_COALESCE_MAX_BYTES:
+            await self._flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._interval)
+        self._flush_task = None
+        try:
+            async with self._lock:
+                await self._write()
+        except Exception as e:
+            # Surfaced to the transport on its next send
+            self._error = e
+
+    async def _flush(self) -> None:
+        self.close()
+        async with self._lock:
+            await self._write()
+
+    async def _write(self) -> None:
+        # Caller holds self._lock
+        if self._buffer:
+            body = bytes(self._buffer)
+            self._buffer.clear()
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": True}
+            )
+
+    def close(self) -> None:
+        """Cancel a pending delayed flush."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+
+@limiter.limit(get_http_config().rate_limit_query)
+async def _query_rate_limit(request: Request) -> None:
+    """Dependency enforcing RATE_LIMIT_QUERY on /api/v1/query.
+
+    Applied once at import to the process-wide limiter (the one installed on
+    app.state), so every MCPHTTPServer counts against the same storage instead
+    of a private limiter per instance.
+    """
+
+
+class _ASGIEndpoint:
+    """Expose an ASGI callable to starlette's ``Route`` as a raw ASGI app.
+
+    ``Route`` wraps plain functions and methods as ``request -> response``
+    handlers; the SSE transport speaks ASGI directly and sends its own response.
+    """
+
+    __slots__ = ("_app",)
+
+    def __init__(self, app):
+        self._app = app
+
+    async def __call__(self, scope, receive, send):
+        await self._app(scope, receive, send)
+
+
+# REST endpoints that do not touch the database and answer before it is ready
+_DB_INDEPENDENT_ROUTES = frozenset((
+    "/api/v1/health",
+    "/api/v1/tools",
+    "/api/v1/admin/concurrency",
+))
+
+
+class _DatabaseReadyMiddleware:
+    """Answer REST requests with 503 until the server's database manager exists.
+
+    Replaces a per-route guard; once the manager is set, the cost per request
+    is a single attribute check.
+    """
+
+    __slots__ = ("app", "server")
+
+    def __init__(self, app, server: "MCPHTTPServer"):
+        self.app = app
+        self.server = server
+
+    async def __call__(self, scope, receive, send):
+        if (
+            self.server.db_manager is None
+            and scope["type"] == "http"
+            and scope["path"].startswith("/api/v1/")
+            and scope["path"] not in _DB_INDEPENDENT_ROUTES
+        ):
+            response = FastJSONResponse(
+                {"detail": "Database manager not initialized"}, status_code=503
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
 class MCPHTTPServer:
     """HTTP server wrapper for MCP database tools with SSE support."""
 
     def __init__(self, config: Optional[DatabaseConfig] = None):
-        self.config = config or DatabaseConfig.from_env()
-        self.http_config = HTTPConfig.from_env()
+        # Environment is parsed once per process and shared with the rest of the app
+        app_config = get_app_config()
+        self.config = config or app_config.database
+        self.http_config = app_config.http_config
         self.db_manager = None
 
         self.tool_registry = ToolRegistry()
+        self.query_admission = AdmissionController(
+            self.http_config.max_concurrent_queries
+        )
+        self._health_cache = (0.0, False)  # (monotonic timestamp, database connected)
+        self._cached_timestamp: Optional[str] = None
 
-        self.server_name = os.getenv("MCP_SERVER_NAME", "mcp-db")
+        self.server_name = app_config.server_name
         self.mcp_server = Server(self.server_name)
         self.sse_transport = SseServerTransport("/messages")
 
@@ -47,10 +324,22 @@ class MCPHTTPServer:
 
         @asynccontextmanager
         async def lifespan(app: FastAPI):
+            # Sync database calls run in anyio's worker threads; widen the default pool
+            anyio.to_thread.current_default_thread_limiter().total_tokens = (
+                self.http_config.threadpool_size
+            )
             await self.initialize()
+            timestamp_task = None
+            if self.http_config.cache_timestamps:
+                timestamp_task = asyncio.ensure_future(self._refresh_timestamp())
             logger.info("Service started, schema preloaded")
             yield
             logger.info("Service shutting down")
+            if timestamp_task is not None:
+                timestamp_task.cancel()
+                self._cached_timestamp = None
+            if self.db_manager is not None:
+                await self.db_manager.close_async()
 
         self.app = FastAPI(
             title="MCP Database API",
@@ -58,45 +347,50 @@ class MCPHTTPServer:
             version="1.2.0",
             docs_url="/docs",
             redoc_url="/redoc",
+            default_response_class=FastJSONResponse,
             lifespan=lifespan
         )
 
-        # Mount MCP SSE ASGI sub-app
-        async def mcp_sse_asgi_app(scope, receive, send):
-            path = scope.get("path", "/")
-            method = scope.get("method", "GET")
-
-            if path == "/sse/" and method == "GET":
-                async with self.sse_transport.connect_sse(scope, receive, send) as streams:
-                    await self.mcp_server.run(
-                        streams[0],
-                        streams[1],
-                        self.mcp_server.create_initialization_options()
-                    )
-            elif path.startswith("/sse/messages") and method == "POST":
-                await self.sse_transport.handle_post_message(scope, receive, send)
-            else:
-                await send({
-                    'type': 'http.response.start',
-                    'status': 404,
-                    'headers': [[b'content-type', b'text/plain']],
-                })
-                await send({
-                    'type': 'http.response.body',
-                    'body': b'Not Found',
-                })
-
-        self.app.mount("/sse", mcp_sse_asgi_app)
+        # Mount MCP SSE sub-router: GET /sse/ opens the stream, POST /sse/messages
+        # carries client messages; other methods get 405 and unknown paths 404
+        post_message = _ASGIEndpoint(self.sse_transport.handle_post_message)
+        self.app.mount("/sse", Router(routes=[
+            Route("/", _ASGIEndpoint(self._sse_connect), methods=["GET"]),
+            Route("/messages", post_message, methods=["POST"]),
+        ]))
+
+        # Added first so it runs innermost, inside CORS and GZip
+        self.app.add_middleware(_DatabaseReadyMiddleware, server=self)
 
         # Apply all middleware (CORS, GZip, rate limiting)
-        from core.config import AppConfig
-        app_config = AppConfig.from_env()
         setup_middleware(self.app, app_config)
 
-        # Rate limiter reference for route-specific limits
-        self.limiter = Limiter(key_func=get_remote_address)
-
         self._register_routes()
+        # The router tries routes in order; put the most frequently hit first.
+        # Their paths are exact and overlap no other route, so matching is unchanged.
+        last = len(_HOT_ROUTES)
+        self.app.router.routes.sort(
+            key=lambda route: _HOT_ROUTES.get(getattr(route, "path", None), last)
+        )
+
+    async def _sse_connect(self, scope, receive, send):
+        """Open an MCP SSE stream and run the MCP session over it."""
+        send = _unbuffered_sse_send(send)
+        coalescing = None
+        if self.http_config.sse_coalesce_ms > 0:
+            send = coalescing = _CoalescingSend(
+                send, self.http_config.sse_coalesce_ms / 1000
+            )
+        try:
+            async with self.sse_transport.connect_sse(scope, receive, send) as streams:
+                await self.mcp_server.run(
+                    streams[0],
+                    streams[1],
+                    self.mcp_server.create_initialization_options()
+                )
+        finally:
+            if coalescing is not None:
+                coalescing.close()
 
     def _setup_mcp_handlers(self):
         """Setup MCP protocol handlers."""
@@ -111,11 +405,9 @@ class MCPHTTPServer:
                 return [{"type": "text", "text": "Error: Database not initialized"}]
 
             try:
-                request = type('CallToolRequest', (), {
-                    'name': name,
-                    'arguments': arguments or {}
-                })()
-                result = await self.tool_registry.handle_tool(request, self.db_manager)
+                result = await self.tool_registry.handle_tool(
+                    ToolCall(name, arguments), self.db_manager
+                )
                 if isinstance(result, dict) and "content" in result:
                     return result["content"]
                 return result if isinstance(result, list) else [result]
@@ -124,12 +416,12 @@ class MCPHTTPServer:
                 return [{"type": "text", "text": f"Error: {str(e)}"}]
 
         @self.mcp_server.list_prompts()
-        async def list_prompts() -> List[Prompt]:
-            return []
+        async def list_prompts() -> Sequence[Prompt]:
+            return EMPTY_LISTING
 
         @self.mcp_server.list_resources()
-        async def list_resources() -> List[Resource]:
-            return []
+        async def list_resources() -> Sequence[Resource]:
+            return EMPTY_LISTING
 
     async def initialize(self):
         """Initialize database manager asynchronously."""
@@ -150,44 +442,29 @@ class MCPHTTPServer:
     def _register_routes(self):
         """Register all API routes."""
 
-        @self.app.get("/api/v1/health", response_model=HealthResponse)
+        # HealthResponse documents the schema only; returning the response directly
+        # skips validation and encoding passes on the most frequently hit endpoint
+        @self.app.get("/api/v1/health", responses={200: {"model": HealthResponse}})
         async def health_check():
-            db_connected = False
-            if self.db_manager:
-                try:
-                    result = self.db_manager.test_connection()
-                    db_connected = result.get("success", False)
-                except Exception:
-                    pass
-
-            return HealthResponse(
-                status="healthy" if db_connected else "degraded",
-                timestamp=datetime.now().isoformat(),
-                version="1.2.0",
-                database_connected=db_connected
-            )
+            db_connected = await self._probe_database()
+
+            return FastJSONResponse({
+                "status": "healthy" if db_connected else "degraded",
+                "timestamp": self._timestamp(),
+                "version": "1.2.0",
+                "database_connected": db_connected,
+            }, headers=_HEALTH_HEADERS)
 
         @self.app.get("/api/v1/tools")
         async def list_api_tools():
-            tools = [
-                {"name": "connection_test", "endpoint": "/api/v1/connection/test", "method": "GET", "description": "Test database connection"},
-                {"name": "query", "endpoint": "/api/v1/query", "method": "POST", "description": "Execute SELECT query"},
-                {"name": "schema", "endpoint": "/api/v1/schema", "method": "GET", "description": "Get database schema"},
-                {"name": "table_schema", "endpoint": "/api/v1/schema/{table_name}", "method": "GET", "description": "Get table schema"},
-                {"name": "dependencies", "endpoint": "/api/v1/dependencies/{table_name}", "method": "GET", "description": "Analyze table dependencies"},
-                {"name": "summary", "endpoint": "/api/v1/summary", "method": "GET", "description": "Get database summary"},
-                {"name": "database_info", "endpoint": "/api/v1/database/info", "method": "GET", "description": "Get database info"},
-                {"name": "cache_stats", "endpoint": "/api/v1/cache/stats", "method": "GET", "description": "Get cache statistics"},
-                {"name": "cache_invalidate", "endpoint": "/api/v1/cache/invalidate", "method": "POST", "description": "Invalidate cache"},
-                {"name": "schema_reload", "endpoint": "/api/v1/schema/reload", "method": "POST", "description": "Reload schema config"},
-                {"name": "static_schema_info", "endpoint": "/api/v1/schema/static/info", "method": "GET", "description": "Get static schema info"},
-            ]
-            return self._success_response(tools)
+            # Static manifest: serialized once, only the timestamp is filled in
+            return Response(
+                content=_API_TOOLS_BODY_PREFIX + self._timestamp().encode() + b'"}',
+                media_type="application/json",
+            )
 
         @self.app.get("/api/v1/connection/test")
         async def test_connection():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
                 result = await self.db_manager.test_connection_async()
                 return self._success_response(result)
@@ -195,19 +472,19 @@ class MCPHTTPServer:
                 logger.error(f"Connection test failed: {e}")
                 return self._error_response(f"Connection test failed: {str(e)}")
 
-        @self.app.post("/api/v1/query")
-        @self.limiter.limit(self.http_config.rate_limit_query)
-        async def execute_query(request: Request, query_request: QueryRequest):
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
+        @self.app.post("/api/v1/query", dependencies=[Depends(_query_rate_limit)])
+        async def execute_query(query_request: QueryRequest):
 
             is_valid, error_msg = SQLValidator.validate_query(query_request.query)
             if not is_valid:
-                logger.warning(f"Query blocked by security validation: {error_msg}")
+                logger.warning("Query blocked by security validation: %s", error_msg)
                 return self._error_response(f"Security validation failed: {error_msg}")
 
             try:
-                result = await self.db_manager.execute_query_async(query_request.query, query_request.params or [])
+                async with self.query_admission:
+                    result = await self.db_manager.execute_query_async(
+                        query_request.query, query_request.params
+                    )
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Query execution failed: {e}")
@@ -215,21 +492,19 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/schema")
         async def get_schema():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.get_schema_info()
-                return self._success_response(result)
+                result = await run_in_threadpool(self.db_manager.get_schema_info)
+                return self._schema_response(result)
             except Exception as e:
                 logger.error(f"Schema query failed: {e}")
                 return self._error_response(f"Schema query failed: {str(e)}")
 
         @self.app.get("/api/v1/schema/{table_name}")
         async def get_table_schema(table_name: str):
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.get_schema_info(table_name)
+                result = await run_in_threadpool(
+                    self.db_manager.get_schema_info, table_name
+                )
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Table schema query failed: {e}")
@@ -237,10 +512,10 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/dependencies/{table_name}")
         async def get_table_dependencies(table_name: str):
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.get_table_dependencies(table_name)
+                result = await run_in_threadpool(
+                    self.db_manager.get_table_dependencies, table_name
+                )
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Dependency analysis failed: {e}")
@@ -248,10 +523,8 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/summary")
         async def get_database_summary():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.get_schema_summary()
+                result = await run_in_threadpool(self.db_manager.get_schema_summary)
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Database summary query failed: {e}")
@@ -259,10 +532,8 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/database/info")
         async def get_database_info():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.get_database_info()
+                result = await run_in_threadpool(self.db_manager.get_database_info)
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Database info query failed: {e}")
@@ -270,8 +541,6 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/cache/stats")
         async def get_cache_stats():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
                 result = self.db_manager.get_cache_stats()
                 return self._success_response(result)
@@ -281,8 +550,6 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/admin/cache-debug", tags=["Cache Management"])
         async def get_cache_debug():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
                 result = self.db_manager.get_cache_debug_info()
                 return self._success_response(result)
@@ -290,10 +557,27 @@ class MCPHTTPServer:
                 logger.error(f"Cache debug query failed: {e}")
                 return self._error_response(f"Cache debug query failed: {str(e)}")
 
+        @self.app.get("/api/v1/admin/concurrency", tags=["Admin"])
+        async def get_concurrency_limit():
+            return self._success_response({
+                "max_concurrent": self.query_admission.max_concurrent,
+                "active": self.query_admission.active,
+            })
+
+        @self.app.post(
+            "/api/v1/admin/concurrency",
+            tags=["Admin"],
+            dependencies=[Depends(self._require_admin)],
+        )
+        async def set_concurrency_limit(request: ConcurrencyLimitRequest):
+            await self.query_admission.resize(request.max_concurrent)
+            return self._success_response({
+                "max_concurrent": self.query_admission.max_concurrent,
+                "active": self.query_admission.active,
+            })
+
         @self.app.post("/api/v1/cache/invalidate")
         async def invalidate_cache(request: CacheInvalidateRequest):
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
                 result = self.db_manager.invalidate_schema_cache(request.table_name)
                 return self._success_response(result)
@@ -303,10 +587,8 @@ class MCPHTTPServer:
 
         @self.app.post("/api/v1/schema/reload")
         async def reload_schema_config():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.reload_schema_config()
+                result = await run_in_threadpool(self.db_manager.reload_schema_config)
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Schema reload failed: {e}")
@@ -314,28 +596,74 @@ class MCPHTTPServer:
 
         @self.app.get("/api/v1/schema/static/info")
         async def get_static_schema_info():
-            if not self.db_manager:
-                raise HTTPException(status_code=503, detail="Database manager not initialized")
             try:
-                result = self.db_manager.get_static_schema_info()
+                result = await run_in_threadpool(self.db_manager.get_static_schema_info)
                 return self._success_response(result)
             except Exception as e:
                 logger.error(f"Static schema info query failed: {e}")
                 return self._error_response(f"Static schema info query failed: {str(e)}")
 
-    def _success_response(self, data: Any) -> Dict[str, Any]:
-        return {
-            "success": True,
-            "data": data,
-            "timestamp": datetime.now().isoformat()
-        }
+    async def _probe_database(self) -> bool:
+        """Test the database connection, reusing the result for _HEALTH_CACHE_TTL.
+
+        Load balancers poll the health endpoint every few seconds per replica;
+        the cache keeps those probes from each costing a database round-trip.
+        """
+        if not self.db_manager:
+            return False
+
+        checked_at, connected = self._health_cache
+        now = time.monotonic()
+        if now - checked_at < _HEALTH_CACHE_TTL:
+            return connected
+
+        try:
+            result = await self.db_manager.test_connection_async()
+            connected = result.get("success", False)
+        except Exception:
+            connected = False
+        self._health_cache = (now, connected)
+        return connected
+
+    async def _require_admin(self, authorization: Optional[str] = Header(None)) -> None:
+        """Dependency guarding state-changing admin endpoints with ADMIN_API_TOKEN."""
+        token = self.http_config.admin_token
+        if not token:
+            raise HTTPException(
+                status_code=403, detail="Admin API disabled: ADMIN_API_TOKEN not set"
+            )
+        scheme, _, credentials = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            credentials.encode(), token.encode()
+        ):
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid admin token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    def _timestamp(self) -> str:
+        """Response timestamp; the cached value when CACHE_TIMESTAMPS is enabled."""
+        return self._cached_timestamp or datetime.now().isoformat()
 
-    def _error_response(self, error_message: str) -> Dict[str, Any]:
-        return {
-            "success": False,
-            "error": error_message,
-            "timestamp": datetime.now().isoformat()
-        }
+    async def _refresh_timestamp(self) -> None:
+        """Keep _cached_timestamp within _TIMESTAMP_REFRESH_INTERVAL of now."""
+        while True:
+            self._cached_timestamp = datetime.now().isoformat()
+            await asyncio.sleep(_TIMESTAMP_REFRESH_INTERVAL)
+
+    def _success_response(self, data: Any) -> Response:
+        return success_response(data, self._timestamp())
+
+    def _schema_response(self, result: Dict[str, Any]) -> Response:
+        """Full-schema response; streamed in batches once the object list is large."""
+        objects = result.get("results")
+        if isinstance(objects, list) and len(objects) >= _STREAM_MIN_OBJECTS:
+            return streaming_success_response(result, "results", self._timestamp())
+        return self._success_response(result)
+
+    def _error_response(self, error_message: str) -> Response:
+        return error_response(error_message, self._timestamp())
 
 
 async def create_server(config: Optional[DatabaseConfig] = None) -> MCPHTTPServer:
@@ -345,12 +673,59 @@ async def create_server(config: Optional[DatabaseConfig] = None) -> MCPHTTPServe
     return server
 
 
+def create_app() -> FastAPI:
+    """Application factory for multi-process servers.
+
+    Each worker process builds its own MCPHTTPServer; the database manager is
+    created in the lifespan, so every worker gets its own connection pool::
+
+        uvicorn http_server:create_app --factory --workers 4
+        gunicorn 'http_server:create_app()' -k uvicorn.workers.UvicornWorker -w 4
+    """
+    return MCPHTTPServer().app
+
+
 def run_http_server(
     host: str = "0.0.0.0",
     port: int = 8000,
-    config: Optional[DatabaseConfig] = None
+    config: Optional[DatabaseConfig] = None,
+    workers: Optional[int] = None,
+    http2: Optional[bool] = None
 ):
-    """Run HTTP server."""
+    """Run HTTP server.
+
+    With more than one worker (``workers`` or MCP_WORKERS), uvicorn spawns
+    that many processes serving create_app(); ``config`` cannot be handed to
+    them, so workers always read the database configuration from the environment.
+    ``http2`` (default: HTTP2) serves a single process with Hypercorn instead.
+    """
+    workers = workers or int(os.environ.get("MCP_WORKERS", "1"))
+    http_config = get_app_config().http_config
+    if http2 is None:
+        http2 = http_config.http2
+    if http2 and workers > 1:
+        logger.warning(
+            "MCP_WORKERS is ignored with HTTP/2; run hypercorn with --workers instead"
+        )
+    elif workers > 1:
+        if config is not None:
+            logger.warning(
+                "Explicit DatabaseConfig is ignored with multiple workers; "
+                "using environment"
+            )
+        # Parse the schema configs once here; each worker then loads the disk cache
+        from database.schema.static_loader import warm_disk_cache
+        warm_disk_cache()
+        uvicorn.run(
+            "http_server:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            log_level="info",
+        )
+        return
+
     async def start_server():
         server = MCPHTTPServer(config)
 
@@ -359,21 +734,82 @@ def run_http_server(
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
+        logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
         logger.info(f"Starting MCP Database HTTP API + SSE server at http://{host}:{port}")
         logger.info(f"API docs: http://{host}:{port}/docs")
         logger.info(f"MCP SSE endpoint: http://{host}:{port}/sse")
 
+        if http2:
+            await serve_http2(server.app, host, port, http_config)
+            return
+
         config_uvicorn = uvicorn.Config(
             server.app,
             host=host,
             port=port,
             log_level="info",
-            workers=int(os.environ.get("MCP_WORKERS", "1")),
         )
         server_uvicorn = uvicorn.Server(config_uvicorn)
         await server_uvicorn.serve()
 
-    asyncio.run(start_server())
+    run_event_loop(start_server())
+
+
+async def serve_http2(app, host: str, port: int, http_config: HTTPConfig) -> None:
+    """Serve ``app`` with Hypercorn, offering HTTP/2 alongside HTTP/1.1.
+
+    uvicorn only speaks HTTP/1.1, where browsers allow six SSE connections per
+    origin; over HTTP/2 all of a client's SSE streams share one connection.
+    """
+    try:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+    except ImportError:
+        raise RuntimeError(
+            "HTTP/2 requires hypercorn: pip install 'mcp-db[http2]'"
+        ) from None
+
+    hypercorn_config = Config()
+    hypercorn_config.bind = [f"{host}:{port}"]
+    hypercorn_config.alpn_protocols = ["h2", "http/1.1"]
+    # Idle keep-alive between requests; open SSE streams are not affected
+    hypercorn_config.keep_alive_timeout = 120
+    if http_config.tls_certfile and http_config.tls_keyfile:
+        hypercorn_config.certfile = http_config.tls_certfile
+        hypercorn_config.keyfile = http_config.tls_keyfile
+    else:
+        logger.warning(
+            "HTTP/2 without TLS: only clients using cleartext h2c will negotiate HTTP/2"
+        )
+
+    logger.info(f"Starting MCP Database HTTP/2 server (Hypercorn) at {host}:{port}")
+    await serve(app, hypercorn_config)
+
+
+def run_event_loop(coro) -> None:
+    """Run the server coroutine on uvloop when installed, else the stdlib loop.
+
+    ``Server.serve()`` runs on whichever loop is already running, so uvicorn's
+    ``loop`` setting never applies here; the loop has to be chosen up front.
+    uvloop is not available on Windows, which falls back to asyncio. The HTTP
+    parser needs no such care: uvicorn's ``http="auto"`` already picks
+    httptools when it is installed.
+
+    libuv's io_uring backend (``UV_USE_IO_URING``) is left to the environment:
+    it only covers file system requests, while sockets stay on epoll, so it
+    does nothing for HTTP or SSE traffic.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+        return
+
+    if hasattr(uvloop, "run"):
+        uvloop.run(coro)
+    else:
+        uvloop.install()
+        asyncio.run(coro)
 
 
 if __name__ == "__main__":
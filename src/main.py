@@ -13,6 +13,9 @@ Usage:
 
     # HTTP mode with custom host/port
     python main.py --http --host 0.0.0.0 --port 8000
+
+    # HTTP mode with one worker process per core
+    python main.py --http --workers 4
 """
 
 import asyncio
@@ -44,26 +47,23 @@ async def run_stdio_mode():
         sys.exit(1)
 
 
-async def run_http_mode(host: str = "0.0.0.0", port: int = 8000):
-    """Run MCP server in HTTP mode with REST API and SSE support.
+def create_http_app():
+    """Build the HTTP mode FastAPI application.
 
-    Args:
-        host: Host address to bind to (default: 0.0.0.0)
-        port: Port to listen on (default: 8000)
+    Used directly by run_http_mode and as the app factory for multi-worker
+    mode, where each worker process calls it and gets its own DatabaseManager.
 
-    This mode provides:
+    The application provides:
     - REST API endpoints for direct database operations
     - SSE (Server-Sent Events) MCP transport at /sse/
     - Full MCP protocol support via HTTP
     """
-    logger.info(f"Starting MCP Database Server in HTTP mode on {host}:{port}")
-
     from fastapi import FastAPI
-    import uvicorn
 
     from core.config import DatabaseConfig, AppConfig
     from database.manager import DatabaseManager
     from api.middleware import setup_middleware
+    from api.responses import FastJSONResponse
     from api.routes import router as api_router
     from protocol.sse_server import SseMCPServer
 
@@ -99,7 +99,11 @@ async def run_http_mode(host: str = "0.0.0.0", port: int = 8000):
     app = FastAPI(
         title="MCP Database API",
         version="2.0.0",
-        description="Model Context Protocol (MCP) Database Server - Database Tools & REST API"
+        description=(
+            "Model Context Protocol (MCP) Database Server - "
+            "Database Tools & REST API"
+        ),
+        default_response_class=FastJSONResponse
     )
 
     # Setup middleware (CORS, etc.)
@@ -130,6 +134,14 @@ async def run_http_mode(host: str = "0.0.0.0", port: int = 8000):
             }
         }
 
+    @app.on_event("startup")
+    async def size_threadpool():
+        # Sync database calls run in anyio's worker threads; widen the default pool
+        import anyio.to_thread
+        anyio.to_thread.current_default_thread_limiter().total_tokens = (
+            app_config.http_config.threadpool_size
+        )
+
     # Add graceful shutdown handler
     @app.on_event("shutdown")
     async def shutdown_event():
@@ -144,8 +156,9 @@ async def run_http_mode(host: str = "0.0.0.0", port: int = 8000):
         except Exception as e:
             logger.warning(f"Error clearing schema cache: {e}")
 
-        # Close database connections if needed
+        # Stop background schema refresh and close database connections
         try:
+            db_manager.close()
             if hasattr(db_manager, 'db_connector'):
                 logger.info("Database connections cleanup completed")
         except Exception as e:
@@ -153,6 +166,29 @@ async def run_http_mode(host: str = "0.0.0.0", port: int = 8000):
 
         logger.info("Graceful shutdown completed")
 
+    return app
+
+
+async def run_http_mode(host: str = "0.0.0.0", port: int = 8000, http2: bool = False):
+    """Run MCP server in HTTP mode with REST API and SSE support.
+
+    Args:
+        host: Host address to bind to (default: 0.0.0.0)
+        port: Port to listen on (default: 8000)
+        http2: Serve with Hypercorn (HTTP/2 + HTTP/1.1) instead of uvicorn
+    """
+    logger.info(f"Starting MCP Database Server in HTTP mode on {host}:{port}")
+
+    import uvicorn
+
+    app = create_http_app()
+
+    if http2:
+        from core.config import get_http_config
+        from http_server import serve_http2
+        await serve_http2(app, host, port, get_http_config())
+        return
+
     # Run server
     config = uvicorn.Config(
         app,
@@ -169,6 +205,31 @@ async def run_http_mode(host: str = "0.0.0.0", port: int = 8000):
         sys.exit(1)
 
 
+def run_http_workers(host: str, port: int, workers: int):
+    """Run HTTP mode in several worker processes sharing one listening socket.
+
+    Each worker imports this module and builds its own application (and
+    database connections) through create_http_app.
+    """
+    import uvicorn
+
+    logger.info(
+        f"Starting MCP Database Server in HTTP mode on {host}:{port} "
+        f"with {workers} workers"
+    )
+    # Parse the schema configs once here; each worker then loads the disk cache
+    from database.schema.static_loader import warm_disk_cache
+    warm_disk_cache()
+    uvicorn.run(
+        "main:create_http_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info"
+    )
+
+
 def main():
     """Main entry point with argument parsing."""
     import argparse
@@ -193,6 +254,17 @@ def main():
         default=None,
         help="Port for HTTP mode (default: from HTTP_PORT env or 8000)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for HTTP mode (default: from MCP_WORKERS env or 1)"
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Serve HTTP mode over HTTP/2 with Hypercorn (default: from HTTP2 env)"
+    )
 
     args = parser.parse_args()
 
@@ -200,7 +272,13 @@ def main():
         # HTTP mode
         host = args.host or os.getenv("HTTP_HOST", "0.0.0.0")
         port = args.port or int(os.getenv("HTTP_PORT", "8000"))
-        asyncio.run(run_http_mode(host, port))
+        workers = args.workers or int(os.getenv("MCP_WORKERS", "1"))
+        http2 = args.http2 or os.getenv("HTTP2", "0").lower() in ("1", "true")
+        if workers > 1 and not http2:
+            run_http_workers(host, port, workers)
+        else:
+            from http_server import run_event_loop
+            run_event_loop(run_http_mode(host, port, http2=http2))
     else:
         # STDIO mode (default)
         asyncio.run(run_stdio_mode())
@@ -3,11 +3,15 @@
 import logging
 from mcp.server import Server
 from database.manager import DatabaseManager
-from tools import get_all_tools
+from tools import ToolCall, get_all_tools
 from tools.handlers import handle_tool_call
 
 logger = logging.getLogger(__name__)
 
+# Returned by list_prompts/list_resources: none are offered. Immutable so it can be
+# shared; the MCP server validates it into a fresh result list on every call.
+EMPTY_LISTING = ()
+
 
 class BaseMCPServer:
     """Base MCP server providing core protocol functionality.
@@ -23,10 +27,10 @@ class BaseMCPServer:
             db_manager: DatabaseManager instance for database operations
             server_name: Name of the MCP server
         """
-        import os
+        from core.dependencies import get_app_config
         self.db_manager = db_manager
         if server_name is None:
-            server_name = os.getenv("MCP_SERVER_NAME", "mcp-db")
+            server_name = get_app_config().server_name
         self.server = Server(server_name)
         self._setup_handlers()
         logger.info(f"Initialized {server_name} MCP server")
@@ -42,18 +46,14 @@ class BaseMCPServer:
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict):
             """Handle tool execution."""
-            request = type('CallToolRequest', (), {
-                'name': name,
-                'arguments': arguments or {}
-            })()
-            return await handle_tool_call(request, self.db_manager)
+            return await handle_tool_call(ToolCall(name, arguments), self.db_manager)
 
         @self.server.list_prompts()
         async def list_prompts():
             """List available prompts (currently none)."""
-            return []
+            return EMPTY_LISTING
 
         @self.server.list_resources()
         async def list_resources():
             """List available resources (currently none)."""
-            return []
+            return EMPTY_LISTING
@@ -2,7 +2,7 @@
 
 import logging
 import os
-from typing import Optional, List
+from typing import FrozenSet, List, Optional, Tuple
 from mcp.server.sse import SseServerTransport
 from database.manager import DatabaseManager
 from protocol.base_server import BaseMCPServer
@@ -10,6 +10,22 @@ from core.config import get_http_config
 
 logger = logging.getLogger(__name__)
 
+# Preflight response headers that do not depend on the request. The response
+# does depend on Origin, so caches must key on it.
+_PREFLIGHT_BASE_HEADERS = (
+    (b'content-type', b'text/plain'),
+    (b'content-length', b'0'),
+    (b'vary', b'Origin'),
+)
+_PREFLIGHT_BODY = {'type': 'http.response.body', 'body': b''}
+
+_NOT_FOUND_START = {
+    'type': 'http.response.start',
+    'status': 404,
+    'headers': ((b'content-type', b'text/plain'), (b'content-length', b'9')),
+}
+_NOT_FOUND_BODY = {'type': 'http.response.body', 'body': b'Not Found'}
+
 
 class SseMCPServer(BaseMCPServer):
     """MCP server using HTTP/SSE transport."""
@@ -23,7 +39,7 @@ class SseMCPServer(BaseMCPServer):
         """
         super().__init__(db_manager)
         self.sse_transport = SseServerTransport(messages_path)
-        logger.info(f"SSE MCP server initialized with messages path: {messages_path}")
+        logger.info("SSE MCP server initialized with messages path: %s", messages_path)
 
     async def handle_sse_connection(self, scope, receive, send):
         """Handle SSE connection.
@@ -33,7 +49,7 @@ class SseMCPServer(BaseMCPServer):
             receive: ASGI receive callable
             send: ASGI send callable
         """
-        logger.info("Handling SSE connection")
+        logger.debug("Handling SSE connection")
         async with self.sse_transport.connect_sse(scope, receive, send) as streams:
             await self.server.run(
                 streams[0],
@@ -49,7 +65,7 @@ class SseMCPServer(BaseMCPServer):
             receive: ASGI receive callable
             send: ASGI send callable
         """
-        logger.info("Handling MCP messages")
+        logger.debug("Handling MCP messages")
         await self.sse_transport.handle_post_message(scope, receive, send)
 
     def create_asgi_app(self, allowed_origins: Optional[List[str]] = None):
@@ -76,83 +92,109 @@ class SseMCPServer(BaseMCPServer):
                     allowed_origins = []
                     logger.warning("SSE: ⚠️  生產環境未設定 CORS_ALLOWED_ORIGINS")
 
+        # Checked on every request: one hash lookup, with the wildcard resolved up front
+        allowed_set = frozenset(origin for origin in allowed_origins if origin)
+        allow_any = "*" in allowed_set
+
+        # Fixed for the app's lifetime, so encoded once rather than per preflight
+        http_config = get_http_config()
+        preflight_cors_headers = (
+            (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+            (b'access-control-allow-headers', b'Content-Type, Authorization'),
+            (b'access-control-allow-credentials', b'true'),
+            (
+                b'access-control-max-age',
+                str(http_config.cors_preflight_max_age).encode(),
+            ),
+        )
+
         async def app(scope, receive, send):
-            path = scope.get("path", "/")
-            method = scope.get("method", "GET")
+            # ASGI guarantees both keys on http scopes
+            path = scope["path"]
+            method = scope["method"]
 
-            logger.debug(f"SSE MCP app: method={method}, path={path}")
+            logger.debug("SSE MCP app: method=%s, path=%s", method, path)
 
             # Handle CORS preflight requests
             if method == "OPTIONS":
-                await self._handle_cors_preflight(scope, receive, send, allowed_origins)
+                await self._handle_cors_preflight(
+                    scope, send, allowed_set, allow_any, preflight_cors_headers
+                )
                 return
 
-            # Wrap send to add CORS headers
-            original_send = send
-            async def cors_send(message):
-                if message['type'] == 'http.response.start':
-                    headers = list(message.get('headers', []))
-                    # Add CORS headers
-                    origin = self._get_origin_from_scope(scope)
-                    if origin and (origin in allowed_origins or "*" in allowed_origins):
-                        headers.append((b'access-control-allow-origin', origin.encode()))
-                        headers.append((b'access-control-allow-credentials', b'true'))
-                    message['headers'] = headers
-                await original_send(message)
+            # Wrap send to add CORS headers; requests from other origins (or
+            # none) keep the plain send and pay nothing per message
+            origin = self._get_origin_from_scope(scope)
+            if origin and (allow_any or origin in allowed_set):
+                cors_headers = (
+                    (b'access-control-allow-origin', origin.encode('latin-1')),
+                    (b'access-control-allow-credentials', b'true'),
+                )
+                original_send = send
+
+                async def cors_send(message):
+                    if message['type'] == 'http.response.start':
+                        # Copied so shared (precomputed) messages are never modified
+                        message = dict(
+                            message,
+                            headers=[*message.get('headers', ()), *cors_headers],
+                        )
+                    await original_send(message)
+
+                send = cors_send
 
             # SSE connection endpoint (typically mounted at /sse/)
-            if method == "GET" and path.endswith("/"):
-                await self.handle_sse_connection(scope, receive, cors_send)
+            if method == "GET" and path[-1:] == "/":
+                await self.handle_sse_connection(scope, receive, send)
             # Messages endpoint (typically /sse/messages)
-            elif method == "POST" and "messages" in path:
-                await self.handle_messages(scope, receive, cors_send)
+            elif method == "POST" and path.endswith("messages"):
+                await self.handle_messages(scope, receive, send)
             else:
                 # 404 for unknown paths
-                logger.warning(f"Unknown path in SSE MCP app: {method} {path}")
-                await cors_send({
-                    'type': 'http.response.start',
-                    'status': 404,
-                    'headers': [[b'content-type', b'text/plain']],
-                })
-                await cors_send({
-                    'type': 'http.response.body',
-                    'body': b'Not Found',
-                })
+                logger.warning("Unknown path in SSE MCP app: %s %s", method, path)
+                await send(_NOT_FOUND_START)
+                await send(_NOT_FOUND_BODY)
 
         return app
 
     def _get_origin_from_scope(self, scope) -> Optional[str]:
-        """Extract origin from ASGI scope headers."""
-        headers = dict(scope.get('headers', []))
-        origin = headers.get(b'origin')
-        return origin.decode() if origin else None
+        """Extract origin from ASGI scope headers.
 
-    async def _handle_cors_preflight(self, scope, receive, send, allowed_origins: List[str]):
-        """Handle CORS preflight (OPTIONS) requests."""
-        origin = self._get_origin_from_scope(scope)
-        http_config = get_http_config()
+        ASGI header names are lowercase; header values are latin-1.
+        """
+        for name, value in scope.get('headers', ()):
+            if name == b'origin':
+                return value.decode('latin-1') if value else None
+        return None
+
+    async def _handle_cors_preflight(
+        self,
+        scope,
+        send,
+        allowed_set: FrozenSet[str],
+        allow_any: bool,
+        cors_headers: Tuple[Tuple[bytes, bytes], ...],
+    ):
+        """Handle CORS preflight (OPTIONS) requests.
 
-        headers = [
-            (b'content-type', b'text/plain'),
-            (b'content-length', b'0'),
-        ]
+        Args:
+            cors_headers: Precomputed allow-methods/headers/credentials/max-age headers
+        """
+        origin = self._get_origin_from_scope(scope)
 
         # Add CORS headers if origin is allowed
-        if origin and (origin in allowed_origins or "*" in allowed_origins):
-            headers.extend([
-                (b'access-control-allow-origin', origin.encode()),
-                (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
-                (b'access-control-allow-headers', b'Content-Type, Authorization'),
-                (b'access-control-allow-credentials', b'true'),
-                (b'access-control-max-age', str(http_config.cors_preflight_max_age).encode()),
-            ])
+        if origin and (allow_any or origin in allowed_set):
+            headers = (
+                _PREFLIGHT_BASE_HEADERS
+                + ((b'access-control-allow-origin', origin.encode('latin-1')),)
+                + cors_headers
+            )
+        else:
+            headers = _PREFLIGHT_BASE_HEADERS
 
         await send({
             'type': 'http.response.start',
             'status': 200,
             'headers': headers,
         })
-        await send({
-            'type': 'http.response.body',
-            'body': b'',
-        })
+        await send(_PREFLIGHT_BODY)
@@ -51,4 +51,7 @@ async def run_stdio_server(
 
     # Create and run server
     server = StdioMCPServer(db_manager)
-    await server.run()
+    try:
+        await server.run()
+    finally:
+        db_manager.close()
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import os
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -15,6 +15,8 @@ from mcp.types import (
 )
 
 from database.async_manager import HybridDatabaseManager
+from protocol.base_server import EMPTY_LISTING
+from tools.base import ToolCall
 from tools.registry import ToolRegistry
 from tools.definitions import DB_TOOLS as TOOLS_DEFINITIONS
 
@@ -80,23 +82,25 @@ async def main():
 
     @server.call_tool()
     async def call_tool(name: str, arguments: Optional[dict] = None) -> dict:
-        request = type('CallToolRequest', (), {
-            'name': name,
-            'arguments': arguments or {}
-        })()
-        return await handle_call_tool(request)
+        return await handle_call_tool(ToolCall(name, arguments))
 
     @server.list_prompts()
-    async def list_prompts() -> List[Prompt]:
-        return []
+    async def list_prompts() -> Sequence[Prompt]:
+        return EMPTY_LISTING
 
     @server.list_resources()
-    async def list_resources() -> List[Resource]:
-        return []
+    async def list_resources() -> Sequence[Resource]:
+        return EMPTY_LISTING
 
     logger.info(f"Starting MCP Database Server ({server_name})...")
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        if db_manager is not None:
+            await db_manager.close_async()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 """MCP tools package for Multi-Database Connector."""
 
-from tools.base import ToolHandler
+from tools.base import ToolCall, ToolHandler
 from tools.registry import ToolRegistry
 from tools.definitions import DB_TOOLS, get_all_tools, make_tool_name, get_tool_prefix
 from tools.validators import SQLValidator, InputValidator
 
 __all__ = [
+    'ToolCall',
     'ToolHandler',
     'ToolRegistry',
     'DB_TOOLS',
@@ -1,9 +1,27 @@
 """Base classes for MCP tool handlers."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from mcp.types import CallToolRequest
 
+# Shared, read-only arguments for calls made without any
+_NO_ARGUMENTS: Mapping[str, Any] = MappingProxyType({})
+
+
+class ToolCall:
+    """Lightweight tool call passed to handlers in place of ``CallToolRequest``.
+
+    Handlers only read ``name`` and ``arguments``, so the MCP call_tool
+    callbacks build one of these per call instead of a full request model.
+    """
+
+    __slots__ = ("name", "arguments")
+
+    def __init__(self, name: str, arguments: Optional[Mapping[str, Any]] = None):
+        self.name = name
+        self.arguments = arguments or _NO_ARGUMENTS
+
 
 class ToolHandler(ABC):
     """Abstract base class for MCP tool handlers."""
@@ -2,10 +2,15 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from mcp.types import Tool
 
+_TABLES_LIST_PATH = (
+    Path(__file__).parent.parent.parent / "schemas_config" / "tables_list.json"
+)
+
 
 def get_tool_prefix() -> str:
     """Get tool name prefix from environment or default."""
@@ -46,7 +51,7 @@ def get_key_tables_description() -> str:
     """
     prefix = get_tool_prefix()
     try:
-        tables_list_path = Path(__file__).parent.parent.parent / "schemas_config" / "tables_list.json"
+        tables_list_path = _TABLES_LIST_PATH
         if tables_list_path.exists():
             with open(tables_list_path, encoding='utf-8') as f:
                 tables_data = json.load(f)
@@ -76,13 +81,31 @@ def get_key_tables_description() -> str:
 def get_all_tools() -> List[Tool]:
     """Generate all MCP tool definitions with the configured prefix.
 
+    The definitions are built once per prefix and tables_list.json version,
+    so MCP list_tools calls only cost a stat of that file.
+
     Returns:
         List of Tool objects with prefixed names
     """
-    prefix = get_tool_prefix()
+    try:
+        stat = _TABLES_LIST_PATH.stat()
+        tables_list_version: Optional[Tuple[int, int]] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+    except OSError:
+        tables_list_version = None
+    return list(_build_tools(get_tool_prefix(), tables_list_version))
+
+
+@lru_cache(maxsize=8)
+def _build_tools(
+    prefix: str, tables_list_version: Optional[Tuple[int, int]]
+) -> Tuple[Tool, ...]:
+    """Build the tool definitions; tables_list_version only keys the cache."""
     _key_tables_desc = get_key_tables_description()
 
-    return [
+    return (
         Tool(
             name=f"{prefix}_{TOOL_QUERY}",
             description=(
@@ -241,7 +264,7 @@ def get_all_tools() -> List[Tool]:
                 "required": []
             }
         )
-    ]
+    )
 
 
 DB_TOOLS = get_all_tools()
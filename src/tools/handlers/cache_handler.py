@@ -2,6 +2,7 @@
 
 import logging
 from typing import Any, Dict, List
+import anyio.to_thread
 from mcp.types import CallToolRequest
 
 from tools.base import ToolHandler
@@ -38,7 +39,9 @@ class CacheHandler(ToolHandler):
             table_name = request.arguments.get("table_name")
             return self._handle_cache_invalidate(db_manager, table_name)
         elif request.name == make_tool_name(TOOL_SCHEMA_RELOAD):
-            return self._handle_schema_reload(db_manager)
+            return await anyio.to_thread.run_sync(
+                self._handle_schema_reload, db_manager
+            )
         else:
             return self._error_response(f"Unknown cache operation: {request.name}")
 
@@ -2,6 +2,7 @@
 
 import logging
 from typing import Any, Dict, List
+import anyio.to_thread
 from mcp.types import CallToolRequest
 
 from tools.base import ToolHandler
@@ -39,7 +40,9 @@ class DependencyHandler(ToolHandler):
         if not is_valid:
             return self._error_response(error_msg)
         
-        result = db_manager.get_table_dependencies(table_name)
+        result = await anyio.to_thread.run_sync(
+            db_manager.get_table_dependencies, table_name
+        )
         return self._format_dependencies(result, table_name)
 
     def _format_dependencies(self, result: Dict[str, Any], table_name: str) -> Dict[str, Any]:
@@ -2,6 +2,7 @@
 
 import logging
 from typing import Any, Dict, List
+import anyio.to_thread
 from mcp.types import CallToolRequest
 
 from tools.base import ToolHandler
@@ -33,9 +34,13 @@ class ExportHandler(ToolHandler):
             Export operation results
         """
         if request.name == make_tool_name(TOOL_EXPORT_SCHEMA):
-            return self._handle_export_schema(request, db_manager)
+            return await anyio.to_thread.run_sync(
+                self._handle_export_schema, request, db_manager
+            )
         elif request.name == make_tool_name(TOOL_STATIC_SCHEMA_INFO):
-            return self._handle_static_schema_info(db_manager)
+            return await anyio.to_thread.run_sync(
+                self._handle_static_schema_info, db_manager
+            )
         else:
             return self._error_response(f"Unknown export operation: {request.name}")
 
@@ -3,6 +3,7 @@
 import logging
 import os
 from typing import Any, Dict, List
+import anyio.to_thread
 from mcp.types import CallToolRequest
 
 from tools.base import ToolHandler
@@ -35,9 +36,13 @@ class SchemaHandler(ToolHandler):
         """
         if request.name == make_tool_name(TOOL_SCHEMA):
             table_name = request.arguments.get("table_name")
-            return self._handle_schema(db_manager, table_name)
+            return await anyio.to_thread.run_sync(
+                self._handle_schema, db_manager, table_name
+            )
         elif request.name == make_tool_name(TOOL_SCHEMA_SUMMARY):
-            return self._handle_schema_summary(db_manager)
+            return await anyio.to_thread.run_sync(
+                self._handle_schema_summary, db_manager
+            )
         else:
             return self._error_response(f"Unknown schema operation: {request.name}")
 
@@ -0,0 +1,78 @@
+"""
+並行准入控制單元測試
+
+測試查詢並行上限、釋放後喚醒與執行期調整上限。
+"""
+
+import asyncio
+
+import pytest
+
+from api.admission import AdmissionController
+
+
+class TestAdmissionController:
+    """並行准入控制測試"""
+
+    async def test_limits_concurrency(self):
+        """✅ 同時執行數不超過上限"""
+        controller = AdmissionController(2)
+        peak = 0
+
+        async def job():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.active)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(job() for _ in range(6)))
+
+        assert peak == 2
+        assert controller.active == 0
+
+    async def test_resize_wakes_waiters(self):
+        """✅ 提高上限後等待中的請求立即取得名額"""
+        controller = AdmissionController(1)
+        await controller.acquire()
+
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await controller.resize(2)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert controller.active == 2
+
+    async def test_release_on_error(self):
+        """✅ 執行失敗時仍釋放名額"""
+        controller = AdmissionController(1)
+
+        with pytest.raises(RuntimeError):
+            async with controller:
+                raise RuntimeError("query failed")
+
+        assert controller.active == 0
+
+    async def test_cancelled_release_frees_slot(self):
+        """✅ 釋放時被取消（如用戶端斷線）仍歸還名額並喚醒等待者"""
+        controller = AdmissionController(1)
+        await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+
+        async with controller._condition:
+            # 鎖被佔用時釋放只能等待，此時取消
+            release = asyncio.ensure_future(controller.release())
+            await asyncio.sleep(0)
+            release.cancel()
+            await asyncio.sleep(0)
+
+        await asyncio.wait_for(waiter, timeout=1)
+        assert release.cancelled()
+        assert controller.active == 1
+
+    def test_invalid_limit(self):
+        """❌ 上限必須至少為 1"""
+        with pytest.raises(ValueError):
+            AdmissionController(0)
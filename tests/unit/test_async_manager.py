@@ -367,6 +367,8 @@ class TestHybridDatabaseManager:
                 await manager.close_async()
 
                 mock_async_manager.close.assert_called_once()
+                # 同步管理器的背景預熱執行緒一併停止
+                mock_sync_manager.close.assert_called_once()
 
     def test_schema_cache_property(self, mock_sync_manager):
         """✅ schema_cache 屬性訪問"""
@@ -0,0 +1,41 @@
+"""
+工具定義單元測試
+
+測試 MCP 工具定義的前綴設定與快取行為。
+"""
+
+from tools import definitions
+from tools.definitions import get_all_tools
+
+
+class TestGetAllTools:
+    """工具定義快取測試"""
+
+    def test_definitions_reused(self):
+        """✅ 重複呼叫共用同一組工具定義，但回傳獨立的串列"""
+        first, second = get_all_tools(), get_all_tools()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_prefix_change_rebuilds(self, monkeypatch):
+        """✅ 變更工具前綴後重新產生定義"""
+        monkeypatch.setenv("TOOL_PREFIX", "erp")
+
+        names = [tool.name for tool in get_all_tools()]
+
+        assert names and all(name.startswith("erp_") for name in names)
+
+    def test_tables_list_change_rebuilds(self, tmp_path, monkeypatch):
+        """✅ tables_list.json 更新後重新產生定義"""
+        tables_list = tmp_path / "tables_list.json"
+        template = '{"importance_levels": {"critical": {"tables": ["%s"]}}}'
+        tables_list.write_text(template % "orders", encoding="utf-8")
+        monkeypatch.setattr(definitions, "_TABLES_LIST_PATH", tables_list)
+        first = get_all_tools()
+
+        tables_list.write_text(template % "invoices", encoding="utf-8")
+        second = get_all_tools()
+
+        assert "orders" in first[0].description
+        assert "invoices" in second[0].description
@@ -0,0 +1,170 @@
+"""
+Schema 格式化器單元測試
+
+測試 Schema 文件格式化與業務邏輯欄位描述的模式匹配。
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from database.schema.formatter import (
+    BusinessLogicEnhancer,
+    SchemaFormatter,
+    _Column,
+)
+
+
+@pytest.fixture
+def enhancer():
+    """不載入靜態映射的業務邏輯增強器"""
+    with patch.object(BusinessLogicEnhancer, "_load_static_mappings", return_value={}):
+        return BusinessLogicEnhancer()
+
+
+class TestBusinessLogicEnhancer:
+    """業務邏輯增強器模式匹配測試"""
+
+    def test_exact_match(self, enhancer):
+        """✅ 完整名稱精確匹配"""
+        assert enhancer._match_pattern("status") == "狀態"
+        assert enhancer._match_pattern("QTY") == "數量"
+
+    def test_suffix_match_strips_base_name(self, enhancer):
+        """✅ 後綴匹配會組合基底名稱"""
+        assert enhancer._match_pattern("CUSTOMER_ID") == "CUSTOMER編號"
+        assert enhancer._match_pattern("ORDER_LINE_NO") == "ORDERLINE序號"
+        assert enhancer._match_pattern("USER_NAME") == "USER名稱"
+
+    def test_suffix_without_base_name_falls_through(self, enhancer):
+        """✅ 只有後綴本身時不產生空白基底名稱"""
+        assert enhancer._match_pattern("_NAME") == "名稱"
+
+    def test_contains_match(self, enhancer):
+        """✅ 包含匹配"""
+        assert enhancer._match_pattern("UNIT_PRICE") == "價格"
+        assert enhancer._match_pattern("ISACTIVE") == "啓用狀態"
+
+    def test_no_match(self, enhancer):
+        """❌ 無匹配時返回 None"""
+        assert enhancer._match_pattern("XYZ") is None
+
+    def test_enhance_column_descriptions(self, enhancer):
+        """✅ 批次增強欄位描述"""
+        columns = [{"COLUMN_NAME": "order_id"}, {"COLUMN_NAME": "xyz"}]
+        enhanced = enhancer.enhance_column_descriptions(columns)
+        assert enhanced == {"ORDER_ID": "ORDER編號"}
+
+
+class TestSchemaFormatter:
+    """Schema 格式化器測試"""
+
+    def test_format_table_schema(self):
+        """✅ 表格 Schema 格式化"""
+        formatter = SchemaFormatter()
+        columns = [
+            {
+                "COLUMN_NAME": "ORDER_ID",
+                "DATA_TYPE": "INT",
+                "IS_NULLABLE": "NO",
+                "IS_PRIMARY_KEY": "YES",
+            },
+            {
+                "COLUMN_NAME": "AMOUNT",
+                "DATA_TYPE": "decimal",
+                "NUMERIC_PRECISION": 10,
+                "NUMERIC_SCALE": 2,
+                "IS_NULLABLE": "YES",
+            },
+        ]
+
+        output = formatter.format_table_schema("ORDERS", columns, table_comment="訂單")
+        lines = output.split("\n")
+
+        assert lines[0] == "分頁名稱: ORDERS 訂單"
+        assert "ORDER_ID" in lines[4] and "int" in lines[4] and "主鍵 必填" in lines[4]
+        assert "decimal(10, 2)" in lines[5] and "金額" in lines[5]
+
+    @pytest.mark.parametrize("data_type,length,precision,scale,expected", [
+        ("NVARCHAR", 50, None, None, "nvarchar(50)"),
+        ("varchar", None, None, None, "varchar"),
+        ("decimal", None, 18, 4, "decimal(18, 4)"),
+        ("numeric", None, 10, None, "numeric(10)"),
+        ("float", None, 53, None, "float(53)"),
+        ("datetime", None, None, None, "datetime"),
+    ])
+    def test_format_data_type(self, data_type, length, precision, scale, expected):
+        """✅ 資料類型長度/精度格式化"""
+        formatter = SchemaFormatter()
+        column = _Column.from_dict({
+            "DATA_TYPE": data_type,
+            "CHARACTER_MAXIMUM_LENGTH": length,
+            "NUMERIC_PRECISION": precision,
+            "NUMERIC_SCALE": scale,
+        })
+        assert formatter._format_data_type(column) == expected
+
+    def test_format_table_schema_memoized(self):
+        """✅ 相同欄位重複格式化使用記憶化結果"""
+        formatter = SchemaFormatter()
+        columns = [{"COLUMN_NAME": "ORDER_ID", "DATA_TYPE": "int"}]
+
+        first = formatter.format_table_schema("ORDERS", columns)
+        second = formatter.format_table_schema("ORDERS", [dict(c) for c in columns])
+        bigint_columns = [{"COLUMN_NAME": "ORDER_ID", "DATA_TYPE": "bigint"}]
+        changed = formatter.format_table_schema("ORDERS", bigint_columns)
+
+        assert first == second
+        assert "bigint" in changed
+        assert formatter._format_table_schema_cached.cache_info().hits == 1
+        assert SchemaFormatter()._format_table_schema_cached.cache_info().currsize == 0
+
+    def test_format_table_schema_unhashable_values(self):
+        """✅ 無法雜湊的欄位值仍可格式化"""
+        formatter = SchemaFormatter()
+        columns = [
+            {"COLUMN_NAME": "TAGS", "DATA_TYPE": "json", "COLUMN_DEFAULT": ["a"]}
+        ]
+
+        output = formatter.format_table_schema("ITEMS", columns)
+
+        assert "TAGS" in output
+
+    def test_format_table_list_groups_by_type(self):
+        """✅ 表格清單依類型分組"""
+        formatter = SchemaFormatter()
+        tables = [
+            {"TABLE_NAME": "V_ORDERS", "TABLE_TYPE": "VIEW", "TABLE_COMMENT": None},
+            {
+                "TABLE_NAME": "ORDERS",
+                "TABLE_TYPE": "BASE TABLE",
+                "TABLE_COMMENT": "訂單",
+            },
+        ]
+
+        output = formatter.format_table_list(tables)
+
+        assert output.index("# BASE TABLE") < output.index("# VIEW")
+        assert "(無說明)" in output
+        assert output.endswith("總計: 2 個資料庫物件")
+
+    def test_save_schema_to_file(self, tmp_path):
+        """✅ 儲存 Schema 文件（含頁尾）"""
+        formatter = SchemaFormatter()
+
+        filepath = formatter.save_schema_to_file("內容", "ORDERS", str(tmp_path))
+
+        content = open(filepath, encoding="utf-8").read()
+        assert content.startswith("內容\n\n# 生成時間: ")
+        assert content.endswith("\n# 表格名稱: ORDERS")
+
+    def test_save_table_list_overwrites(self, tmp_path):
+        """✅ 表格清單檔案覆寫（截斷舊內容）"""
+        formatter = SchemaFormatter()
+        formatter.save_table_list_to_file("x" * 100, str(tmp_path))
+
+        filepath = formatter.save_table_list_to_file("short", str(tmp_path))
+
+        content = open(filepath, encoding="utf-8").read()
+        assert content.startswith("short\n\n")
+        assert "x" not in content
@@ -0,0 +1,71 @@
+"""
+工具處理器單元測試
+
+測試 MCP 工具處理器將同步資料庫呼叫移出事件迴圈。
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from tools import ToolCall
+from tools.definitions import TOOL_DEPENDENCIES, TOOL_SCHEMA, make_tool_name
+from tools.handlers.dependency_handler import DependencyHandler
+from tools.handlers.schema_handler import SchemaHandler
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class TestBlockingHandlers:
+    """同步資料庫呼叫處理器測試"""
+
+    async def test_schema_runs_in_worker_thread(self):
+        """✅ 資料表結構查詢在工作執行緒執行"""
+        calls = []
+        db_manager = MagicMock()
+        db_manager.get_schema_info.side_effect = lambda table_name: (
+            calls.append(_in_event_loop()) or {"success": False, "error": "not found"}
+        )
+        request = ToolCall(make_tool_name(TOOL_SCHEMA), {"table_name": "orders"})
+
+        result = await SchemaHandler().handle(request, db_manager)
+
+        assert calls == [False]
+        assert "not found" in result["content"][0]["text"]
+
+    async def test_dependencies_runs_in_worker_thread(self):
+        """✅ 相依性分析在工作執行緒執行"""
+        calls = []
+        db_manager = MagicMock()
+        db_manager.get_table_dependencies.side_effect = lambda table_name: (
+            calls.append(_in_event_loop()) or {"success": False, "error": "unavailable"}
+        )
+        request = ToolCall(make_tool_name(TOOL_DEPENDENCIES), {"table_name": "orders"})
+
+        await DependencyHandler().handle(request, db_manager)
+
+        assert calls == [False]
+
+
+class TestToolCall:
+    """工具呼叫物件測試"""
+
+    def test_missing_arguments_shared_and_read_only(self):
+        """✅ 未帶參數時共用唯讀的空參數"""
+        first, second = ToolCall("db_schema"), ToolCall("db_schema", None)
+
+        assert first.arguments is second.arguments
+        assert first.arguments.get("table_name") is None
+        with pytest.raises(TypeError):
+            first.arguments["table_name"] = "orders"
+
+    def test_slots(self):
+        """✅ 不建立實例字典"""
+        assert not hasattr(ToolCall("db_query", {"query": "SELECT 1"}), "__dict__")
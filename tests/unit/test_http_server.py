@@ -0,0 +1,650 @@
+"""
+HTTP 伺服器單元測試
+
+測試 MCP SSE 傳輸的 ASGI 輔助函式、健康檢查探測快取與靜態端點。
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import http_server
+from core.config import HTTPConfig
+from http_server import MCPHTTPServer, _CoalescingSend, _unbuffered_sse_send
+
+
+def _body(data, more_body=True):
+    """ASGI 回應本文訊息"""
+    return {"type": "http.response.body", "body": data, "more_body": more_body}
+
+
+class TestUnbufferedSseSend:
+    """SSE 不緩衝標頭測試"""
+
+    async def test_adds_missing_headers(self):
+        """✅ 回應開始時補上不緩衝標頭"""
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        wrapped = _unbuffered_sse_send(send)
+        await wrapped(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            }
+        )
+        await wrapped(_body(b"data: 1\n\n"))
+
+        headers = dict(sent[0]["headers"])
+        assert headers[b"x-accel-buffering"] == b"no"
+        assert headers[b"cache-control"] == b"no-cache"
+        assert sent[1]["body"] == b"data: 1\n\n"
+
+    async def test_keeps_existing_headers(self):
+        """✅ 已存在的標頭不重複加入也不覆寫"""
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await _unbuffered_sse_send(send)({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"Cache-Control", b"no-store"), (b"X-Accel-Buffering", b"no")],
+        })
+
+        assert sent[0]["headers"] == [
+            (b"Cache-Control", b"no-store"),
+            (b"X-Accel-Buffering", b"no"),
+        ]
+
+
+class TestCoalescingSend:
+    """SSE 事件合併寫出測試"""
+
+    @pytest.fixture
+    def sent(self):
+        return []
+
+    @pytest.fixture
+    def send(self, sent):
+        async def send(message):
+            sent.append(message)
+
+        return send
+
+    async def test_burst_merged(self, send, sent):
+        """✅ 短時間內的多個事件合併為一次寫出"""
+        coalescing = _CoalescingSend(send, 0.01)
+        await coalescing({"type": "http.response.start", "status": 200, "headers": []})
+        for i in range(10):
+            await coalescing(_body(b"data: %d\n\n" % i))
+        assert len(sent) == 1
+
+        await asyncio.sleep(0.05)
+
+        assert len(sent) == 2
+        assert sent[1]["body"] == b"".join(b"data: %d\n\n" % i for i in range(10))
+        assert sent[1]["more_body"] is True
+
+    async def test_size_limit_flushes(self, send, sent, monkeypatch):
+        """✅ 暫存量達上限時立即寫出"""
+        monkeypatch.setattr(http_server, "_SSE_COALESCE_MAX_BYTES", 8)
+        coalescing = _CoalescingSend(send, 60)
+
+        await coalescing(_body(b"0123456789"))
+
+        assert sent == [_body(b"0123456789")]
+
+    async def test_size_flush_waits_for_inflight_write(self, monkeypatch):
+        """✅ 延遲寫出仍在進行時，達上限的寫出會等待而非並行送出"""
+        monkeypatch.setattr(http_server, "_SSE_COALESCE_MAX_BYTES", 4)
+        sent = []
+        in_flight = 0
+        overlapped = False
+
+        async def slow_send(message):
+            nonlocal in_flight, overlapped
+            in_flight += 1
+            overlapped = overlapped or in_flight > 1
+            await asyncio.sleep(0.02)
+            sent.append(message["body"])
+            in_flight -= 1
+
+        coalescing = _CoalescingSend(slow_send, 0)
+        await coalescing(_body(b"a"))
+        await asyncio.sleep(0.005)  # 延遲寫出已進入 slow_send
+        await coalescing(_body(b"bcdef"))
+
+        assert not overlapped
+        assert sent == [b"a", b"bcdef"]
+
+    async def test_final_body_keeps_order(self, send, sent):
+        """✅ 結束訊息先送出暫存內容再送出本身"""
+        coalescing = _CoalescingSend(send, 60)
+
+        await coalescing(_body(b"a"))
+        await coalescing(_body(b"", more_body=False))
+
+        assert [message["body"] for message in sent] == [b"a", b""]
+        assert sent[1]["more_body"] is False
+
+    async def test_send_error_raised_on_next_call(self, sent):
+        """❌ 延遲寫出失敗時於下一次送出回報錯誤"""
+        async def failing_send(message):
+            raise OSError("closed")
+
+        coalescing = _CoalescingSend(failing_send, 0)
+        await coalescing(_body(b"a"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(OSError):
+            await coalescing(_body(b"b"))
+
+
+class TestProbeDatabase:
+    """健康檢查資料庫探測快取測試"""
+
+    @pytest.fixture
+    def server(self):
+        server = MCPHTTPServer.__new__(MCPHTTPServer)
+        server._health_cache = (0.0, False)
+        server.db_manager = MagicMock()
+        server.db_manager.test_connection_async = AsyncMock(
+            return_value={"success": True}
+        )
+        return server
+
+    async def test_result_reused_within_ttl(self, server):
+        """✅ TTL 內重複探測不再連線資料庫"""
+        assert await server._probe_database() is True
+        assert await server._probe_database() is True
+
+        server.db_manager.test_connection_async.assert_awaited_once()
+
+    async def test_probe_after_ttl(self, server, monkeypatch):
+        """✅ 超過 TTL 後重新探測"""
+        await server._probe_database()
+        monkeypatch.setattr(http_server, "_HEALTH_CACHE_TTL", 0.0)
+
+        await server._probe_database()
+
+        assert server.db_manager.test_connection_async.await_count == 2
+
+    async def test_probe_failure_reports_disconnected(self, server):
+        """❌ 探測失敗時回報未連線"""
+        server.db_manager.test_connection_async.side_effect = RuntimeError("down")
+
+        assert await server._probe_database() is False
+
+    async def test_no_manager(self, server):
+        """❌ 資料庫管理器未初始化時回報未連線"""
+        server.db_manager = None
+
+        assert await server._probe_database() is False
+
+
+class TestToolsManifest:
+    """/api/v1/tools 靜態清單測試"""
+
+    def test_prerendered_manifest(self):
+        """✅ 預先序列化的清單維持標準回應格式"""
+        client = TestClient(MCPHTTPServer().app)
+
+        response = client.get("/api/v1/tools")
+        body = response.json()
+
+        assert response.headers["content-type"] == "application/json"
+        assert body["success"] is True
+        expected = [tool["name"] for tool in http_server._API_TOOLS_MANIFEST]
+        assert [tool["name"] for tool in body["data"]] == expected
+        assert body["timestamp"]
+
+
+class TestBlockingEndpoints:
+    """同步資料庫呼叫端點測試"""
+
+    def test_sync_call_runs_off_event_loop(self):
+        """✅ 同步資料庫呼叫在工作執行緒執行"""
+        server = MCPHTTPServer()
+        server.db_manager = MagicMock()
+        server.db_manager.get_schema_info.side_effect = lambda table_name: {
+            "table": table_name,
+            "in_event_loop": _in_event_loop(),
+        }
+
+        body = TestClient(server.app).get("/api/v1/schema/orders").json()
+
+        assert body["data"] == {"table": "orders", "in_event_loop": False}
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class TestTimestamp:
+    """回應時間戳測試"""
+
+    def test_uses_clock_by_default(self):
+        """✅ 未啟用快取時每次讀取時鐘"""
+        server = MCPHTTPServer.__new__(MCPHTTPServer)
+        server._cached_timestamp = None
+
+        timestamp = json.loads(server._error_response("x").body)["timestamp"]
+
+        assert datetime.fromisoformat(timestamp)
+        assert server._cached_timestamp is None
+
+    async def test_cached_timestamp_refreshed(self, monkeypatch):
+        """✅ 啟用快取時回應使用背景更新的時間戳"""
+        server = MCPHTTPServer.__new__(MCPHTTPServer)
+        server._cached_timestamp = None
+        monkeypatch.setattr(http_server, "_TIMESTAMP_REFRESH_INTERVAL", 0.01)
+
+        task = asyncio.ensure_future(server._refresh_timestamp())
+        await asyncio.sleep(0)
+        first = json.loads(server._success_response(None).body)["timestamp"]
+        assert first == server._cached_timestamp
+
+        await asyncio.sleep(0.05)
+        task.cancel()
+        assert json.loads(server._success_response(None).body)["timestamp"] >= first
+
+    def test_router_timestamp_bucketed(self, monkeypatch):
+        """✅ REST 路由啟用快取時同一時間區間共用時間戳"""
+        from api import routes
+        from core.config import HTTPConfig
+
+        monkeypatch.setattr(
+            routes, "get_http_config", lambda: HTTPConfig(cache_timestamps=True)
+        )
+        monkeypatch.setattr(routes, "_timestamp_cache", (-1, ""))
+        clock = iter([1000.01, 1000.15, 1000.25])
+        monkeypatch.setattr(routes.time, "time", lambda: next(clock))
+
+        first, second, third = (routes._timestamp() for _ in range(3))
+
+        assert first is second
+        assert third != first
+
+
+class TestHealthCheck:
+    """健康檢查端點測試"""
+
+    def test_health_payload_and_schema(self):
+        """✅ 回傳字典內容且 OpenAPI 仍記錄 HealthResponse"""
+        server = MCPHTTPServer()
+        server.db_manager = MagicMock()
+        server.db_manager.test_connection_async = AsyncMock(
+            return_value={"success": True}
+        )
+        client = TestClient(server.app)
+
+        response = client.get("/api/v1/health")
+        body = response.json()
+        schema = client.get("/openapi.json").json()
+
+        assert body["status"] == "healthy"
+        assert body["database_connected"] is True
+        assert response.headers["cache-control"] == "max-age=2"
+        response_200 = schema["paths"]["/api/v1/health"]["get"]["responses"]["200"]
+        ref = response_200["content"]["application/json"]["schema"]
+        assert ref["$ref"].endswith("/HealthResponse")
+
+
+class TestQueryRequest:
+    """查詢請求模型測試"""
+
+    def test_params_default_to_empty_list(self):
+        """✅ 省略或傳入 null 時 params 為空串列"""
+        from api.routes import QueryRequest
+
+        assert QueryRequest(query="SELECT 1").params == []
+        assert QueryRequest(query="SELECT 1", params=None).params == []
+
+
+class TestSseRouting:
+    """MCP SSE 子路由測試"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(MCPHTTPServer().app)
+
+    def test_post_message_dispatched(self, client):
+        """✅ POST /sse/messages 交給 SSE 傳輸處理（未知工作階段由傳輸回報錯誤）"""
+        response = client.post("/sse/messages?session_id=abc", json={})
+
+        assert response.status_code == 400
+        assert "session" in response.text.lower()
+
+    def test_wrong_method(self, client):
+        """❌ 不支援的方法回傳 405"""
+        assert client.post("/sse/").status_code == 405
+        assert client.get("/sse/messages").status_code == 405
+
+    def test_unknown_path(self, client):
+        """❌ 未知路徑回傳 404，並帶 content-length 避免用戶端等待分塊結束"""
+        response = client.get("/sse/unknown")
+
+        assert response.status_code == 404
+        assert response.headers["content-length"] == str(len(response.content))
+
+
+class TestSharedConfig:
+    """伺服器設定共用測試"""
+
+    def test_config_parsed_once(self, monkeypatch):
+        """✅ 多次建立伺服器共用同一份環境設定"""
+        from core.dependencies import get_app_config, reset_singletons
+
+        reset_singletons()
+        monkeypatch.setenv("MCP_SERVER_NAME", "shared-db")
+        try:
+            first, second = MCPHTTPServer(), MCPHTTPServer()
+
+            assert first.server_name == second.server_name == "shared-db"
+            shared = get_app_config().http_config
+            assert first.http_config is second.http_config is shared
+        finally:
+            reset_singletons()
+
+
+class TestEmptyListings:
+    """MCP 空白清單處理器測試"""
+
+    async def test_prompts_and_resources_empty(self):
+        """✅ prompts/resources 回傳空清單"""
+        from mcp import types
+
+        handlers = MCPHTTPServer().mcp_server.request_handlers
+        prompts = await handlers[types.ListPromptsRequest](
+            types.ListPromptsRequest(method="prompts/list")
+        )
+        resources = await handlers[types.ListResourcesRequest](
+            types.ListResourcesRequest(method="resources/list")
+        )
+
+        assert prompts.root.prompts == []
+        assert resources.root.resources == []
+
+    def test_listing_valid_for_older_mcp(self):
+        """✅ 舊版 MCP 一律以回傳值建立結果，共用的空清單仍可通過驗證"""
+        from mcp import types
+
+        from protocol.base_server import EMPTY_LISTING
+
+        assert types.ListPromptsResult(prompts=EMPTY_LISTING).prompts == []
+        assert types.ListResourcesResult(resources=EMPTY_LISTING).resources == []
+
+
+class TestRunHttpServer:
+    """伺服器啟動模式測試"""
+
+    def test_create_app_factory(self):
+        """✅ 應用工廠每次建立獨立的應用"""
+        first, second = http_server.create_app(), http_server.create_app()
+
+        assert first is not second
+        assert any(
+            getattr(route, "path", None) == "/api/v1/health" for route in first.routes
+        )
+
+    def test_multiple_workers_use_factory(self, monkeypatch):
+        """✅ 多 worker 時以工廠交給 uvicorn 啟動多個行程"""
+        run = MagicMock()
+        warm = MagicMock(return_value=True)
+        monkeypatch.setattr(http_server.uvicorn, "run", run)
+        monkeypatch.setattr("database.schema.static_loader.warm_disk_cache", warm)
+
+        http_server.run_http_server("127.0.0.1", 9000, workers=3)
+
+        warm.assert_called_once_with()
+
+        run.assert_called_once()
+        assert run.call_args.args == ("http_server:create_app",)
+        assert run.call_args.kwargs["factory"] is True
+        assert run.call_args.kwargs["workers"] == 3
+
+    async def test_http2_requires_hypercorn(self, monkeypatch):
+        """❌ 未安裝 hypercorn 時啟用 HTTP/2 回報安裝方式"""
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name.startswith("hypercorn"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+
+        with pytest.raises(RuntimeError, match=r"mcp-db\[http2\]"):
+            await http_server.serve_http2(
+                MagicMock(), "127.0.0.1", 9000, HTTPConfig(http2=True)
+            )
+
+    async def test_http2_config(self, monkeypatch):
+        """✅ HTTP/2 以 Hypercorn 提供 h2 與 TLS 設定"""
+        pytest.importorskip("hypercorn")
+        import hypercorn.asyncio
+
+        serve = AsyncMock()
+        monkeypatch.setattr(hypercorn.asyncio, "serve", serve)
+        config = HTTPConfig(http2=True, tls_certfile="cert.pem", tls_keyfile="key.pem")
+
+        await http_server.serve_http2("app", "127.0.0.1", 9000, config)
+
+        hypercorn_config = serve.await_args.args[1]
+        assert hypercorn_config.bind == ["127.0.0.1:9000"]
+        assert hypercorn_config.alpn_protocols == ["h2", "http/1.1"]
+        assert hypercorn_config.certfile == "cert.pem"
+
+
+class TestRouteOrder:
+    """路由順序測試"""
+
+    def test_hot_routes_first(self):
+        """✅ 高頻端點排在路由表最前，其餘維持註冊順序"""
+        routes = MCPHTTPServer().app.router.routes
+        paths = [getattr(route, "path", None) for route in routes]
+
+        assert paths[:2] == ["/api/v1/health", "/api/v1/query"]
+        reload_index = paths.index("/api/v1/schema/reload")
+        assert reload_index < paths.index("/api/v1/schema/static/info")
+
+
+class TestSchemaStreaming:
+    """完整結構描述串流回應測試"""
+
+    @pytest.fixture
+    def server(self):
+        server = MCPHTTPServer()
+        server.db_manager = MagicMock()
+        return server
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_large_schema_streamed(self, server, monkeypatch, use_orjson):
+        """✅ 物件數量超過門檻時分批串流，內容與一般回應相同"""
+        from api import responses
+
+        if not use_orjson:
+            monkeypatch.setattr(responses, "orjson", None)
+        monkeypatch.setattr(http_server, "_STREAM_MIN_OBJECTS", 3)
+        objects = [{"name": f"t{i}", "type": "TABLE"} for i in range(450)]
+        result = {"success": True, "results": objects, "total_count": 450}
+        server.db_manager.get_schema_info.return_value = result
+
+        response = TestClient(server.app).get("/api/v1/schema")
+        body = response.json()
+
+        assert "content-length" not in response.headers
+        assert body["success"] is True
+        assert body["data"] == result
+        assert body["timestamp"]
+
+    def test_small_schema_not_streamed(self, server):
+        """✅ 物件數量少時一次輸出"""
+        server.db_manager.get_schema_info.return_value = {
+            "success": True,
+            "results": [],
+            "total_count": 0,
+        }
+
+        response = TestClient(server.app).get("/api/v1/schema")
+
+        assert response.headers["content-length"] == str(len(response.content))
+        assert response.json()["data"]["results"] == []
+
+
+class TestQueryRateLimit:
+    """查詢端點速率限制測試"""
+
+    @pytest.fixture(autouse=True)
+    def reset_counters(self):
+        from api.middleware import limiter
+
+        limiter.reset()
+        yield
+        limiter.reset()
+
+    def test_limit_registered_once(self):
+        """✅ 多次建立伺服器共用同一限制器且限制只註冊一次"""
+        from api.middleware import limiter
+
+        first, second = MCPHTTPServer(), MCPHTTPServer()
+
+        assert first.app.state.limiter is second.app.state.limiter is limiter
+        assert len(limiter._route_limits["http_server._query_rate_limit"]) == 1
+
+    def test_limit_shared_across_instances(self, monkeypatch):
+        """❌ 超過限制後回傳 429，計數不因重建伺服器而重置"""
+        from api.middleware import limiter
+
+        limit = limiter._route_limits["http_server._query_rate_limit"][0].limit.amount
+        clients = []
+        for _ in range(2):
+            server = MCPHTTPServer()
+            server.db_manager = MagicMock()
+            server.db_manager.execute_query_async = AsyncMock(
+                return_value={"success": True}
+            )
+            clients.append(TestClient(server.app))
+
+        statuses = [
+            clients[i % 2].post("/api/v1/query", json={"query": "SELECT 1"}).status_code
+            for i in range(limit + 1)
+        ]
+
+        assert statuses[:limit] == [200] * limit
+        assert statuses[-1] == 429
+
+
+class TestDatabaseReadyMiddleware:
+    """資料庫未就緒時的 503 回應測試"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(MCPHTTPServer().app)
+
+    def test_database_routes_rejected(self, client):
+        """❌ 資料庫管理器尚未建立時資料庫端點回傳 503"""
+        for method, path in (
+            ("get", "/api/v1/schema"),
+            ("get", "/api/v1/summary"),
+            ("post", "/api/v1/cache/invalidate"),
+        ):
+            response = getattr(client, method)(path)
+
+            assert response.status_code == 503
+            assert response.json() == {"detail": "Database manager not initialized"}
+
+    def test_independent_routes_served(self, client):
+        """✅ 不需資料庫的端點照常回應"""
+        assert client.get("/api/v1/tools").status_code == 200
+        assert client.get("/api/v1/admin/concurrency").status_code == 200
+        assert client.get("/openapi.json").status_code == 200
+
+    def test_ready_manager_passes_through(self):
+        """✅ 資料庫管理器建立後請求交給路由處理"""
+        server = MCPHTTPServer()
+        server.db_manager = MagicMock()
+        server.db_manager.get_schema_summary.return_value = {"tables": 3}
+
+        response = TestClient(server.app).get("/api/v1/summary")
+
+        assert response.status_code == 200
+        assert response.json()["data"] == {"tables": 3}
+
+
+class TestAdminConcurrency:
+    """並行上限管理端點測試"""
+
+    @pytest.fixture
+    def server(self):
+        server = MCPHTTPServer()
+        server.http_config = HTTPConfig(admin_token="s3cret")
+        return server
+
+    def test_set_limit_with_token(self, server):
+        """✅ 攜帶正確 token 時可調整上限"""
+        response = TestClient(server.app).post(
+            "/api/v1/admin/concurrency",
+            json={"max_concurrent": 4},
+            headers={"Authorization": "Bearer s3cret"},
+        )
+
+        assert response.status_code == 200
+        assert server.query_admission.max_concurrent == 4
+
+    def test_rejected_without_valid_token(self, server):
+        """❌ 未帶或帶錯 token 時回傳 401 且上限不變"""
+        client = TestClient(server.app)
+        before = server.query_admission.max_concurrent
+
+        bad_headers = (
+            {},
+            {"Authorization": "Bearer wrong"},
+            {"Authorization": "s3cret"},
+        )
+        for headers in bad_headers:
+            response = client.post(
+                "/api/v1/admin/concurrency", json={"max_concurrent": 1}, headers=headers
+            )
+            assert response.status_code == 401
+
+        assert server.query_admission.max_concurrent == before
+
+    def test_disabled_without_configured_token(self, server):
+        """❌ 未設定 ADMIN_API_TOKEN 時停用調整端點"""
+        server.http_config = HTTPConfig()
+
+        response = TestClient(server.app).post(
+            "/api/v1/admin/concurrency",
+            json={"max_concurrent": 1},
+            headers={"Authorization": "Bearer "},
+        )
+
+        assert response.status_code == 403
+
+    def test_upper_bound(self, server):
+        """❌ 超過上限的數值被拒絕"""
+        from api.routes import MAX_CONCURRENCY_LIMIT
+
+        response = TestClient(server.app).post(
+            "/api/v1/admin/concurrency",
+            json={"max_concurrent": MAX_CONCURRENCY_LIMIT + 1},
+            headers={"Authorization": "Bearer s3cret"},
+        )
+
+        assert response.status_code == 422
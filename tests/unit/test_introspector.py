@@ -0,0 +1,501 @@
+"""
+Schema 探查器單元測試
+
+使用模擬的資料庫連線測試 SQL Server / PostgreSQL 探查器的結果組裝與快取行為。
+"""
+
+import logging
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from database.schema.introspector import (
+    BaseSchemaInspector,
+    ColumnRow,
+    MSSQLSchemaInspector,
+    PostgreSQLSchemaInspector,
+    TTLCache,
+    create_schema_inspector,
+)
+
+
+def make_connection(cursor):
+    """建立回傳指定 cursor 的連線 context manager"""
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+    cursor.__enter__.return_value = cursor
+
+    @contextmanager
+    def get_connection():
+        yield conn
+
+    return get_connection
+
+
+class LegacyInspector(BaseSchemaInspector):
+    """只實作原有抽象方法的舊版子類別"""
+
+    def get_schema_info(self, table_name=None):
+        if table_name is None:
+            return {
+                "success": True,
+                "results": [
+                    {
+                        "TABLE_SCHEMA": "dbo",
+                        "TABLE_NAME": "USERS",
+                        "TABLE_TYPE": "BASE TABLE",
+                        "TABLE_COMMENT": None,
+                    },
+                ],
+            }
+        return {
+            "success": True,
+            "table_name": table_name,
+            "results": [
+                {
+                    "COLUMN_NAME": "ID",
+                    "DATA_TYPE": "int",
+                    "IS_NULLABLE": "NO",
+                    "COLUMN_DEFAULT": None,
+                    "CHARACTER_MAXIMUM_LENGTH": None,
+                    "NUMERIC_PRECISION": 10,
+                    "NUMERIC_SCALE": 0,
+                    "IS_PRIMARY_KEY": "YES",
+                    "REFERENCED_TABLE_NAME": None,
+                    "REFERENCED_COLUMN_NAME": None,
+                    "COLUMN_COMMENT": None,
+                },
+            ],
+        }
+
+    def get_table_dependencies(self, table_name):
+        return {
+            "success": True,
+            "table_name": table_name,
+            "dependencies": [{"parent_table": table_name, "referenced_table": "USERS"}],
+        }
+
+    def get_schema_summary(self):
+        return {"success": True, "tables": 1, "views": 0}
+
+
+@pytest.fixture
+def mssql_config():
+    return SimpleNamespace(db_type="mssql", schema="dbo")
+
+
+@pytest.fixture
+def pg_config():
+    return SimpleNamespace(db_type="postgresql", schema="public")
+
+
+class TestTTLCache:
+    """TTL 快取測試"""
+
+    def test_set_and_get(self):
+        """✅ 基本 set/get 與統計"""
+        cache = TTLCache(ttl=60)
+        cache.set(("k",), {"v": 1})
+
+        assert cache.get(("k",)) == {"v": 1}
+        assert cache.get(("missing",)) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expiry(self):
+        """⏰ 過期項目不再返回"""
+        cache = TTLCache(ttl=60)
+        cache.set(("k",), "v", ttl=-1)
+        assert cache.get(("k",)) is None
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate_with_predicate(self):
+        """✅ 依條件失效化"""
+        cache = TTLCache()
+        cache.set(("a", 1), 1)
+        cache.set(("b", 2), 2)
+
+        cache.invalidate(lambda key: key[0] == "a")
+
+        assert cache.get(("a", 1)) is None
+        assert cache.get(("b", 2)) == 2
+
+
+class TestMSSQLSchemaInspector:
+    """SQL Server 探查器測試"""
+
+    def test_table_schema_rows(self, mssql_config):
+        """✅ 欄位資料列轉換"""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("ID", "int", "NO", None, None, 10, 0, "YES", None, None, "主鍵"),
+            ("NAME", "nvarchar", "YES", None, 50, None, None, "NO", None, None, None),
+        ]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        result = inspector.get_schema_info("USERS")
+
+        assert result["success"] is True
+        assert result["total_count"] == 2
+        assert result["results"][0]["IS_PRIMARY_KEY"] == "YES"
+        assert result["results"][0]["COLUMN_COMMENT"] == "主鍵"
+        assert result["results"][1]["IS_NULLABLE"] == "YES"
+        assert result["results"][1]["IS_PRIMARY_KEY"] == "NO"
+        assert cursor.execute.call_args[0][1] == ("USERS",)
+        # 依名稱比對（不限預設 schema），與 INFORMATION_SCHEMA.COLUMNS 相同
+        assert "o.name = ?" in cursor.execute.call_args[0][0]
+        assert "OBJECT_ID(" not in cursor.execute.call_args[0][0]
+
+    def test_database_schema_skips_diagnostic_by_default(self, mssql_config):
+        """✅ 未啟用 debug_schema 時僅執行一次主查詢"""
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [[("dbo", "USERS", "BASE TABLE", None)], []]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        result = inspector.get_schema_info()
+
+        assert result["total_count"] == 1
+        assert cursor.execute.call_count == 1
+
+        summary = inspector.get_schema_summary()
+        assert summary["tables"] == 1 and summary["views"] == 0
+        assert cursor.execute.call_count == 1
+        assert "DB_NAME()" not in cursor.execute.call_args[0][0]
+        cursor.nextset.assert_not_called()
+
+    def test_database_schema_diagnostic_batched(self, mssql_config, caplog):
+        """✅ 啟用 debug_schema 時診斷與主查詢合併為單一批次"""
+        caplog.set_level(logging.INFO, logger="database.schema.introspector")
+        mssql_config.debug_schema = True
+        cursor = MagicMock()
+        cursor.fetchone.return_value = ("TESTDB", 1)
+        cursor.fetchmany.side_effect = [[("dbo", "USERS", "BASE TABLE", "使用者")], []]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        result = inspector.get_schema_info()
+
+        assert result["results"][0]["TABLE_COMMENT"] == "使用者"
+        assert cursor.execute.call_count == 1
+        assert "DB_NAME()" in cursor.execute.call_args[0][0]
+        cursor.nextset.assert_called_once()
+        assert "Current DB: TESTDB" in caplog.text
+
+    def test_results_cached_until_invalidated(self, mssql_config):
+        """✅ 成功結果快取，失效化後重新查詢"""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("FK_A", "ORDERS", "USER_ID", "USERS", "ID")]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        first = inspector.get_table_dependencies("ORDERS")
+        second = inspector.get_table_dependencies("ORDERS")
+
+        assert first == second
+        assert first["dependencies"][0]["referenced_table"] == "USERS"
+        assert cursor.execute.call_count == 1
+
+        inspector.invalidate_schema_cache("orders")
+        inspector.get_table_dependencies("ORDERS")
+        assert cursor.execute.call_count == 2
+
+    def test_dependencies_bulk_single_round_trip(self, mssql_config):
+        """✅ 多個表格的依賴關係以單次查詢取得並逐表快取"""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("FK_A", "Orders", "USER_ID", "USERS", "ID"),
+            ("FK_B", "ORDERS", "ITEM_ID", "ITEMS", "ID"),
+        ]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        result = inspector.get_table_dependencies_bulk(["ORDERS", "USERS"])
+
+        assert result["success"] is True
+        orders = result["dependencies"]["ORDERS"]
+        assert [d["constraint_name"] for d in orders] == ["FK_A", "FK_B"]
+        assert result["dependencies"]["USERS"] == []
+        assert cursor.execute.call_count == 1
+        assert "IN (?, ?)" in cursor.execute.call_args[0][0]
+
+        assert inspector.get_table_dependencies("USERS")["dependencies"] == []
+        assert cursor.execute.call_count == 1
+
+    def test_errors_not_cached(self, mssql_config):
+        """❌ 失敗結果不快取"""
+        cursor = MagicMock()
+        cursor.execute.side_effect = RuntimeError("boom")
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        assert inspector.get_schema_summary()["success"] is False
+        assert inspector.get_schema_summary()["success"] is False
+        assert cursor.execute.call_count == 2
+
+
+    def test_schema_summary(self, mssql_config):
+        """✅ Schema 摘要（單次條件聚合）"""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (None, None)
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        result = inspector.get_schema_summary()
+
+        assert result["tables"] == 0 and result["views"] == 0
+        assert cursor.execute.call_count == 1
+
+    def test_refresh_database_schema_replaces_cached_overview(self, mssql_config):
+        """✅ 背景刷新直接替換快取中的資料庫概覽"""
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [
+            [("dbo", "A", "BASE TABLE", None)],
+            [],
+            [("dbo", "B", "VIEW", None)],
+            [],
+        ]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        assert inspector.get_schema_info()["results"][0]["TABLE_NAME"] == "A"
+        inspector.refresh_database_schema()
+
+        assert inspector.get_schema_info()["results"][0]["TABLE_NAME"] == "B"
+        assert cursor.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_snapshot_async(self, mssql_config):
+        """✅ 非同步並行執行 schema 探查"""
+        inspector = MSSQLSchemaInspector(MagicMock(), mssql_config)
+        inspector._get_table_schema = MagicMock(
+            return_value={"success": True, "results": []}
+        )
+        inspector.get_schema_summary = MagicMock(
+            return_value={"success": True, "tables": 1}
+        )
+        inspector.get_table_dependencies = MagicMock(
+            return_value={"success": True, "dependencies": []}
+        )
+
+        snapshot = await inspector.get_schema_snapshot_async("USERS")
+
+        assert set(snapshot) == {"schema_info", "summary", "dependencies"}
+        assert snapshot["summary"]["tables"] == 1
+        inspector.get_table_dependencies.assert_called_once_with("USERS")
+
+
+    def test_iter_database_schema_streams_batches(self, mssql_config):
+        """✅ 以 fetchmany 分批串流資料庫物件"""
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [
+            [("dbo", "A", "BASE TABLE", None), ("dbo", "B", "VIEW", "")],
+            [("dbo", "C", "".join(["BASE ", "TABLE"]), "說明")],
+            [],
+        ]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        tables = list(inspector.iter_database_schema())
+
+        assert [t["TABLE_NAME"] for t in tables] == ["A", "B", "C"]
+        assert tables[0]["TABLE_TYPE"] is tables[2]["TABLE_TYPE"]
+        assert tables[1]["TABLE_COMMENT"] is None
+        cursor.fetchall.assert_not_called()
+
+
+    def test_iter_table_columns_yields_records(self, mssql_config):
+        """✅ 串流欄位以 ColumnRow 記錄返回"""
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [
+            [("ID", "int", "NO", None, None, 10, 0, "YES", None, None, "")],
+            [],
+        ]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        rows = list(inspector.iter_table_columns("USERS"))
+
+        assert rows == [
+            ColumnRow("ID", "int", "NO", None, None, 10, 0, "YES", None, None, None)
+        ]
+        assert rows[0].IS_PRIMARY_KEY == "YES"
+
+
+class TestInspectorCacheIsolation:
+    """探查器快取與呼叫端隔離測試"""
+
+    def test_caller_mutation_not_cached(self, mssql_config):
+        """✅ 呼叫端修改回傳結果不影響快取內容"""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("ID", "int", "NO", None, None, 10, 0, "YES", None, None, None)
+        ]
+        inspector = MSSQLSchemaInspector(make_connection(cursor), mssql_config)
+
+        first = inspector.get_schema_info("USERS")
+        first["cache_source"] = "database_query"
+        first["results"].clear()
+        second = inspector.get_schema_info("USERS")
+
+        assert "cache_source" not in second
+        assert len(second["results"]) == 1
+        assert cursor.execute.call_count == 1
+
+    def test_cache_ttl_from_config(self):
+        """✅ TTL 取自 DatabaseConfig.schema_cache_ttl"""
+        from core.config import DatabaseConfig
+
+        config = DatabaseConfig(
+            db_type="mssql", server="h", database="d", schema_cache_ttl=5
+        )
+        inspector = MSSQLSchemaInspector(MagicMock(), config)
+
+        assert inspector._cache.ttl == 5
+
+
+class TestPostgreSQLSchemaInspector:
+    """PostgreSQL 探查器測試"""
+
+    def test_table_schema_rows(self, pg_config):
+        """✅ 欄位資料列轉換（PostgreSQL 欄位命名）"""
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("user_id", "integer", "NO", None, None, 32, 0, "NO", "users", "id", ""),
+        ]
+        inspector = PostgreSQLSchemaInspector(make_connection(cursor), pg_config)
+
+        column = inspector.get_schema_info("orders")["results"][0]
+
+        assert cursor.execute.call_args[0][1] == ("public", "orders")
+
+        assert column["IS_PRIMARY_KEY"] == "NO"
+        assert column["REFERENCED_TABLE"] == "users"
+        assert column["COLUMN_COMMENT"] is None
+
+    def test_table_schema_information_schema_types(self, pg_config):
+        """✅ 陣列/列舉/domain 欄位的 data_type 與 information_schema.columns 一致"""
+        from database.schema.introspector import _PG_TABLE_SCHEMA_SQL
+
+        cursor = MagicMock()
+        # information_schema.columns 對 integer[]、enum、varchar(20) domain 回傳的資料列
+        cursor.fetchall.return_value = [
+            ("tags", "ARRAY", "YES", None, None, None, None, "NO", None, None, None),
+            ("status", "USER-DEFINED", "NO", None, None, None, None,
+             "NO", None, None, None),
+            ("code", "character varying", "YES", None, 20, None, None,
+             "NO", None, None, None),
+        ]
+        inspector = PostgreSQLSchemaInspector(make_connection(cursor), pg_config)
+
+        columns = inspector.get_schema_info("orders")["results"]
+
+        data_types = [c["DATA_TYPE"] for c in columns]
+        assert data_types == ["ARRAY", "USER-DEFINED", "character varying"]
+        assert columns[2]["CHARACTER_MAXIMUM_LENGTH"] == 20
+        assert "'ARRAY'" in _PG_TABLE_SCHEMA_SQL
+        assert "'USER-DEFINED'" in _PG_TABLE_SCHEMA_SQL
+        assert "format_type(t.typbasetype, NULL)" in _PG_TABLE_SCHEMA_SQL
+        assert "_pg_char_max_length(a.atttypid" not in _PG_TABLE_SCHEMA_SQL
+
+    def test_schema_summary(self, pg_config):
+        """✅ Schema 摘要"""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (3, 1)
+        inspector = PostgreSQLSchemaInspector(make_connection(cursor), pg_config)
+
+        result = inspector.get_schema_summary()
+
+        assert result["success"] is True
+        assert result["summary"] == {"Tables": 3, "Views": 1}
+
+
+class TestBaseInspectorDefaults:
+    """基底類別預設實作測試（舊版子類別相容）"""
+
+    def test_bulk_dependencies_default(self, mssql_config):
+        """✅ 未覆寫 _fetch_dependencies_bulk 時逐表查詢"""
+        inspector = LegacyInspector(MagicMock(), mssql_config)
+
+        result = inspector.get_table_dependencies_bulk(["ORDERS", "ITEMS"])
+
+        assert result["success"] is True
+        assert result["dependencies"]["ITEMS"][0]["parent_table"] == "ITEMS"
+
+    def test_refresh_database_schema_default(self, mssql_config):
+        """✅ 未覆寫 _get_database_schema 時由 get_schema_info() 重新整理"""
+        inspector = LegacyInspector(MagicMock(), mssql_config)
+
+        result = inspector.refresh_database_schema()
+
+        assert result["results"][0]["TABLE_NAME"] == "USERS"
+        assert inspector._cache.get(inspector._cache_key("get_schema_info")) is result
+
+    def test_iter_database_schema_default(self, mssql_config):
+        """✅ 未覆寫 iter_database_schema 時走訪 get_schema_info() 結果"""
+        inspector = LegacyInspector(MagicMock(), mssql_config)
+
+        objects = list(inspector.iter_database_schema())
+
+        assert [obj["TABLE_NAME"] for obj in objects] == ["USERS"]
+
+    def test_iter_table_columns_default(self, mssql_config):
+        """✅ 未覆寫 iter_table_columns 時由 get_schema_info() 轉為 ColumnRow"""
+        inspector = LegacyInspector(MagicMock(), mssql_config)
+
+        columns = list(inspector.iter_table_columns("USERS"))
+
+        assert columns[0] == ColumnRow(
+            "ID", "int", "NO", None, None, 10, 0, "YES", None, None, None
+        )
+
+    def test_summary_not_primed_by_default(self, mssql_config):
+        """✅ 未覆寫 _summary_from_counts 時不預填摘要快取"""
+        inspector = LegacyInspector(MagicMock(), mssql_config)
+
+        inspector._prime_summary([{"TABLE_TYPE": "BASE TABLE"}])
+
+        assert inspector._cache.get(inspector._cache_key("get_schema_summary")) is None
+
+
+class TestSchemaPrewarm:
+    """背景預熱測試"""
+
+    def test_restart_does_not_revive_stopped_thread(self, mssql_config, monkeypatch):
+        """✅ 停止後重新啟動，舊的刷新執行緒不會再被喚醒"""
+        import threading
+
+        inspector = MSSQLSchemaInspector(MagicMock(), mssql_config)
+        release = threading.Event()
+        calls = []
+
+        def slow_refresh():
+            calls.append(threading.current_thread())
+            release.wait(1)
+            return {"success": True}
+
+        monkeypatch.setattr(inspector, "refresh_database_schema", slow_refresh)
+
+        inspector.start_prewarm(0.01)
+        first = inspector._prewarm_thread
+        inspector.stop_prewarm()
+        inspector.start_prewarm(0.01)
+        second = inspector._prewarm_thread
+        release.set()
+        first.join(1)
+        inspector.stop_prewarm()
+        second.join(1)
+
+        assert not first.is_alive() and not second.is_alive()
+        assert calls.count(first) == 1
+
+
+class TestCreateSchemaInspector:
+    """探查器工廠測試"""
+
+    def test_dispatch_by_db_type(self, mssql_config, pg_config):
+        """✅ 依資料庫類型建立探查器"""
+        assert isinstance(
+            create_schema_inspector(MagicMock(), mssql_config), MSSQLSchemaInspector
+        )
+        assert isinstance(
+            create_schema_inspector(MagicMock(), pg_config), PostgreSQLSchemaInspector
+        )
+
+    def test_unsupported_db_type(self):
+        """❌ 不支援的資料庫類型"""
+        with pytest.raises(ValueError, match="Unsupported database type"):
+            create_schema_inspector(MagicMock(), SimpleNamespace(db_type="oracle"))
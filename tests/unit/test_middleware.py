@@ -0,0 +1,196 @@
+"""
+API 中介層單元測試
+
+使用 FastAPI TestClient 測試 GZip 壓縮門檻等中介層設定與回應類別。
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from api import responses
+from api.middleware import GZIP_MIN_SIZE, create_limiter, setup_middleware
+from api.responses import FastJSONResponse, error_response, success_response
+from core.config import AppConfig, HTTPConfig
+
+
+@pytest.fixture
+def client():
+    """套用中介層並提供大小兩種回應的測試應用"""
+    app = FastAPI()
+    setup_middleware(app, AppConfig.from_env())
+
+    @app.get("/small")
+    async def small():
+        return {"data": "x" * (GZIP_MIN_SIZE - 100)}
+
+    @app.get("/large")
+    async def large():
+        return {"data": "x" * (GZIP_MIN_SIZE * 4)}
+
+    return TestClient(app)
+
+
+class TestGZipMiddleware:
+    """GZip 壓縮測試"""
+
+    def test_small_response_not_compressed(self, client):
+        """✅ 單一封包大小的回應不壓縮"""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_large_response_compressed(self, client):
+        """✅ 超過門檻的回應以 gzip 壓縮"""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == GZIP_MIN_SIZE * 4
+
+
+class TestCreateLimiter:
+    """速率限制器建立測試"""
+
+    def test_memory_storage_by_default(self):
+        """✅ 預設使用行程內記憶體計數"""
+        limiter = create_limiter(HTTPConfig())
+
+        assert limiter._storage_uri == "memory://"
+        assert not limiter._in_memory_fallback_enabled
+
+    def test_shared_storage_with_memory_fallback(self):
+        """✅ 共用儲存（Redis）啟用記憶體備援"""
+        pytest.importorskip("redis")
+        config = HTTPConfig(
+            rate_limit_storage_uri="redis://localhost:6379/0",
+            rate_limit_strategy="moving-window",
+        )
+
+        limiter = create_limiter(config, default_limits=["10/minute"])
+
+        assert limiter._storage_uri == "redis://localhost:6379/0"
+        assert limiter._in_memory_fallback_enabled
+
+
+class TestFastJSONResponse:
+    """orjson 回應類別測試"""
+
+    def test_render_matches_stdlib(self):
+        """✅ 輸出與標準 JSONResponse 解析結果一致"""
+        content = {
+            "success": True,
+            "data": [{"名稱": "訂單", "count": 3}],
+            "error": None,
+        }
+
+        body = FastJSONResponse(content).body
+
+        assert json.loads(body) == content
+        assert json.loads(JSONResponse(content).body) == content
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """✅ 未安裝 orjson 時使用標準實作"""
+        monkeypatch.setattr(responses, "orjson", None)
+
+        assert FastJSONResponse({"a": 1}).body == JSONResponse({"a": 1}).body
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_unsupported_types_encoded(self, monkeypatch, use_orjson):
+        """✅ 直接回傳時 Decimal、datetime、set 依 FastAPI 規則編碼"""
+        if not use_orjson:
+            monkeypatch.setattr(responses, "orjson", None)
+        content = {
+            "price": Decimal("9.50"),
+            "at": datetime(2024, 1, 2, 3, 4, 5),
+            "tags": {"a"},
+        }
+
+        body = json.loads(FastJSONResponse(content).body)
+
+        assert body == {"price": 9.5, "at": "2024-01-02T03:04:05", "tags": ["a"]}
+
+
+class TestEnvelopeResponses:
+    """預先組合的回應封包測試"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_success_envelope(self, monkeypatch, use_orjson):
+        """✅ 成功封包與字典序列化結果一致"""
+        if not use_orjson:
+            monkeypatch.setattr(responses, "orjson", None)
+        data = {"名稱": "訂單", "price": Decimal("1.5"), "rows": [1, None]}
+
+        response = success_response(data, "2024-01-02T03:04:05")
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "success": True,
+            "data": {"名稱": "訂單", "price": 1.5, "rows": [1, None]},
+            "timestamp": "2024-01-02T03:04:05",
+        }
+
+    def test_error_message_escaped(self):
+        """✅ 錯誤訊息中的引號與換行正確跳脫"""
+        message = 'bad "name"\nnext line'
+
+        body = json.loads(error_response(message, "t").body)
+
+        assert body == {"success": False, "error": message, "timestamp": "t"}
+
+
+class TestCORSMiddleware:
+    """CORS 設定測試"""
+
+    @pytest.fixture
+    def cors_client(self, monkeypatch):
+        monkeypatch.setenv("CORS_ALLOWED_ORIGINS", "https://a.example, https://b.example,")
+        app = FastAPI()
+        setup_middleware(app, AppConfig.from_env())
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_allowed_origin(self, cors_client):
+        """✅ 允許清單內的來源取得 CORS 標頭"""
+        response = cors_client.get("/ping", headers={"Origin": "https://b.example"})
+
+        assert response.headers["access-control-allow-origin"] == "https://b.example"
+
+    def test_preflight_max_age(self, cors_client):
+        """✅ 預檢回應使用設定的快取時間"""
+        response = cors_client.options(
+            "/ping",
+            headers={
+                "Origin": "https://a.example",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        max_age = str(HTTPConfig().cors_preflight_max_age)
+        assert response.headers["access-control-max-age"] == max_age
+        assert "Origin" in response.headers["vary"]
+
+    def test_no_origins_skips_middleware(self, monkeypatch):
+        """✅ 生產環境未設定來源時不加入 CORS 中介層"""
+        monkeypatch.delenv("CORS_ALLOWED_ORIGINS", raising=False)
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        app = FastAPI()
+
+        setup_middleware(app, AppConfig.from_env())
+
+        assert [m.cls for m in app.user_middleware] == [GZipMiddleware]
+
+    def test_disallowed_origin(self, cors_client):
+        """❌ 不在清單內（含空白項目）的來源不回傳 CORS 標頭"""
+        for origin in ("https://c.example", ""):
+            response = cors_client.get("/ping", headers={"Origin": origin})
+            assert "access-control-allow-origin" not in response.headers
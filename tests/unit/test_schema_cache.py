@@ -47,6 +47,26 @@ class TestSchemaCache:
         result = cache.get("nonexistent")
         assert result is None
 
+    def test_mget_returns_first_hit(self):
+        """✅ mget 返回第一個命中的 key 與值"""
+        cache = SchemaCache()
+        cache.set("fallback", {"v": 2})
+
+        value, hit_key = cache.mget(("primary", "fallback"))
+        assert value == {"v": 2}
+        assert hit_key == "fallback"
+        assert cache.access_count["fallback"] == 1
+
+        cache.set("primary", {"v": 1})
+        value, hit_key = cache.mget(("primary", "fallback"))
+        assert value == {"v": 1}
+        assert hit_key == "primary"
+
+    def test_mget_all_miss(self):
+        """❌ mget 全部未命中返回 (None, None)"""
+        cache = SchemaCache()
+        assert cache.mget(("a", "b")) == (None, None)
+
     def test_access_tracking(self):
         """✅ 訪問統計追蹤"""
         cache = SchemaCache()
@@ -571,6 +591,26 @@ class TestCachedSchemaIntrospector:
         result = introspector.get_schema_info("TABLE3")
         assert result.get("cache_source") == "database_query"
 
+    def test_cache_source_stamp_does_not_mutate_cached_value(self):
+        """✅ 來源標記不修改共享的快取值，且重複讀取不再配置新物件"""
+        original_introspector = Mock()
+        cache = SchemaCache()
+
+        static_data = {"success": True}
+        cache.set("table_schema_TABLE1_static", static_data)
+        introspector = CachedSchemaIntrospector(original_introspector, cache)
+
+        first = introspector.get_schema_info("TABLE1")
+        second = introspector.get_schema_info("TABLE1")
+
+        assert first["cache_source"] == "static_cache"
+        assert "cache_source" not in static_data
+        assert first is second
+
+        # 重新寫入後應產生新的標記版本
+        cache.set("table_schema_TABLE1_static", {"success": True, "v": 2})
+        assert introspector.get_schema_info("TABLE1")["v"] == 2
+
 
 class TestCachePerformance:
     """快取性能測試"""
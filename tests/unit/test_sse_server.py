@@ -0,0 +1,208 @@
+"""
+SSE MCP 伺服器單元測試
+
+測試 SSE ASGI 應用的 CORS 處理與路徑分派。
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.config import HTTPConfig
+from protocol import sse_server as sse_module
+from protocol.sse_server import SseMCPServer
+
+
+@pytest.fixture
+def sse_server():
+    return SseMCPServer(MagicMock())
+
+
+class TestCORS:
+    """SSE CORS 測試"""
+
+    def test_allowed_origin(self, sse_server):
+        """✅ 允許清單內的來源取得 CORS 標頭"""
+        client = TestClient(sse_server.create_asgi_app(["https://a.example", "https://b.example"]))
+
+        response = client.get("/unknown", headers={"Origin": "https://b.example"})
+
+        assert response.status_code == 404
+        assert response.headers["access-control-allow-origin"] == "https://b.example"
+
+    def test_wildcard_echoes_origin(self, sse_server):
+        """✅ 萬用字元允許任何來源並回傳請求的來源"""
+        client = TestClient(sse_server.create_asgi_app(["*"]))
+
+        response = client.options("/messages", headers={"Origin": "https://any.example"})
+
+        assert response.headers["access-control-allow-origin"] == "https://any.example"
+        assert response.headers["access-control-allow-credentials"] == "true"
+
+    def test_disallowed_origin(self, sse_server):
+        """❌ 不在清單內（含空白項目）的來源不回傳 CORS 標頭"""
+        client = TestClient(sse_server.create_asgi_app(["https://a.example", ""]))
+
+        for origin in ("https://c.example", ""):
+            headers = {"Origin": origin}
+            for response in (
+                client.get("/x", headers=headers),
+                client.options("/", headers=headers),
+            ):
+                assert "access-control-allow-origin" not in response.headers
+
+
+class TestDispatch:
+    """路徑分派測試"""
+
+    @pytest.fixture
+    def calls(self, sse_server, monkeypatch):
+        calls = []
+
+        async def fake_handler(name, scope, receive, send):
+            calls.append((name, scope["path"]))
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        monkeypatch.setattr(
+            sse_server, "handle_sse_connection", lambda *a: fake_handler("sse", *a)
+        )
+        monkeypatch.setattr(
+            sse_server, "handle_messages", lambda *a: fake_handler("messages", *a)
+        )
+        return calls
+
+    def test_routes(self, sse_server, calls):
+        """✅ GET 結尾斜線開啟串流，POST messages 交給訊息處理"""
+        client = TestClient(sse_server.create_asgi_app([]))
+
+        assert client.get("/").status_code == 204
+        assert client.post("/messages?session_id=abc").status_code == 204
+
+        assert calls == [("sse", "/"), ("messages", "/messages")]
+
+    def test_unmatched(self, sse_server, calls):
+        """❌ 方法或路徑不符時回傳 404"""
+        client = TestClient(sse_server.create_asgi_app([]))
+
+        assert client.post("/").status_code == 404
+        assert client.get("/messages").status_code == 404
+        assert client.post("/messages/extra").status_code == 404
+        assert calls == []
+
+
+class TestGetOrigin:
+    """Origin 標頭讀取測試"""
+
+    def test_first_origin_header(self, sse_server):
+        """✅ 回傳第一個 origin 標頭（latin-1 解碼）"""
+        scope = {"headers": [
+            (b"host", b"x"),
+            (b"origin", b"https://caf\xe9.example"),
+            (b"origin", b"https://b"),
+        ]}
+
+        assert sse_server._get_origin_from_scope(scope) == "https://café.example"
+
+    def test_missing_origin(self, sse_server):
+        """❌ 沒有或空白的 origin 標頭回傳 None"""
+        get_origin = sse_server._get_origin_from_scope
+        assert get_origin({"headers": [(b"host", b"x")]}) is None
+        assert get_origin({"headers": [(b"origin", b"")]}) is None
+        assert get_origin({}) is None
+
+
+class TestPrecomputedResponses:
+    """預先建立的回應內容測試"""
+
+    def test_preflight_headers(self, sse_server, monkeypatch):
+        """✅ 預檢回應使用建立應用時的 max-age 設定"""
+        config = HTTPConfig(cors_preflight_max_age=1234)
+        monkeypatch.setattr(sse_module, "get_http_config", lambda: config)
+        client = TestClient(sse_server.create_asgi_app(["https://a.example"]))
+
+        response = client.options("/messages", headers={"Origin": "https://a.example"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "1234"
+        assert response.headers["access-control-allow-methods"] == "GET, POST, OPTIONS"
+        assert response.headers["vary"] == "Origin"
+
+    def test_preflight_max_age_default(self):
+        """✅ 預設預檢快取一天，減少重複 OPTIONS 往返"""
+        assert HTTPConfig().cors_preflight_max_age == 86400
+
+    def test_not_found_reused_without_leaking_headers(self, sse_server):
+        """✅ 共用的 404 訊息不會累積前一個請求的 CORS 標頭"""
+        client = TestClient(sse_server.create_asgi_app(["https://a.example"]))
+
+        first = client.get("/x", headers={"Origin": "https://a.example"})
+        second = client.get("/x")
+
+        assert first.headers["access-control-allow-origin"] == "https://a.example"
+        assert "access-control-allow-origin" not in second.headers
+        assert second.text == "Not Found"
+        assert second.headers["content-length"] == "9"
+
+
+class TestCorsSend:
+    """CORS send 包裝測試"""
+
+    async def test_plain_send_without_allowed_origin(self, sse_server, monkeypatch):
+        """✅ 無允許來源時直接使用原始 send，不包裝"""
+        received = []
+
+        async def handle_messages(scope, receive, send):
+            received.append(send)
+
+        async def send(message):
+            pass
+
+        monkeypatch.setattr(sse_server, "handle_messages", handle_messages)
+        app = sse_server.create_asgi_app(["https://a.example"])
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/messages",
+            "headers": [(b"origin", b"https://c.example")],
+        }
+
+        await app(scope, None, send)
+
+        assert received == [send]
+
+    async def test_headers_added_once_to_start(self, sse_server, monkeypatch):
+        """✅ 允許的來源只在回應開始時附加標頭，內容訊息原樣傳遞"""
+        sent = []
+        start = {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream")],
+        }
+        body = {"type": "http.response.body", "body": b"data: 1\n\n", "more_body": True}
+
+        async def handle_sse_connection(scope, receive, send):
+            await send(start)
+            await send(body)
+
+        async def send(message):
+            sent.append(message)
+
+        monkeypatch.setattr(sse_server, "handle_sse_connection", handle_sse_connection)
+        app = sse_server.create_asgi_app(["https://a.example"])
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(b"origin", b"https://a.example")],
+        }
+
+        await app(scope, None, send)
+
+        assert sent[0]["headers"] == [
+            (b"content-type", b"text/event-stream"),
+            (b"access-control-allow-origin", b"https://a.example"),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+        assert sent[1] == body
@@ -0,0 +1,397 @@
+"""
+靜態 Schema 配置管理器單元測試
+
+使用暫存目錄中的 JSON 配置測試載入、欄位模式增強與快取行為。
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from database.schema import static_loader
+from database.schema.static_loader import (
+    SchemaConfigManager,
+    _fuse_patterns,
+    _load_config_file,
+    warm_disk_cache,
+)
+
+GLOBAL_PATTERNS = {
+    "column_patterns": {
+        "_ID$": {"semantic_type": "identifier", "default_description": "Identifier"},
+        "_DATE$|_TIME$": {
+            "semantic_type": "datetime",
+            "default_description": "Date/Time",
+        },
+        "^STATUS$": {"semantic_type": "status", "default_description": "Status"},
+        "NAME": {"semantic_type": "name", "default_description": "Name"},
+        "[": {"semantic_type": "broken"},
+    }
+}
+
+TABLES_LIST = {
+    "tables": {
+        "ORDERS": {"table_type": "BASE TABLE", "display_name": "訂單"},
+        "users": {"table_type": "BASE TABLE", "display_name": "使用者"},
+    }
+}
+
+ORDERS_CONFIG = {
+    "table_name": "orders",
+    "display_name": "訂單主檔",
+    "category": "sales",
+    "columns": [
+        {"COLUMN_NAME": "ORDER_ID"},
+        {"COLUMN_NAME": "CREATED_DATE"},
+        {"COLUMN_NAME": "status"},
+        {"COLUMN_NAME": "CUSTOMER_NAME"},
+        {"COLUMN_NAME": "AMOUNT"},
+    ],
+    "key_columns": {
+        "AMOUNT": {"semantic_type": "money", "description": "訂單金額"},
+    },
+}
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """磁碟快取寫入暫存目錄"""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """建立指向暫存配置目錄的管理器"""
+    config_dir = tmp_path / "schemas_config"
+    (config_dir / "tables").mkdir(parents=True)
+    write_json(config_dir / "global_patterns.json", GLOBAL_PATTERNS)
+    write_json(config_dir / "tables_list.json", TABLES_LIST)
+    write_json(config_dir / "tables" / "orders.json", ORDERS_CONFIG)
+    return SchemaConfigManager(base_path=str(tmp_path))
+
+
+class TestSchemaConfigManager:
+    """Schema 配置管理器測試"""
+
+    def test_load_table_configs(self, manager):
+        """✅ 載入表格配置（表名轉大寫）"""
+        schema = manager.get_table_schema("orders")
+
+        assert schema["table_name"] == "ORDERS"
+        assert schema["display_name"] == "訂單主檔"
+        assert schema["total_count"] == 5
+        assert list(schema)[:9] == [
+            "table_name", "display_name", "type", "category", "business_importance",
+            "columns", "relationships", "business_logic", "ai_context",
+        ]
+        assert schema["type"] == "TABLE" and schema["relationships"] == {}
+
+    def test_global_patterns_first_match_wins(self, manager):
+        """✅ 全域模式依序匹配，第一個符合者生效"""
+        columns = {
+            c["COLUMN_NAME"]: c for c in manager.get_table_schema("ORDERS")["columns"]
+        }
+
+        assert columns["ORDER_ID"]["semantic_type"] == "identifier"
+        assert columns["CREATED_DATE"]["semantic_type"] == "datetime"
+        assert columns["status"]["semantic_type"] == "status"
+        assert columns["CUSTOMER_NAME"]["semantic_type"] == "name"
+
+    def test_key_columns_override_patterns(self, manager):
+        """✅ key_columns 配置優先於全域模式"""
+        columns = {
+            c["COLUMN_NAME"]: c for c in manager.get_table_schema("ORDERS")["columns"]
+        }
+
+        assert columns["AMOUNT"]["semantic_type"] == "money"
+        assert columns["AMOUNT"]["enhanced_description"] == "訂單金額"
+
+    def test_first_pattern_wins_over_leftmost_match(self, manager):
+        """✅ 合併正則依模式順序而非匹配位置決定結果"""
+        # NAME 出現在 _ID 左側，但 _ID$ 模式排在前面
+        assert manager._ensure_loaded()
+        assert manager._fused_global_pattern is not None
+        assert manager._match_global_pattern("NAME_ID")["semantic_type"] == "identifier"
+        assert manager._match_global_pattern("REMARK") is None
+
+    def test_invalid_pattern_skipped(self, manager):
+        """❌ 無效的正則模式被略過而非中斷載入"""
+        assert manager.get_table_schema("ORDERS") is not None
+        assert len(manager._compiled_global_patterns) == 4
+
+    def test_bad_column_skips_only_that_table(self, manager, tmp_path):
+        """❌ 欄位缺少 COLUMN_NAME 的表格被略過，其他表格照常可用"""
+        write_json(
+            tmp_path / "schemas_config" / "tables" / "bad.json",
+            {"table_name": "bad", "columns": [{"DATA_TYPE": "int"}]},
+        )
+
+        assert manager._ensure_loaded()
+        assert manager.get_table_schema("ORDERS") is not None
+        assert "BAD" not in manager._table_schemas_cache
+        names = [t["TABLE_NAME"] for t in manager.get_all_tables()]
+        assert names == ["orders", "users"]
+
+    def test_broken_table_config_skipped(self, manager, tmp_path):
+        """❌ 無法解析的表格配置被略過，其餘照常載入"""
+        (tmp_path / "schemas_config" / "tables" / "broken.json").write_text(
+            "{", encoding="utf-8"
+        )
+        write_json(
+            tmp_path / "schemas_config" / "tables" / "users.json",
+            {"table_name": "users", "display_name": "使用者主檔", "columns": []},
+        )
+
+        assert manager.get_table_schema("ORDERS")["display_name"] == "訂單主檔"
+        assert manager.get_table_schema("USERS")["display_name"] == "使用者主檔"
+        assert set(manager._configs_cache["table_configs"]) == {"ORDERS", "USERS"}
+
+    def test_disk_cache_skips_json_parsing(self, manager, tmp_path):
+        """✅ 配置未變更時，新實例直接使用磁碟快取"""
+        assert manager.get_table_schema("ORDERS") is not None
+        assert manager._disk_cache_path.exists()
+
+        fresh = SchemaConfigManager(base_path=str(tmp_path))
+        with patch(
+            "database.schema.static_loader._load_json", side_effect=AssertionError
+        ):
+            schema = fresh.get_table_schema("ORDERS")
+
+        assert schema["display_name"] == "訂單主檔"
+        assert schema["columns"][0]["semantic_type"] == "identifier"
+
+    def test_warm_disk_cache(self, manager, tmp_path):
+        """✅ 預熱只寫入磁碟快取，不建立全域實例"""
+        singleton = static_loader._schema_manager
+
+        assert warm_disk_cache(str(tmp_path)) is True
+        assert manager._disk_cache_path.exists()
+        assert static_loader._schema_manager is singleton
+
+    def test_disk_cache_is_private_json(self, manager, tmp_path, cache_home):
+        """✅ 磁碟快取為 JSON，存放於使用者快取目錄而非配置目錄"""
+        assert manager._ensure_loaded()
+        cache_path = manager._disk_cache_path
+
+        cached = json.loads(cache_path.read_bytes())
+
+        assert cache_path.parent == cache_home / "mcp-db"
+        assert oct(cache_path.parent.stat().st_mode & 0o777) == oct(0o700)
+        assert cached["version"] == static_loader._DISK_CACHE_VERSION
+        assert "ORDERS" in cached["configs"]["table_configs"]
+        config_files = (tmp_path / "schemas_config").iterdir()
+        assert not [p for p in config_files if p.name.startswith(".cache")]
+
+    def test_disk_cache_other_version_ignored(self, manager, tmp_path):
+        """❌ 格式版本不符的快取不被使用"""
+        assert manager._ensure_loaded()
+        cache_path = manager._disk_cache_path
+        cached = json.loads(cache_path.read_bytes())
+        cached["version"] = -1
+        cached["configs"]["table_configs"]["ORDERS"]["display_name"] = "過期"
+        cache_path.write_text(json.dumps(cached), encoding="utf-8")
+
+        fresh = SchemaConfigManager(base_path=str(tmp_path))
+
+        assert fresh.get_table_schema("ORDERS")["display_name"] == "訂單主檔"
+
+    def test_disk_cache_invalidated_by_file_change(self, manager, tmp_path):
+        """✅ 配置檔案變更後不使用過期的磁碟快取"""
+        assert manager.get_table_schema("ORDERS") is not None
+        write_json(
+            tmp_path / "schemas_config" / "tables" / "orders.json",
+            dict(ORDERS_CONFIG, display_name="已修改的訂單主檔"),
+        )
+
+        fresh = SchemaConfigManager(base_path=str(tmp_path))
+
+        assert fresh.get_table_schema("ORDERS")["display_name"] == "已修改的訂單主檔"
+
+    def test_eager_build_all_schemas(self, manager):
+        """✅ 預設於載入時建構所有表格 Schema"""
+        assert manager._ensure_loaded()
+        assert set(manager._table_schemas_cache) == {"ORDERS", "USERS"}
+
+    def test_lazy_build_on_demand(self, tmp_path, manager):
+        """✅ eager=False 時於首次查詢才建構"""
+        lazy = SchemaConfigManager(base_path=str(tmp_path), eager=False)
+        assert lazy._ensure_loaded()
+        assert lazy._table_schemas_cache == {}
+
+        assert lazy.get_table_schema("orders")["display_name"] == "訂單主檔"
+        assert set(lazy._table_schemas_cache) == {"ORDERS"}
+
+    def test_summary_counts_without_building(self, tmp_path, manager):
+        """✅ 摘要只計算欄位數，不建構欄位字典"""
+        lazy = SchemaConfigManager(base_path=str(tmp_path), eager=False)
+
+        summary = lazy.get_summary()
+
+        assert summary["total_tables"] == 2
+        assert summary["total_columns"] == 5
+        assert lazy._table_schemas_cache == {}
+        assert manager.get_summary()["total_columns"] == 5
+
+    def test_get_all_tables_dedupes_case_variants(self, manager, tmp_path):
+        """✅ 僅大小寫不同的表名只列出一次"""
+        tables_list = {
+            "tables": dict(TABLES_LIST["tables"], orders={"display_name": "重複"})
+        }
+        write_json(tmp_path / "schemas_config" / "tables_list.json", tables_list)
+
+        names = [t["TABLE_NAME"] for t in manager.get_all_tables()]
+
+        assert names == ["orders", "users"]
+
+    def test_all_tables_and_summary_cached(self, manager):
+        """✅ 表格清單與摘要快取至 clear_cache 為止"""
+        tables = manager.get_all_tables()
+        cached = manager._all_tables_cache
+        assert manager.get_all_tables() == tables
+        assert manager._all_tables_cache is cached
+        assert manager.get_summary()["table_names"] == ["orders", "users"]
+
+        manager.clear_cache()
+
+        assert manager._summary_cache is None
+        manager.get_all_tables()
+        assert manager._all_tables_cache is not cached
+
+    def test_all_tables_returns_copy(self, manager):
+        """✅ 修改回傳的表格清單不影響快取"""
+        tables = manager.get_all_tables()
+        tables[0]["TABLE_NAME"] = "changed"
+        tables.clear()
+
+        names = [t["TABLE_NAME"] for t in manager.get_all_tables()]
+        assert names == ["orders", "users"]
+
+    def test_slots_reject_unknown_attributes(self, manager):
+        """❌ 使用 __slots__，不接受未宣告的屬性"""
+        assert not hasattr(manager, "__dict__")
+        with pytest.raises(AttributeError):
+            manager.unexpected = True
+
+    def test_tables_manifest_preferred(self, manager, tmp_path):
+        """✅ 建立 tables.jsonl 後改由清單載入表格配置"""
+        manifest_path = manager.build_tables_manifest()
+        assert manifest_path == tmp_path / "schemas_config" / "tables.jsonl"
+
+        # 清單建立後，個別檔案不再被讀取
+        (tmp_path / "schemas_config" / "tables" / "orders.json").unlink()
+        with manifest_path.open("a", encoding="utf-8") as f:
+            f.write("not json\n")
+        assert manager.reload_configs() is True
+
+        assert manager.get_table_schema("ORDERS")["display_name"] == "訂單主檔"
+        assert set(manager._configs_cache["table_configs"]) == {"ORDERS"}
+
+    def test_unknown_table(self, manager):
+        """❌ 不存在的表格返回 None"""
+        assert manager.get_table_schema("MISSING") is None
+
+    def test_get_all_tables(self, manager):
+        """✅ 取得所有表格（小寫名稱並合併詳細配置）"""
+        tables = {t["TABLE_NAME"]: t for t in manager.get_all_tables()}
+
+        assert set(tables) == {"orders", "users"}
+        assert tables["orders"]["CATEGORY"] == "sales"
+        assert "CATEGORY" not in tables["users"]
+
+    def test_reload_configs(self, manager, tmp_path):
+        """✅ 重新載入配置後反映檔案變更"""
+        assert manager.get_table_schema("ORDERS")["display_name"] == "訂單主檔"
+
+        write_json(
+            tmp_path / "schemas_config" / "tables" / "orders.json",
+            dict(ORDERS_CONFIG, display_name="新訂單"),
+        )
+        assert manager.reload_configs() is True
+
+        assert manager.get_table_schema("ORDERS")["display_name"] == "新訂單"
+
+
+class TestLoadConfigFile:
+    """頂層配置檔載入測試"""
+
+    def test_large_file_streamed(self, tmp_path, monkeypatch):
+        """✅ 超過門檻的配置檔以 ijson 串流解析，結果與一般解析相同"""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(static_loader, "_STREAM_PARSE_THRESHOLD", 0)
+        path = tmp_path / "tables_list.json"
+        data = {
+            "schema_version": "3.0",
+            "tables": {"ORDERS": {"display_name": "訂單", "weight": 1.5}},
+        }
+        write_json(path, data)
+
+        with patch(
+            "database.schema.static_loader._load_json", side_effect=AssertionError
+        ):
+            assert _load_config_file(path) == data
+
+    def test_small_file_parsed_directly(self, tmp_path):
+        """✅ 小型配置檔直接解析"""
+        path = tmp_path / "global_patterns.json"
+        write_json(path, GLOBAL_PATTERNS)
+
+        assert _load_config_file(path) == GLOBAL_PATTERNS
+
+
+class TestGetSchemaManager:
+    """全域管理器實例測試"""
+
+    def test_concurrent_first_access_creates_one_instance(self, monkeypatch):
+        """✅ 並行首次存取只建立一個實例"""
+        monkeypatch.setattr(static_loader, "_schema_manager", None)
+        barrier = threading.Barrier(8)
+        managers = []
+
+        def worker():
+            barrier.wait()
+            managers.append(static_loader.get_schema_manager())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(m) for m in managers}) == 1
+
+
+class TestPatternMatcher:
+    """欄位模式比對測試"""
+
+    def test_fuse_patterns_rejects_backreferences(self):
+        """❌ 含反向參照的模式無法合併，退回逐一比對"""
+        assert _fuse_patterns([r"(A)\1"]) is None
+        assert _fuse_patterns(["_ID$", r"(A)\1"]) is None
+        assert _fuse_patterns(["_ID$", r"(?P<x>A)(?P=x)"]) is None
+        assert _fuse_patterns(["_ID$", r"(A)?(?(1)B|C)"]) is None
+        assert _fuse_patterns(["_ID$", r"(CREATE|UPDATE)_BY"]) is not None
+        assert _fuse_patterns([]) is None
+
+    def test_unfusable_patterns_matched_in_order(self, manager, tmp_path):
+        """✅ 無法合併時依模式順序逐一比對（語意與合併正則相同）"""
+        patterns = {"column_patterns": {
+            "_ID$": {"semantic_type": "identifier"},
+            r"(B)\1": {"semantic_type": "double_b"},
+            r"(A)\1": {"semantic_type": "double_a"},
+        }}
+        write_json(tmp_path / "schemas_config" / "global_patterns.json", patterns)
+
+        assert manager._ensure_loaded()
+        assert manager._fused_global_pattern is None
+        assert manager._match_global_pattern("aa_id")["semantic_type"] == "identifier"
+        assert manager._match_global_pattern("aa_code")["semantic_type"] == "double_a"
+        order_id = manager._match_global_pattern("order_id")
+        assert order_id["semantic_type"] == "identifier"
+        assert manager._match_global_pattern("remark") is None
@@ -402,3 +402,44 @@ class TestSecurityEdgeCases:
         query = "SELECT/**//**/FROM/**/users"
         is_valid, error = SQLValidator.validate_query(query)
         assert is_valid is False  # 應該被 /* */ 註釋攔截
+
+
+class TestSQLValidatorKeywordPattern:
+    """危險關鍵字合併比對測試"""
+
+    def test_reports_matched_keyword(self):
+        """❌ 錯誤訊息指出實際出現的關鍵字"""
+        is_valid, error = SQLValidator.validate_query("SELECT 1; EXECUTE sp_who")
+
+        assert is_valid is False
+        assert "'EXECUTE'" in error
+
+    def test_keyword_prefix_not_matched(self):
+        """✅ 以關鍵字開頭的識別字不觸發（如 created_at、updated_by）"""
+        query = "SELECT created_at, updated_by, executed FROM audit_log"
+
+        assert SQLValidator.validate_query(query) == (True, "")
+
+
+class TestSQLValidatorCache:
+    """SQL 驗證結果快取測試"""
+
+    def test_repeated_query_hits_cache(self):
+        """✅ 相同查詢文字重複驗證時使用快取"""
+        query = "SELECT id FROM cache_probe WHERE id = ?"
+        SQLValidator.validate_query(query)
+        hits = SQLValidator._check_statement.cache_info().hits
+
+        assert SQLValidator.validate_query(query) == (True, "")
+        assert SQLValidator._check_statement.cache_info().hits == hits + 1
+
+    def test_length_limit_follows_config(self, monkeypatch):
+        """❌ 已快取的查詢仍依目前設定檢查長度"""
+        query = "SELECT name FROM length_probe"
+        assert SQLValidator.validate_query(query) == (True, "")
+
+        monkeypatch.setenv("MAX_QUERY_LENGTH", "10")
+        is_valid, error = SQLValidator.validate_query(query)
+
+        assert is_valid is False
+        assert "too long" in error